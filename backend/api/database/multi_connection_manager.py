@@ -6,6 +6,7 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 import logging
 
@@ -14,6 +15,9 @@ from ...config.connection_selector import get_connection_selector
 
 logger = logging.getLogger(__name__)
 
+# 연결 테스트 동시 실행 상한 (사이트 수가 많아도 스레드 폭주 방지)
+MAX_TEST_WORKERS = 32
+
 
 class MultiConnectionManager:
     """선택적 다중 데이터베이스 연결 관리자"""
@@ -80,11 +84,8 @@ class MultiConnectionManager:
             pool_pre_ping=True
         )
         
-        # 캐시에 저장
-        if site_id not in self._engines:
-            self._engines[site_id] = {}
-        
-        self._engines[site_id][db_name] = engine
+        # 캐시에 저장 (setdefault: 병렬 테스트 중 같은 사이트 dict를 덮어쓰지 않도록)
+        self._engines.setdefault(site_id, {})[db_name] = engine
         
         logger.info(f"엔진 생성: {site_id}/{db_name}")
         
@@ -195,15 +196,27 @@ class MultiConnectionManager:
             return False
     
     def test_all_active_connections(self) -> Dict[str, Dict[str, bool]]:
-        """모든 활성 연결 테스트"""
-        results = {}
-        enabled = self.selector.get_all_enabled_connections()
+        """
+        모든 활성 연결 테스트
         
-        for site_id, db_list in enabled.items():
-            results[site_id] = {}
-            
-            for db_name in db_list:
-                results[site_id][db_name] = self.test_connection(site_id, db_name)
+        각 연결의 SELECT 1은 네트워크 대기가 대부분이므로 스레드 풀에서 동시에 실행
+        (전체 소요 시간 = 가장 느린 연결 1개 수준)
+        """
+        enabled = self.selector.get_all_enabled_connections()
+        targets = [
+            (site_id, db_name)
+            for site_id, db_list in enabled.items()
+            for db_name in db_list
+        ]
+        
+        results: Dict[str, Dict[str, bool]] = {site_id: {} for site_id in enabled}
+        if not targets:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_TEST_WORKERS, len(targets))) as executor:
+            statuses = executor.map(lambda target: self.test_connection(*target), targets)
+            for (site_id, db_name), status in zip(targets, statuses):
+                results[site_id][db_name] = status
         
         return results
     
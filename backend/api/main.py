@@ -2,8 +2,14 @@
 FastAPI 메인 애플리케이션
 Multi-Site Equipment Mapping V2 API + UDS 통합
 
-@version 1.4.0
+@version 1.4.3
 @changelog
+- v1.4.3: UVLOOP_ENABLED 설정 추가 (2026-10-17)
+          - false면 uvicorn을 asyncio 기본 루프로 실행
+- v1.4.2: uvloop 이벤트 루프 (2026-10-17)
+          - uvloop 의존성 명시 (Windows 제외), 시작 시 사용 중인 루프 로그
+- v1.4.1: WebSocket permessage-deflate 비활성화 (2026-10-17)
+          - 동일 브로드캐스트 페이로드를 클라이언트별로 재압축하던 CPU 비용 제거
 - v1.4.0: Phase 1 Multi-Site Monitoring 통합 (2026-02-02)
           - Sites Router 등록 (/api/sites/*)
           - Health WebSocket 등록 (/ws/sites/health)
@@ -26,13 +32,15 @@ Multi-Site Equipment Mapping V2 API + UDS 통합
 
 📁 위치: backend/api/main.py
 작성일: 2026-01-20
-수정일: 2026-01-22
+수정일: 2026-10-17
 """
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import os
+import sys
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -48,6 +56,9 @@ setup_logging(
 )
 logger = logging.getLogger(__name__)
 
+# uvloop 사용 여부 (기본 true, UDS_ENABLED와 같은 방식으로 파싱)
+UVLOOP_ENABLED = os.getenv('UVLOOP_ENABLED', 'true').lower() == 'true'
+
 # ============================================
 # Router Import (기존 100% 유지)
 # ============================================
@@ -133,6 +144,13 @@ if UDS_ENABLED:
 async def lifespan(app: FastAPI):
     # === STARTUP (기존과 동일) ===
     logger.info("🚀 애플리케이션 시작")
+    
+    # WebSocket 브로드캐스트 성능을 위해 uvloop 사용 여부 확인 (Windows 미지원)
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if loop_module.startswith("uvloop"):
+        logger.info("⚡ Event loop: uvloop")
+    elif sys.platform != "win32" and UVLOOP_ENABLED:
+        logger.warning(f"⚠️ Event loop: {loop_module} (uvloop 미사용 - pip install uvloop 권장)")
     print("="*60)
     print("🚀 SHERLOCK_SKY_3DSIM API 시작")
     print("="*60)
@@ -454,5 +472,11 @@ if __name__ == "__main__":
         "backend.api.main:app",
         host="0.0.0.0",
         port=int(os.getenv('APP_PORT', 8000)),
-        reload=True
+        reload=True,
+        # uvloop 설치 시 uvloop 사용 (uvicorn 기본값 "auto"와 동일, Windows는 asyncio)
+        # UVLOOP_ENABLED=false면 asyncio 기본 루프 강제
+        loop="auto" if UVLOOP_ENABLED else "asyncio",
+        # 브로드캐스트 프레임은 이미 1회만 직렬화되므로, 클라이언트마다
+        # 동일 페이로드를 다시 압축하는 permessage-deflate는 비활성화
+        ws_per_message_deflate=False
     )
\ No newline at end of file
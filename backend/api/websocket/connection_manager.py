@@ -6,38 +6,69 @@ WebSocket 연결 관리
 """
 
 from fastapi import WebSocket
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional
 import json
 import asyncio
+import logging
 from ..database.connection import get_redis
+from .serializer import dumps_text
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트 1개당 전송 타임아웃 (느린 클라이언트가 전체 브로드캐스트를 막지 않도록)
+SEND_TIMEOUT = 5.0
+
+# 동시에 진행 중인 전송 수 상한 (대량 fan-out 시 이벤트 루프 과부하 방지)
+MAX_CONCURRENT_SENDS = 100
+
+# Redis 채널 (메시지 본문의 equipment_id로 라우팅)
+UPDATES_CHANNEL = 'equipment_updates'
+
+# 한 번에 모아서 처리할 최대 Redis 메시지 수
+REDIS_BATCH_SIZE = 100
+
+# subscribe/unsubscribe ACK를 모아서 보내는 대기 시간 (초)
+ACK_COALESCE_DELAY = 0.02
 
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[WebSocket, Set[str]] = {}
-        self.redis_listener_task = None
+        # 역색인: equipment_id → 구독 중인 WebSocket
+        self.by_equipment: Dict[str, Set[WebSocket]] = {}
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # 클라이언트별 대기 중인 ACK와 예약된 flush
+        self._ack_buffer: Dict[WebSocket, List[str]] = {}
+        self._ack_handles: Dict[WebSocket, asyncio.TimerHandle] = {}
+        self._ack_tasks: Set[asyncio.Task] = set()
+        self._redis_listener_task: Optional[asyncio.Task] = None
         
     async def connect(self, websocket: WebSocket):
         """클라이언트 연결"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         self.subscriptions[websocket] = set()
-        print(f"✓ WebSocket 연결: {len(self.active_connections)}개 활성")
+        logger.info("✓ WebSocket 연결: %d개 활성", len(self.active_connections))
         
     def disconnect(self, websocket: WebSocket):
         """클라이언트 연결 해제"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         if websocket in self.subscriptions:
-            del self.subscriptions[websocket]
-        print(f"✓ WebSocket 연결 해제: {len(self.active_connections)}개 활성")
+            self._unindex(websocket, self.subscriptions.pop(websocket))
+        self._ack_buffer.pop(websocket, None)
+        handle = self._ack_handles.pop(websocket, None)
+        if handle:
+            handle.cancel()
+        logger.info("✓ WebSocket 연결 해제: %d개 활성", len(self.active_connections))
         
     async def subscribe(self, websocket: WebSocket, equipment_ids: List[str]):
         """특정 장비 구독"""
         if websocket in self.subscriptions:
             self.subscriptions[websocket].update(equipment_ids)
-            await websocket.send_json({
+            for equipment_id in equipment_ids:
+                self.by_equipment.setdefault(equipment_id, set()).add(websocket)
+            self._queue_ack(websocket, {
                 "type": "subscribed",
                 "equipment_ids": equipment_ids,
                 "message": f"{len(equipment_ids)}개 장비 구독 완료"
@@ -47,83 +78,169 @@ class ConnectionManager:
         """특정 장비 구독 해제"""
         if websocket in self.subscriptions:
             self.subscriptions[websocket].difference_update(equipment_ids)
-            await websocket.send_json({
+            self._unindex(websocket, equipment_ids)
+            self._queue_ack(websocket, {
                 "type": "unsubscribed",
                 "equipment_ids": equipment_ids
             })
     
+    def _queue_ack(self, websocket: WebSocket, ack: dict):
+        """ACK를 버퍼에 넣고 ACK_COALESCE_DELAY 후 한 프레임으로 전송"""
+        self._ack_buffer.setdefault(websocket, []).append(dumps_text(ack))
+        if websocket not in self._ack_handles:
+            self._ack_handles[websocket] = asyncio.get_running_loop().call_later(
+                ACK_COALESCE_DELAY, self._flush_acks, websocket
+            )
+    
+    def _flush_acks(self, websocket: WebSocket):
+        """대기 중인 ACK 전송 (1개면 그대로, 여러 개면 batch 메시지)"""
+        self._ack_handles.pop(websocket, None)
+        acks = self._ack_buffer.pop(websocket, None)
+        if not acks:
+            return
+        
+        if len(acks) == 1:
+            payload = acks[0]
+        else:
+            payload = f'{{"type":"batch","items":[{",".join(acks)}]}}'
+        
+        task = asyncio.create_task(self._fan_out_payload([websocket], payload))
+        self._ack_tasks.add(task)
+        task.add_done_callback(self._ack_tasks.discard)
+    
+    def _unindex(self, websocket: WebSocket, equipment_ids):
+        """역색인에서 구독 제거 (빈 항목은 삭제)"""
+        for equipment_id in equipment_ids:
+            subscribers = self.by_equipment.get(equipment_id)
+            if subscribers is None:
+                continue
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self.by_equipment[equipment_id]
+    
+    async def _safe_send(self, websocket: WebSocket, payload: str):
+        """단일 클라이언트 전송 (실패 시 예외 대신 (ws, False) 반환)"""
+        try:
+            async with self._send_semaphore:
+                await asyncio.wait_for(websocket.send_text(payload), timeout=SEND_TIMEOUT)
+            return websocket, True
+        except Exception as e:
+            logger.debug("✗ 전송 실패: %s", e)
+            return websocket, False
+    
+    async def _fan_out(self, connections: List[WebSocket], message: dict):
+        """여러 클라이언트에 동시 전송 후 실패한 연결 제거"""
+        if not connections:
+            return
+        
+        # 직렬화는 브로드캐스트당 1회만 수행
+        await self._fan_out_payload(connections, dumps_text(message))
+    
+    async def _fan_out_payload(self, connections: List[WebSocket], payload: str):
+        """직렬화된 페이로드를 여러 클라이언트에 동시 전송 후 실패한 연결 제거"""
+        if not connections:
+            return
+        
+        results = await asyncio.gather(
+            *[self._safe_send(connection, payload) for connection in connections]
+        )
+        
+        # 연결 끊긴 클라이언트 제거 (실패 로그는 전송당 1회로 집계)
+        failed = [connection for connection, ok in results if not ok]
+        if failed:
+            logger.warning("✗ 전송 실패: %d/%d개 연결 제거", len(failed), len(results))
+            for connection in failed:
+                self.disconnect(connection)
+    
     async def broadcast(self, message: dict):
         """모든 연결된 클라이언트에게 메시지 전송"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"✗ 브로드캐스트 실패: {e}")
-                disconnected.append(connection)
-        
-        # 연결 끊긴 클라이언트 제거
-        for connection in disconnected:
-            self.disconnect(connection)
+        if self.active_connections:
+            await self._fan_out(list(self.active_connections), message)
     
     async def send_to_subscribed(self, equipment_id: str, message: dict):
         """특정 장비를 구독한 클라이언트에게만 전송"""
-        disconnected = []
-        for connection in self.active_connections:
-            if equipment_id in self.subscriptions.get(connection, set()):
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    print(f"✗ 전송 실패: {e}")
-                    disconnected.append(connection)
-        
-        # 연결 끊긴 클라이언트 제거
-        for connection in disconnected:
-            self.disconnect(connection)
+        # 구독자 집합은 await 전에 스냅샷 (전송 중 구독 변경에 안전)
+        subscribers = self.by_equipment.get(equipment_id)
+        if subscribers:
+            await self._fan_out(list(subscribers), message)
+    
+    async def send_raw_to_subscribed(self, equipment_id: str, payload: str):
+        """특정 장비 구독 클라이언트에게 수신한 JSON 문자열을 그대로 전달 (파싱/재직렬화 없음)"""
+        subscribers = self.by_equipment.get(equipment_id)
+        if subscribers:
+            await self._fan_out_payload(list(subscribers), payload)
     
     async def start_redis_listener(self):
         """Redis Pub/Sub 리스너 시작"""
-        self.redis_listener_task = asyncio.create_task(self._redis_listener())
-        print("✓ Redis 리스너 시작")
+        if self._redis_listener_task is None or self._redis_listener_task.done():
+            self._redis_listener_task = asyncio.create_task(self._redis_listener())
+        logger.info("✓ Redis 리스너 시작")
     
     async def stop_redis_listener(self):
         """Redis 리스너 중지"""
-        if self.redis_listener_task:
-            self.redis_listener_task.cancel()
+        if self._redis_listener_task:
+            self._redis_listener_task.cancel()
             try:
-                await self.redis_listener_task
+                await self._redis_listener_task
             except asyncio.CancelledError:
                 pass
-        print("✓ Redis 리스너 중지")
+            self._redis_listener_task = None
+        logger.info("✓ Redis 리스너 중지")
+    
+    async def _dispatch_batch(self, batch: List[dict]):
+        """수신 배치를 equipment_id별로 묶어 그룹당 1회 전송"""
+        groups: Dict[Optional[str], List[str]] = {}
+        for message in batch:
+            try:
+                data = message['data']
+                if isinstance(data, bytes):
+                    data = data.decode()
+                # 본문은 equipment_id만 읽고 수신한 문자열 그대로 전달 (재직렬화 없음)
+                groups.setdefault(json.loads(data).get('equipment_id'), []).append(data)
+            except json.JSONDecodeError:
+                logger.warning("✗ JSON 파싱 실패")
+            except Exception as e:
+                logger.error("✗ 메시지 처리 실패: %s", e)
+        
+        for equipment_id, payloads in groups.items():
+            if len(payloads) == 1:
+                payload = payloads[0]
+            else:
+                payload = f'{{"type":"batch","items":[{",".join(payloads)}]}}'
+            
+            if equipment_id:
+                # 해당 장비를 구독한 클라이언트에게 전송
+                await self.send_raw_to_subscribed(equipment_id, payload)
+            elif self.active_connections:
+                # 장비 ID가 없으면 모든 클라이언트에게 전송
+                await self._fan_out_payload(list(self.active_connections), payload)
     
     async def _redis_listener(self):
         """Redis로부터 실시간 데이터 수신"""
         try:
             redis_client = get_redis()
             pubsub = redis_client.pubsub()
-            await pubsub.subscribe('equipment_updates')
+            await pubsub.subscribe(UPDATES_CHANNEL)
             
-            print("✓ Redis 채널 'equipment_updates' 구독 시작")
+            logger.info("✓ Redis 채널 '%s' 구독 시작", UPDATES_CHANNEL)
             
-            async for message in pubsub.listen():
-                if message['type'] == 'message':
-                    try:
-                        data = json.loads(message['data'])
-                        equipment_id = data.get('equipment_id')
-                        
-                        # 해당 장비를 구독한 클라이언트에게 전송
-                        if equipment_id:
-                            await self.send_to_subscribed(equipment_id, data)
-                        else:
-                            # 장비 ID가 없으면 모든 클라이언트에게 전송
-                            await self.broadcast(data)
-                            
-                    except json.JSONDecodeError:
-                        print("✗ JSON 파싱 실패")
-                    except Exception as e:
-                        print(f"✗ 메시지 처리 실패: {e}")
+            while True:
+                # 첫 메시지는 대기, 이후 이미 도착한 메시지는 최대 REDIS_BATCH_SIZE개까지 모아 처리
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                if message is None:
+                    continue
+                
+                batch = [message]
+                while len(batch) < REDIS_BATCH_SIZE:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+                    if message is None:
+                        break
+                    batch.append(message)
+                
+                await self._dispatch_batch(batch)
                         
         except asyncio.CancelledError:
-            print("✓ Redis 리스너 취소됨")
+            logger.info("✓ Redis 리스너 취소됨")
+            raise
         except Exception as e:
-            print(f"✗ Redis 리스너 오류: {e}")s
\ No newline at end of file
+            logger.error("✗ Redis 리스너 오류: %s", e)
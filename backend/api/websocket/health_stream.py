@@ -6,8 +6,43 @@ Site Health WebSocket Stream - Phase 1 Multi-Site Connection 기반 확장
 실시간으로 모든 Site의 상태를 스트리밍합니다.
 Dashboard와 Monitoring Mode에서 Site 상태 변경을 감지하는 데 사용됩니다.
 
-@version 1.0.0
+@version 1.4.2
 @changelog
+- v1.4.2: 연결 시 전체 상태 보장 (2026-10-17)
+          - Health 조회 후 등록과 initial 적재를 await 없이 처리 (조회 중 브로드캐스트 누락 방지)
+          - initial 전송 실패 시 다음 주기는 heartbeat 대신 update 전송
+- v1.4.1: ping 처리 fast path (2026-10-17)
+          - 고정 형식 ping은 JSON 파싱 없이 처리, pong 페이로드 1초 단위 캐시
+- v1.4.0: site_changes 메시지 추가 (2026-10-17)
+          - 같은 주기에 여러 Site가 변경되면 site_changes 1회로 브로드캐스트
+          - ⚠️ 호환성: 변경 1건이면 기존 site_change 그대로 전송
+- v1.3.3: 브로드캐스트 태스크 추적 (2026-10-17)
+          - _broadcast_task 기록, 모든 연결 해제 시 즉시 취소
+          - ensure_periodic_broadcast(): 재연결 반복 시 중복/고아 태스크 방지
+- v1.3.2: 동시 전송 수 제한 (2026-10-17)
+          - writer 태스크 전송을 Semaphore(MAX_CONCURRENT_SENDS)로 제한
+- v1.3.1: _detect_changes() 최적화 (2026-10-17)
+          - 상태가 바뀐 Site만 상태 캐시 갱신
+          - Site별 변경 로그를 브로드캐스트당 요약 1줄로 통합
+- v1.3.0: 변경 없는 주기 브로드캐스트 생략 (2026-10-17)
+          - Site 상태 fingerprint가 동일하면 update 대신 heartbeat 전송
+          - 전체 상태(update)는 변경 시 또는 FULL_UPDATE_INTERVAL(5분)마다 전송
+- v1.2.1: 타임스탬프 생성 최소화 (2026-10-17)
+          - broadcast_health_update()는 호출당 타임스탬프 1회 생성 후 공유
+          - 개별 응답(pong, error 등)은 1초 단위 캐시(_now_iso) 사용
+- v1.2.0: Health 조회 결과 TTL 캐시 (2026-10-17)
+          - 초기 전송/주기 브로드캐스트가 HEALTH_CACHE_TTL(5초) 내 결과 재사용
+          - asyncio.Lock으로 캐시 만료 시 동시 조회 방지
+- v1.1.0: 클라이언트별 송신 큐 도입 (2026-10-17)
+          - broadcast()는 큐에 적재만 하고 writer 태스크가 전송
+          - 대기 메시지가 여러 개면 batch 메시지 한 프레임으로 묶어 전송
+          - 큐 초과(느린 클라이언트) 시 해당 연결만 해제
+          - ⚠️ 호환성: 대기 메시지가 1개면 기존과 동일한 프레임 전송
+- v1.0.2: 브로드캐스트 직렬화 1회화 (2026-10-17)
+          - 메시지를 한 번만 JSON 직렬화 후 send_text로 전송 (serializer.dumps_text)
+- v1.0.1: 브로드캐스트 병렬 전송 (2026-10-17)
+          - broadcast()를 asyncio.gather 기반 동시 전송으로 변경
+          - 클라이언트별 전송 타임아웃 (SEND_TIMEOUT) 적용
 - v1.0.0: 초기 버전 (2026-02-02)
           - 실시간 Health 상태 스트리밍 (30초 간격)
           - 다중 클라이언트 지원
@@ -18,21 +53,83 @@ Dashboard와 Monitoring Mode에서 Site 상태 변경을 감지하는 데 사용
 @dependencies
 - fastapi
 - backend.api.services.site_health_service
+- ./serializer.py (dumps_text)
 
 📁 위치: backend/api/websocket/health_stream.py
 작성일: 2026-02-02
-수정일: 2026-02-02
+수정일: 2026-10-17
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, timezone
 import asyncio
+import contextlib
 import json
 import logging
+import time
+
+from .serializer import dumps_text
 
 logger = logging.getLogger(__name__)
 
+# 클라이언트별 전송 타임아웃 (초) - 느린 클라이언트가 브로드캐스트 전체를 지연시키지 않도록
+SEND_TIMEOUT = 5.0
+
+# 전체 클라이언트에 대해 동시에 진행 중인 전송 수 상한
+MAX_CONCURRENT_SENDS = 100
+
+# 클라이언트별 송신 큐 크기 (초과 시 해당 클라이언트 연결 해제)
+OUTBOUND_QUEUE_SIZE = 100
+
+# 한 프레임으로 묶어 보낼 최대 메시지 수
+MAX_BATCH_SIZE = 50
+
+# Health 조회 결과 캐시 유지 시간 (초) - 재연결 폭주 시 health check 반복 호출 방지
+HEALTH_CACHE_TTL = 5.0
+
+# 변경이 없어도 전체 상태(update)를 다시 보내는 최대 간격 (초)
+FULL_UPDATE_INTERVAL = 300
+
+# 변경 여부 판단에 사용하는 Site 필드 (응답시간/체크 시각 등 매번 바뀌는 값 제외)
+FINGERPRINT_FIELDS = (
+    "site_id", "status", "db_connected", "error_message",
+    "has_layout", "has_mapping", "equipment_count"
+)
+
+
+# 초 단위로 캐시되는 ISO 타임스탬프 (pong 등 개별 응답용)
+_ts_cache_second: int = -1
+_ts_cache_value: str = ""
+
+
+def _now_iso() -> str:
+    """현재 UTC ISO 타임스탬프 (1초 단위로 재사용)"""
+    global _ts_cache_second, _ts_cache_value
+    second = int(time.time())
+    if second != _ts_cache_second:
+        _ts_cache_second = second
+        _ts_cache_value = datetime.now(timezone.utc).isoformat()
+    return _ts_cache_value
+
+
+# JSON 파싱 없이 바로 처리하는 ping 프레임
+_PING_FRAMES = frozenset(('{"type":"ping"}', '{"type": "ping"}'))
+
+# 직렬화된 pong 메시지 (타임스탬프가 바뀔 때만 재생성)
+_pong_cache_ts: str = ""
+_pong_cache_payload: str = ""
+
+
+def _pong_payload() -> str:
+    """직렬화된 pong 메시지 (1초 단위로 재사용)"""
+    global _pong_cache_ts, _pong_cache_payload
+    timestamp = _now_iso()
+    if timestamp != _pong_cache_ts:
+        _pong_cache_ts = timestamp
+        _pong_cache_payload = dumps_text({"type": HealthMessageType.PONG, "timestamp": timestamp})
+    return _pong_cache_payload
+
 
 # ============================================
 # Message Types
@@ -41,11 +138,14 @@ logger = logging.getLogger(__name__)
 class HealthMessageType:
     """WebSocket 메시지 타입"""
     INITIAL = "initial"           # 초기 연결 시 전체 상태
-    UPDATE = "update"             # 정기 업데이트
+    UPDATE = "update"             # 전체 상태 업데이트
     SITE_CHANGE = "site_change"   # 특정 Site 상태 변경
+    SITE_CHANGES = "site_changes" # 여러 Site 동시 상태 변경 (data: 배열)
     ERROR = "error"               # 에러 메시지
     PING = "ping"                 # Keep-alive ping
     PONG = "pong"                 # Keep-alive pong
+    BATCH = "batch"               # 대기 중이던 여러 메시지 묶음
+    HEARTBEAT = "heartbeat"       # 변경 없음 (전체 상태 생략)
 
 
 # ============================================
@@ -61,11 +161,19 @@ class HealthStreamManager:
     
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}       # 클라이언트별 송신 큐
+        self._writers: Dict[WebSocket, asyncio.Task] = {}       # 클라이언트별 송신 태스크
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         self.broadcast_interval: int = 30  # 기본 30초
         self._health_service = None
         self._previous_states: Dict[str, str] = {}  # site_id → status
         self._broadcast_task: Optional[asyncio.Task] = None
         self._running: bool = False
+        self._cached_health: Optional[Dict[str, Any]] = None
+        self._cached_health_at: float = 0.0
+        self._health_lock = asyncio.Lock()
+        self._last_fingerprint: Optional[tuple] = None
+        self._last_full_broadcast_at: float = 0.0
         
         logger.info("✅ HealthStreamManager 초기화")
     
@@ -83,40 +191,95 @@ class HealthStreamManager:
         """현재 연결된 클라이언트 수"""
         return len(self.active_connections)
     
+    async def _get_health(self) -> Dict[str, Any]:
+        """
+        전체 Site Health 조회 (HEALTH_CACHE_TTL 동안 캐시)
+        
+        동시 요청은 Lock으로 직렬화하여 캐시 만료 시 한 번만 조회합니다.
+        """
+        async with self._health_lock:
+            now = asyncio.get_running_loop().time()
+            if self._cached_health is None or now - self._cached_health_at >= HEALTH_CACHE_TTL:
+                self._cached_health = await self.health_service.check_all_sites_health()
+                self._cached_health_at = now
+            return self._cached_health
+    
     async def connect(self, websocket: WebSocket):
-        """새 클라이언트 연결"""
+        """
+        새 클라이언트 연결
+        
+        Health 조회를 먼저 끝낸 뒤 등록과 initial 적재는 await 없이 처리합니다.
+        조회 중 끝난 브로드캐스트의 변경은 최신 캐시로 받고, 이후 변경은 송신 큐로 받으므로
+        변경 없는 주기(heartbeat) 동안에도 전체 상태가 최신입니다.
+        """
         await websocket.accept()
+        
+        try:
+            await self._get_health()
+            error = None
+        except Exception as e:
+            error = e
+        
         self.active_connections.add(websocket)
         
+        # 송신 큐 + writer 태스크 생성 (브로드캐스터는 큐에 넣기만 함)
+        queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        
         logger.info(f"🔗 Health Stream 연결: {self.connection_count} clients")
         
-        # 초기 상태 전송
-        try:
-            initial_health = await self.health_service.check_all_sites_health()
-            await self._send_message(websocket, {
+        # 초기 상태 전송 (조회 이후 갱신된 캐시 사용)
+        if error is None:
+            self._enqueue(websocket, dumps_text({
                 "type": HealthMessageType.INITIAL,
-                "data": initial_health,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+                "data": self._cached_health,
+                "timestamp": _now_iso()
+            }))
             logger.info(f"📡 초기 상태 전송 완료")
-        except Exception as e:
-            logger.error(f"❌ 초기 상태 전송 실패: {e}")
-            await self._send_error(websocket, str(e))
+        else:
+            logger.error(f"❌ 초기 상태 전송 실패: {error}")
+            self._enqueue(websocket, dumps_text({
+                "type": HealthMessageType.ERROR,
+                "error": str(error),
+                "timestamp": _now_iso()
+            }))
+            # 전체 상태를 받지 못한 클라이언트가 있으므로 다음 주기는 heartbeat 대신 update 전송
+            self._last_fingerprint = None
     
     def disconnect(self, websocket: WebSocket):
         """클라이언트 연결 해제"""
+        if websocket not in self.active_connections:
+            return
+        
         self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+        
         logger.info(f"🔌 Health Stream 해제: {self.connection_count} clients")
         
-        # 모든 연결이 끊기면 브로드캐스트 중지
+        # 모든 연결이 끊기면 브로드캐스트 중지 (sleep 중인 태스크도 즉시 취소)
         if self.connection_count == 0 and self._broadcast_task:
             self._running = False
+            if self._broadcast_task is not asyncio.current_task():
+                self._broadcast_task.cancel()
+                self._broadcast_task = None
             logger.info("⏹️ 모든 연결 해제 - 브로드캐스트 중지")
     
     async def _send_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """개별 클라이언트에 메시지 전송"""
+        await self._send_text(websocket, dumps_text(message))
+    
+    async def _send_text(self, websocket: WebSocket, payload: str):
+        """직렬화된 메시지 전송 (송신 큐 경유로 브로드캐스트와 순서 유지)"""
+        if websocket in self._queues:
+            self._enqueue(websocket, payload)
+            return
+        
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(payload)
         except Exception as e:
             logger.error(f"❌ 메시지 전송 실패: {e}")
             self.disconnect(websocket)
@@ -126,7 +289,7 @@ class HealthStreamManager:
         await self._send_message(websocket, {
             "type": HealthMessageType.ERROR,
             "error": error,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
     
     async def broadcast(self, message: Dict[str, Any]):
@@ -134,61 +297,136 @@ class HealthStreamManager:
         if not self.active_connections:
             return
         
-        disconnected = set()
+        # 직렬화는 1회만 수행하고 각 클라이언트 송신 큐에 적재 (실제 전송은 writer 태스크)
+        payload = dumps_text(message)
+        for connection in list(self.active_connections):
+            self._enqueue(connection, payload)
+    
+    def _enqueue(self, websocket: WebSocket, payload: str):
+        """송신 큐에 적재 - 큐가 가득 찬 느린 클라이언트는 연결 해제"""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"⚠️ 브로드캐스트 실패, 연결 제거: {e}")
-                disconnected.add(connection)
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning(f"⚠️ 송신 큐 초과 ({OUTBOUND_QUEUE_SIZE}), 연결 제거")
+            self.disconnect(websocket)
+    
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        클라이언트별 송신 태스크
         
-        # 실패한 연결 제거
-        self.active_connections -= disconnected
+        큐에 쌓인 메시지를 최대 MAX_BATCH_SIZE개까지 모아 한 프레임으로 전송합니다.
+        대기 메시지가 1개면 원본 그대로, 여러 개면 batch 메시지로 묶습니다.
+        """
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty() and len(batch) < MAX_BATCH_SIZE:
+                    batch.append(queue.get_nowait())
+                
+                if len(batch) == 1:
+                    payload = batch[0]
+                else:
+                    # 이미 직렬화된 메시지를 재직렬화 없이 이어 붙임
+                    payload = f'{{"type":"{HealthMessageType.BATCH}","items":[{",".join(batch)}]}}'
+                
+                if not await self._safe_send(websocket, payload):
+                    self.disconnect(websocket)
+                    return
+        except asyncio.CancelledError:
+            pass
+    
+    async def _safe_send(self, websocket: WebSocket, payload: str) -> bool:
+        """개별 전송 - 실패 시 예외 대신 False 반환"""
+        try:
+            async with self._send_semaphore:
+                await asyncio.wait_for(websocket.send_text(payload), timeout=SEND_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ 전송 실패, 연결 제거: {e}")
+            return False
     
     async def broadcast_health_update(self):
         """현재 Health 상태 브로드캐스트"""
+        # 한 번의 브로드캐스트에 포함된 메시지는 같은 타임스탬프 공유
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
         try:
-            health_data = await self.health_service.check_all_sites_health()
+            health_data = await self._get_health()
             
             # 상태 변경 감지
             changes = self._detect_changes(health_data["sites"])
             
-            if changes:
-                # 변경된 Site가 있으면 site_change 타입으로 전송
-                for change in changes:
-                    await self.broadcast({
-                        "type": HealthMessageType.SITE_CHANGE,
-                        "data": change,
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
-                    logger.info(f"📢 Site 상태 변경 알림: {change['site_id']}")
+            if len(changes) == 1:
+                # 변경된 Site가 1개면 site_change 타입으로 전송 (기존 호환)
+                await self.broadcast({
+                    "type": HealthMessageType.SITE_CHANGE,
+                    "data": changes[0],
+                    "timestamp": timestamp
+                })
+            elif changes:
+                # 여러 Site가 동시에 변경되면 site_changes 1회로 묶어 전송
+                await self.broadcast({
+                    "type": HealthMessageType.SITE_CHANGES,
+                    "data": changes,
+                    "timestamp": timestamp
+                })
+            
+            # 변경이 없고 전체 상태 재전송 주기 전이면 heartbeat만 전송
+            now = asyncio.get_running_loop().time()
+            fingerprint = self._fingerprint(health_data)
+            if (
+                fingerprint == self._last_fingerprint
+                and now - self._last_full_broadcast_at < FULL_UPDATE_INTERVAL
+            ):
+                await self.broadcast({
+                    "type": HealthMessageType.HEARTBEAT,
+                    "timestamp": timestamp
+                })
+                return
             
             # 전체 상태 업데이트 전송
             await self.broadcast({
                 "type": HealthMessageType.UPDATE,
                 "data": health_data,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": timestamp
             })
+            self._last_fingerprint = fingerprint
+            self._last_full_broadcast_at = now
             
         except Exception as e:
             logger.error(f"❌ Health 브로드캐스트 실패: {e}")
             await self.broadcast({
                 "type": HealthMessageType.ERROR,
                 "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": timestamp
             })
     
+    @staticmethod
+    def _fingerprint(health_data: Dict[str, Any]) -> tuple:
+        """Health 데이터 중 의미 있는 필드만으로 변경 비교용 키 생성"""
+        return tuple(
+            tuple(site.get(name) for name in FINGERPRINT_FIELDS)
+            for site in health_data.get("sites", [])
+        )
+    
     def _detect_changes(self, sites: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """상태 변경 감지"""
+        """상태 변경 감지 (상태 캐시는 변경된 Site만 갱신)"""
+        previous_states = self._previous_states
         changes = []
         
         for site in sites:
             site_id = site.get("site_id")
             current_status = site.get("status")
-            previous_status = self._previous_states.get(site_id)
+            previous_status = previous_states.get(site_id)
+            
+            if previous_status == current_status:
+                continue
             
-            if previous_status is not None and previous_status != current_status:
+            if previous_status is not None:
                 changes.append({
                     "site_id": site_id,
                     "previous_status": previous_status,
@@ -196,13 +434,28 @@ class HealthStreamManager:
                     "display_name": site.get("display_name"),
                     "error_message": site.get("error_message")
                 })
-                logger.info(f"📢 Site 상태 변경: {site_id} ({previous_status} → {current_status})")
             
             # 상태 캐시 업데이트
-            self._previous_states[site_id] = current_status
+            previous_states[site_id] = current_status
+        
+        if changes:
+            logger.info(
+                "📢 Site 상태 변경 %d건: %s",
+                len(changes),
+                ", ".join(
+                    f"{c['site_id']} ({c['previous_status']} → {c['current_status']})"
+                    for c in changes
+                )
+            )
         
         return changes
     
+    def ensure_periodic_broadcast(self):
+        """브로드캐스트 태스크가 없거나 종료되었으면 새로 시작 (중복 실행 방지)"""
+        if self._broadcast_task and not self._broadcast_task.done():
+            return
+        self._broadcast_task = asyncio.create_task(self.start_periodic_broadcast())
+    
     async def start_periodic_broadcast(self, interval: int = None):
         """주기적 브로드캐스트 시작"""
         if interval:
@@ -212,15 +465,27 @@ class HealthStreamManager:
             logger.warning("⚠️ 이미 브로드캐스트 실행 중")
             return
         
+        # 중지 요청 후 아직 sleep 중인 이전 태스크가 있으면 정리
+        current = asyncio.current_task()
+        previous = self._broadcast_task
+        if previous and previous is not current and not previous.done():
+            previous.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await previous
+        
+        self._broadcast_task = current
         self._running = True
         logger.info(f"🔄 Health 브로드캐스트 시작 ({self.broadcast_interval}초 간격)")
         
-        while self._running and self.connection_count > 0:
-            await self.broadcast_health_update()
-            await asyncio.sleep(self.broadcast_interval)
-        
-        self._running = False
-        logger.info("⏹️ Health 브로드캐스트 중지")
+        try:
+            while self._running and self.connection_count > 0:
+                await self.broadcast_health_update()
+                await asyncio.sleep(self.broadcast_interval)
+        finally:
+            if self._broadcast_task is current:
+                self._broadcast_task = None
+                self._running = False
+            logger.info("⏹️ Health 브로드캐스트 중지")
     
     def stop_periodic_broadcast(self):
         """주기적 브로드캐스트 중지"""
@@ -229,16 +494,18 @@ class HealthStreamManager:
     
     async def handle_client_message(self, websocket: WebSocket, message: str):
         """클라이언트 메시지 처리"""
+        # 가장 빈번한 ping은 JSON 파싱 없이 처리
+        if message in _PING_FRAMES:
+            await self._send_text(websocket, _pong_payload())
+            return
+        
         try:
             data = json.loads(message)
             msg_type = data.get("type")
             
             if msg_type == HealthMessageType.PING:
-                # Ping-Pong keep-alive
-                await self._send_message(websocket, {
-                    "type": HealthMessageType.PONG,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
+                # Ping-Pong keep-alive (추가 필드가 포함된 ping)
+                await self._send_text(websocket, _pong_payload())
                 
             elif msg_type == "request_update":
                 # 즉시 업데이트 요청
@@ -246,7 +513,7 @@ class HealthStreamManager:
                 await self._send_message(websocket, {
                     "type": HealthMessageType.UPDATE,
                     "data": health_data,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 })
                 logger.info("📡 클라이언트 요청에 의한 즉시 업데이트 전송")
                 
@@ -259,7 +526,7 @@ class HealthStreamManager:
                     await self._send_message(websocket, {
                         "type": "interval_changed",
                         "interval": new_interval,
-                        "timestamp": datetime.now(timezone.utc).isoformat()
+                        "timestamp": _now_iso()
                     })
                 else:
                     await self._send_error(websocket, "Invalid interval. Must be between 5 and 300 seconds.")
@@ -289,10 +556,13 @@ async def health_websocket_endpoint(websocket: WebSocket):
     
     Message Types (Server → Client):
     - initial: 초기 연결 시 전체 상태
-    - update: 정기 업데이트 (30초 간격)
+    - update: 전체 상태 (변경 시 또는 5분 간격)
     - site_change: Site 상태 변경 알림
+    - site_changes: 여러 Site 상태 변경 알림 (같은 주기에 2개 이상 변경 시)
     - error: 에러 메시지
     - pong: Keep-alive pong
+    - heartbeat: 변경 없음 (전체 상태는 최대 5분 간격으로 재전송)
+    - batch: 전송 대기 중이던 여러 메시지 묶음 ({"type": "batch", "items": [...]})
     
     Message Types (Client → Server):
     - ping: Keep-alive ping
@@ -301,9 +571,8 @@ async def health_websocket_endpoint(websocket: WebSocket):
     """
     await health_manager.connect(websocket)
     
-    # 첫 연결이면 브로드캐스트 시작
-    if health_manager.connection_count == 1:
-        asyncio.create_task(health_manager.start_periodic_broadcast())
+    # 브로드캐스트 태스크가 없으면 시작
+    health_manager.ensure_periodic_broadcast()
     
     try:
         while True:
@@ -329,6 +598,10 @@ def register_health_websocket(app):
     Usage:
         from api.websocket.health_stream import register_health_websocket
         register_health_websocket(app)
+
+    Note:
+        permessage-deflate는 서버 단위 설정이므로 uvicorn 실행 시
+        ws_per_message_deflate=False로 비활성화합니다 (api/main.py 참고).
     """
     @app.websocket("/ws/sites/health")
     async def ws_health(websocket: WebSocket):
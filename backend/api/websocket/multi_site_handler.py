@@ -2,8 +2,78 @@
 multi_site_handler.py
 Multi-Site WebSocket 연결 핸들러
 
-@version 1.1.0
+@version 1.3.9
 @changelog
+- v1.3.9: SiteRoom.to_dict() 결과 캐시 (2026-10-17)
+          - Room 구성 버전(version)이 같으면 get_stats()/get_room_stats()가 같은 dict 재사용
+          - 호출처가 없던 get_stats_light() 제거
+- v1.3.8: 클라이언트별 송신 태스크 1개 + 제한 큐 (2026-10-17)
+          - flush마다 Task를 만들던 방식은 전송 중 도착한 메시지가 별도 flush를 시작해
+            같은 소켓에 동시 전송/순서 뒤바뀜/느린 클라이언트 메모리 증가 발생
+          - connect() 시 _writer 태스크 생성, 메시지는 OUTBOUND_QUEUE_SIZE 제한 큐에 적재
+          - 전송은 SEND_TIMEOUT 적용, 큐 초과/전송 실패 클라이언트는 연결 해제 후 종료
+          - batch 병합(FLUSH_DELAY)과 프레임 형식은 기존과 동일
+- v1.3.7: Room 구성 버전 추가 (2026-10-17)
+          - SiteRoom.version: 클라이언트 추가/제거 시 갱신 (프로세스 내 고유)
+          - get_room_version(): 동일 내용 재전송 생략 시 신규 구독자 여부 판단용
+- v1.3.6: 클라이언트별 설비 필터 (2026-10-17)
+          - set_equipment_filter 메시지로 Delta를 받을 equipment_id 집합 지정 (null이면 전체)
+          - broadcast_items_to_room(): 필터별로 항목을 잘라 한 번만 직렬화, 해당 항목이 없으면 전송 생략
+          - ⚠️ 호환성: 필터 미지정 클라이언트는 기존과 동일한 전체 프레임
+- v1.3.5: 압축 캐시를 최근 DEFLATE_CACHE_SIZE개 프레임으로 확장 (2026-10-17)
+          - Site별 flush가 교차해도 같은 브로드캐스트 프레임은 한 번만 압축
+- v1.3.4: 대규모 Room 브로드캐스트 시 이벤트 루프 양보 (2026-10-17)
+          - _enqueue_many()가 ENQUEUE_YIELD_EVERY명마다 asyncio.sleep(0)
+- v1.3.3: broadcast_to_room_raw() 추가 (2026-10-17)
+          - 직렬화된 프레임을 그대로 Room에 브로드캐스트 (summary_stream에서 사용)
+- v1.3.2: _enqueue_many() 성공 수를 루프 내 카운터로 집계 (2026-10-17)
+- v1.3.1: handle_message() 파싱 전 빠른 거부 (2026-10-17)
+          - MAX_CLIENT_MESSAGE_SIZE 초과 또는 '{'로 시작하지 않는 메시지는 파싱 생략
+- v1.3.0: 압축 프레임 opt-in (2026-10-17)
+          - ?compress=1 클라이언트에는 COMPRESS_MIN_SIZE 이상 프레임을 zlib 바이너리로 전송
+          - 같은 브로드캐스트 프레임은 한 번만 압축 (_deflate 캐시)
+          - ⚠️ 호환성: compress 미지정 클라이언트는 기존과 동일한 텍스트 프레임
+            Frontend WebSocketPoolManager v1.3.0에서 압축 해제
+- v1.2.11: close_all() 동시 종료 (2026-10-17)
+          - _safe_close()로 클라이언트별 종료를 asyncio.gather 병렬 처리
+          - 종료 시 대기 중인 flush 작업 취소
+- v1.2.10: broadcast_to_all() Site 순차 await 제거 (2026-10-17)
+          - Lock 1회로 전체 Room 스냅샷, 대기열 적재는 await 없이 처리
+          - data 직렬화 1회 + Site별 site_id 필드만 이어 붙임
+- v1.2.9: subscription_change 처리 로그 정리 (2026-10-17)
+          - 요청 상세 로그는 DEBUG 활성 시에만 포맷팅, 적용 로그에 상세 포함
+- v1.2.8: SiteRoom 브로드캐스트 대상 목록 캐시 (2026-10-17)
+          - SiteRoom.add()/discard()/snapshot() 추가
+          - 클라이언트 변경 시에만 목록 재생성 (브로드캐스트마다 복사 제거)
+- v1.2.7: handle_message() 분기를 dict 디스패치 테이블로 변경 (2026-10-17)
+- v1.2.6: 수신 루프 타임아웃을 asyncio.timeout()으로 변경 (2026-10-17)
+          - 메시지마다 wait_for 내부 Task 생성 제거 (Python 3.11+)
+          - 응답은 flush 대기열에서 한 프레임으로 병합되므로 별도 drain 불필요
+- v1.2.5: broadcast_to_room() gather 제거 (2026-10-17)
+          - 대기열 적재만 하므로 클라이언트별 Task/Future 없이 동기 루프로 처리
+- v1.2.4: 타임스탬프 캐시 (2026-10-17)
+          - 응답 메시지 timestamp는 10ms 단위 캐시(_now_iso) 사용
+          - last_message_at은 time.monotonic()으로 기록, to_dict()에서 변환
+- v1.2.3: 수신 메시지 파싱에 serializer.loads_text() 사용 (2026-10-17)
+          - orjson 설치 시 송수신 모두 orjson 처리
+- v1.2.2: 브로드캐스트 직렬화 1회화 (2026-10-17)
+          - broadcast_to_room()에서 한 번 직렬화한 문자열을 모든 클라이언트에 공유
+          - send_to_client_raw() 추가, 대기열은 직렬화된 문자열 보관
+          - batch 프레임은 문자열 연결로 구성 (재직렬화 없음)
+- v1.2.1: 브로드캐스트 Lock 범위 정리 (2026-10-17)
+          - 대상 스냅샷만 Lock 안에서, 네트워크 전송은 Lock 밖에서 수행
+          - 전송 실패 클라이언트는 전송 후 Lock을 다시 잡고 정리
+          - disconnect() 중복 호출 시 무시
+- v1.2.0: 클라이언트별 프레임 병합 전송 (2026-10-17)
+          - send_to_client()는 대기열에 적재, FLUSH_DELAY(20ms) 후 일괄 전송
+          - 대기 메시지가 여러 개면 {"type": "batch", "items": [...]} 한 프레임
+          - ⚠️ 호환성: 대기 메시지 1개면 기존과 동일한 프레임,
+            Frontend WebSocketPoolManager v1.2.0에서 batch 분리 처리
+- v1.1.2: WebSocketClient/SiteRoom __slots__ 적용 (2026-10-17)
+          - WebSocketClient는 eq=False로 identity 해시 사용 (기존 dataclass는
+            __hash__=None이라 Room Set에 추가 시 TypeError 발생)
+- v1.1.1: client_id 생성 방식 수정 (2026-10-17)
+          - id(object())는 즉시 해제된 객체 주소라 재사용되어 ID 충돌 → 일련번호 사용
 - v1.1.0: subscription_change 핸들러 추가 (2026-02-05)
           - _handle_subscription_change() 메서드 추가
           - ClientSubscriptionManager 연동 (connect/disconnect 시 등록/해제)
@@ -17,24 +87,30 @@ Multi-Site WebSocket 연결 핸들러
 
 @dependencies
 - fastapi (WebSocket, WebSocketDisconnect)
+- ./serializer.py (dumps_text, loads_text)
 - ../database/multi_connection_manager.py (MultiConnectionManager)
 - ../services/uds/uds_service.py (UDSService)
 - ../services/uds/subscription_field_filter.py (ClientSubscriptionManager)  # 🆕 v1.1.0
 
 작성일: 2026-02-04
-수정일: 2026-02-05
+수정일: 2026-10-17
 """
 
 import asyncio
+import itertools
 import json
 import logging
-from typing import Dict, List, Set, Optional, Any
+import time
+import zlib
+from typing import Callable, Dict, FrozenSet, List, Set, Optional, Any, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from .serializer import dumps_text, loads_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,6 +149,57 @@ class ConnectionState(Enum):
     PAUSED = "paused"
 
 
+# 메시지를 모아서 한 프레임으로 보내기 전 대기 시간 (초)
+FLUSH_DELAY = 0.02
+
+# 클라이언트별 송신 큐 크기 (초과 시 느린 클라이언트로 보고 연결 해제)
+OUTBOUND_QUEUE_SIZE = 100
+
+# 클라이언트별 전송 타임아웃 (초)
+SEND_TIMEOUT = 5.0
+
+# 압축 전송 (compress=1 클라이언트만): 이 길이(문자) 이상 프레임만 zlib 압축
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 1
+# 압축 결과를 보관할 최근 프레임 수 (Site별 브로드캐스트가 교차해도 재압축하지 않도록)
+DEFLATE_CACHE_SIZE = 32
+
+# 브로드캐스트 적재 중 이벤트 루프 양보 간격 (클라이언트 수)
+ENQUEUE_YIELD_EVERY = 256
+
+# 클라이언트 메시지 최대 길이 (문자) - 초과 시 파싱하지 않고 무시
+MAX_CLIENT_MESSAGE_SIZE = 64 * 1024
+
+# 수신 대기 타임아웃 (초) - 초과 시 ping 전송
+RECEIVE_TIMEOUT = 300
+
+# 타임스탬프 캐시 해상도 (초)
+TIMESTAMP_RESOLUTION = 0.01
+
+
+# ============================================
+# 타임스탬프 캐시
+# ============================================
+
+_ts_cache_bucket: int = -1
+_ts_cache_value: str = ""
+
+
+def _now_iso() -> str:
+    """현재 UTC ISO 타임스탬프 (TIMESTAMP_RESOLUTION 단위로 재사용)"""
+    global _ts_cache_bucket, _ts_cache_value
+    bucket = int(time.monotonic() / TIMESTAMP_RESOLUTION)
+    if bucket != _ts_cache_bucket:
+        _ts_cache_bucket = bucket
+        _ts_cache_value = datetime.now(timezone.utc).isoformat()
+    return _ts_cache_value
+
+
+def _monotonic_to_iso(mono: float) -> str:
+    """time.monotonic() 값을 UTC ISO 타임스탬프로 변환"""
+    wall = time.time() - (time.monotonic() - mono)
+    return datetime.fromtimestamp(wall, timezone.utc).isoformat()
+
 # 기본 간격 설정 (ms)
 DEFAULT_INTERVALS = {
     SubscriptionType.SUMMARY: 30000,  # 30초
@@ -80,21 +207,38 @@ DEFAULT_INTERVALS = {
 }
 
 
+# 클라이언트 ID 일련번호 (프로세스 내 고유)
+_client_seq = itertools.count(1)
+
+# Room 구성 버전 일련번호 (Room이 제거 후 재생성되어도 이전 버전과 겹치지 않음)
+_room_version_seq = itertools.count(1)
+
+
 # ============================================
 # Data Classes
 # ============================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class WebSocketClient:
-    """WebSocket 클라이언트 정보"""
+    """
+    WebSocket 클라이언트 정보
+    
+    eq=False: Room의 Set에 저장되므로 객체 identity 기반 해시 사용
+    """
     websocket: WebSocket
     site_id: str
     subscription_type: SubscriptionType
     interval_ms: int
     connected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_message_at: Optional[datetime] = None
+    last_message_at: Optional[float] = None                     # time.monotonic() 값
     message_count: int = 0
-    client_id: str = field(default_factory=lambda: f"client_{id(object())}")
+    client_id: str = field(default_factory=lambda: f"client_{next(_client_seq)}")
+    outbound: asyncio.Queue = field(                             # 전송 대기 메시지 (직렬화 완료)
+        default_factory=lambda: asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+    )
+    writer_task: Optional[asyncio.Task] = None                   # 송신 태스크 (_writer)
+    compress: bool = False                                       # zlib 바이너리 프레임 수신 가능
+    equipment_filter: Optional[FrozenSet[int]] = None            # Delta 수신 equipment_id (None이면 전체)
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리 변환"""
@@ -104,33 +248,88 @@ class WebSocketClient:
             "subscription_type": self.subscription_type.value,
             "interval_ms": self.interval_ms,
             "connected_at": self.connected_at.isoformat(),
-            "last_message_at": self.last_message_at.isoformat() if self.last_message_at else None,
+            "last_message_at": (
+                _monotonic_to_iso(self.last_message_at)
+                if self.last_message_at is not None else None
+            ),
             "message_count": self.message_count
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteRoom:
     """Site별 Room (연결 그룹)"""
     site_id: str
     summary_clients: Set[WebSocketClient] = field(default_factory=set)
     full_clients: Set[WebSocketClient] = field(default_factory=set)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # 클라이언트 구성 버전 (add/discard 시 갱신)
+    version: int = field(default_factory=lambda: next(_room_version_seq))
+    # 구독 타입별 브로드캐스트 대상 목록 캐시 (add/discard 시 무효화)
+    _snapshots: Dict[Optional[SubscriptionType], List[WebSocketClient]] = field(
+        default_factory=dict, repr=False
+    )
+    # to_dict() 결과 캐시: (version, dict) - version이 바뀌면 다시 생성
+    _dict_cache: Optional[Tuple[int, Dict[str, Any]]] = field(default=None, repr=False)
     
     @property
     def total_clients(self) -> int:
         """전체 클라이언트 수"""
         return len(self.summary_clients) + len(self.full_clients)
     
+    def add(self, client: WebSocketClient):
+        """구독 타입에 맞는 그룹에 클라이언트 추가"""
+        if client.subscription_type == SubscriptionType.SUMMARY:
+            self.summary_clients.add(client)
+        else:
+            self.full_clients.add(client)
+        self._snapshots.clear()
+        self.version = next(_room_version_seq)
+    
+    def discard(self, client: WebSocketClient):
+        """클라이언트 제거 (없으면 무시)"""
+        if client.subscription_type == SubscriptionType.SUMMARY:
+            self.summary_clients.discard(client)
+        else:
+            self.full_clients.discard(client)
+        self._snapshots.clear()
+        self.version = next(_room_version_seq)
+    
+    def snapshot(
+        self,
+        subscription_type: Optional[SubscriptionType] = None
+    ) -> List[WebSocketClient]:
+        """
+        브로드캐스트 대상 목록 (캐시된 리스트, 읽기 전용으로 사용)
+        
+        Args:
+            subscription_type: 특정 타입만 (None이면 전체)
+        """
+        clients = self._snapshots.get(subscription_type)
+        if clients is None:
+            clients = []
+            if subscription_type is None or subscription_type == SubscriptionType.SUMMARY:
+                clients.extend(self.summary_clients)
+            if subscription_type is None or subscription_type == SubscriptionType.FULL:
+                clients.extend(self.full_clients)
+            self._snapshots[subscription_type] = clients
+        return clients
+    
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리 변환"""
-        return {
+        """딕셔너리 변환 (클라이언트 구성이 같으면 캐시된 dict, 읽기 전용으로 사용)"""
+        cached = self._dict_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        
+        data = {
             "site_id": self.site_id,
             "summary_clients": len(self.summary_clients),
             "full_clients": len(self.full_clients),
             "total_clients": self.total_clients,
             "created_at": self.created_at.isoformat()
         }
+        self._dict_cache = (self.version, data)
+        return data
 
 
 # ============================================
@@ -166,6 +365,25 @@ class MultiSiteWebSocketHandler:
         # Lock
         self._lock = asyncio.Lock()
         
+        # 송신 큐 초과로 예약된 연결 해제 작업 (참조 유지용)
+        self._drop_tasks: Set[asyncio.Task] = set()
+        
+        # 최근 압축 결과: id(frame) -> (frame, 압축 bytes)
+        # (같은 브로드캐스트 프레임은 클라이언트마다 재압축하지 않음, frame 참조 보관으로 id 재사용 방지)
+        self._deflate_cache: Dict[int, Tuple[str, bytes]] = {}
+        
+        # 메시지 타입별 핸들러
+        self._dispatch = {
+            "ping": self._handle_ping,
+            "pause": self._handle_pause,
+            "resume": self._handle_resume,
+            "change_interval": self._handle_change_interval,
+            "set_equipment_filter": self._handle_set_equipment_filter,
+            # 🆕 v1.1.0: Frontend SubscriptionLevelManager가 전송하는
+            # UI Context 기반 구독 레벨 변경 요청
+            "subscription_change": self._handle_subscription_change,
+        }
+        
         # =============================================
         # 🆕 v1.1.0: ClientSubscriptionManager 연결
         # =============================================
@@ -209,7 +427,8 @@ class MultiSiteWebSocketHandler:
         websocket: WebSocket,
         site_id: str,
         subscription_type: SubscriptionType,
-        interval_ms: Optional[int] = None
+        interval_ms: Optional[int] = None,
+        compress: bool = False
     ) -> WebSocketClient:
         """
         WebSocket 연결
@@ -219,6 +438,7 @@ class MultiSiteWebSocketHandler:
             site_id: Site ID
             subscription_type: 구독 타입 (SUMMARY/FULL)
             interval_ms: 메시지 간격 (기본값 사용)
+            compress: 큰 프레임을 zlib 압축 바이너리로 전송 (클라이언트 opt-in)
         
         Returns:
             WebSocketClient: 클라이언트 정보
@@ -235,19 +455,20 @@ class MultiSiteWebSocketHandler:
                 websocket=websocket,
                 site_id=site_id,
                 subscription_type=subscription_type,
-                interval_ms=interval_ms
+                interval_ms=interval_ms,
+                compress=compress
             )
             
             # Room에 추가
             room = self._get_or_create_room(site_id)
-            if subscription_type == SubscriptionType.SUMMARY:
-                room.summary_clients.add(client)
-            else:
-                room.full_clients.add(client)
+            room.add(client)
             
             # 전역 클라이언트 목록에 추가
             self._clients[client.client_id] = client
             
+            # 송신 태스크 시작 (전송은 이 태스크만 수행하므로 소켓당 동시 전송 없음)
+            client.writer_task = asyncio.create_task(self._writer(client))
+            
             # =============================================
             # 🆕 v1.1.0: ClientSubscriptionManager에 등록
             # =============================================
@@ -277,13 +498,14 @@ class MultiSiteWebSocketHandler:
             client: 클라이언트 정보
         """
         async with self._lock:
+            # 이미 정리된 클라이언트 (전송 실패 등으로 먼저 해제된 경우)
+            if client.client_id not in self._clients:
+                return
+            
             # Room에서 제거
             room = self._rooms.get(client.site_id)
             if room:
-                if client.subscription_type == SubscriptionType.SUMMARY:
-                    room.summary_clients.discard(client)
-                else:
-                    room.full_clients.discard(client)
+                room.discard(client)
                 
                 # 빈 Room 정리
                 self._cleanup_room(client.site_id)
@@ -291,6 +513,9 @@ class MultiSiteWebSocketHandler:
             # 전역 클라이언트 목록에서 제거
             self._clients.pop(client.client_id, None)
             
+            # 송신 태스크 종료 (전송 중이던 프레임 포함, 대기 메시지는 폐기)
+            self._stop_writer(client)
+            
             # =============================================
             # 🆕 v1.1.0: ClientSubscriptionManager에서 해제
             # =============================================
@@ -315,26 +540,137 @@ class MultiSiteWebSocketHandler:
         """
         단일 클라이언트에 메시지 전송
         
+        메시지는 클라이언트별 송신 큐에 쌓이고 FLUSH_DELAY 후 한 프레임으로 전송됩니다.
+        
         Args:
             client: 클라이언트 정보
             data: 전송할 데이터
         
         Returns:
-            bool: 전송 성공 여부
+            bool: 전송 예약 성공 여부 (이미 연결 해제된 클라이언트면 False)
+        """
+        return await self.send_to_client_raw(client, dumps_text(data))
+    
+    async def send_to_client_raw(self, client: WebSocketClient, text: str) -> bool:
+        """
+        직렬화된 JSON 문자열을 단일 클라이언트에 전송
+        
+        브로드캐스트 시 한 번 직렬화한 문자열을 모든 클라이언트가 공유합니다.
+        
+        Args:
+            client: 클라이언트 정보
+            text: JSON 문자열
+        
+        Returns:
+            bool: 전송 예약 성공 여부 (이미 연결 해제된 클라이언트면 False)
         """
+        return self._enqueue(client, text)
+    
+    def _enqueue(self, client: WebSocketClient, text: str) -> bool:
+        """송신 큐 적재 (실제 전송은 _writer에서 수행)"""
+        if client.client_id not in self._clients or client.writer_task is None:
+            return False
+        
         try:
-            message = json.dumps(data, default=str)
-            await client.websocket.send_text(message)
-            
-            # 통계 업데이트
-            client.last_message_at = datetime.now(timezone.utc)
-            client.message_count += 1
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ 메시지 전송 실패 ({client.client_id}): {e}")
+            client.outbound.put_nowait(text)
+        except asyncio.QueueFull:
+            # 느린 클라이언트: 송신 태스크를 멈추고 연결 해제 예약 (1회만)
+            logger.warning(
+                f"⚠️ 송신 큐 초과 ({OUTBOUND_QUEUE_SIZE}), 연결 제거: {client.client_id}"
+            )
+            self._stop_writer(client)
+            task = asyncio.create_task(self._drop_client(client))
+            self._drop_tasks.add(task)
+            task.add_done_callback(self._drop_tasks.discard)
             return False
+        return True
+    
+    def _stop_writer(self, client: WebSocketClient):
+        """송신 태스크 취소 (송신 태스크 자신에서 호출된 경우 취소하지 않음)"""
+        writer = client.writer_task
+        client.writer_task = None
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+    
+    async def _writer(self, client: WebSocketClient):
+        """
+        클라이언트별 송신 태스크
+        
+        첫 메시지 이후 FLUSH_DELAY 동안 쌓인 메시지를 모아, 1개면 그대로,
+        여러 개면 {"type": "batch", "items": [...]} 한 프레임으로 전송합니다.
+        전송 중 도착한 메시지는 큐에 남아 다음 프레임으로 순서대로 전송됩니다.
+        """
+        queue = client.outbound
+        try:
+            while True:
+                pending = [await queue.get()]
+                await asyncio.sleep(FLUSH_DELAY)
+                while not queue.empty():
+                    pending.append(queue.get_nowait())
+                
+                if len(pending) == 1:
+                    message = pending[0]
+                else:
+                    message = f'{{"type":"batch","items":[{",".join(pending)}]}}'
+                
+                try:
+                    if client.compress and len(message) >= COMPRESS_MIN_SIZE:
+                        await asyncio.wait_for(
+                            client.websocket.send_bytes(self._deflate(message)), SEND_TIMEOUT
+                        )
+                    else:
+                        await asyncio.wait_for(
+                            client.websocket.send_text(message), SEND_TIMEOUT
+                        )
+                except asyncio.TimeoutError:
+                    logger.error(f"❌ 메시지 전송 타임아웃 ({client.client_id}, {SEND_TIMEOUT}s)")
+                    await self._drop_client(client)
+                    return
+                except Exception as e:
+                    logger.error(f"❌ 메시지 전송 실패 ({client.client_id}): {e}")
+                    # 전송 실패한 클라이언트 정리 (Lock은 전송이 끝난 뒤에만 획득)
+                    await self._drop_client(client)
+                    return
+                
+                # 통계 업데이트
+                client.last_message_at = time.monotonic()
+                client.message_count += len(pending)
+        except asyncio.CancelledError:
+            pass
+    
+    async def _drop_client(self, client: WebSocketClient):
+        """
+        전송 불가 클라이언트 정리
+        
+        연결 해제 후 소켓도 닫아 수신 루프(handle_site_websocket)가 종료되게 합니다.
+        """
+        await self.disconnect(client)
+        try:
+            await asyncio.wait_for(
+                client.websocket.close(1011, "Send failed"), SEND_TIMEOUT
+            )
+        except Exception:
+            pass
+    
+    def _deflate(self, message: str) -> bytes:
+        """
+        프레임 zlib 압축
+        
+        브로드캐스트는 모든 클라이언트가 같은 str 객체를 공유하므로, 최근 압축한
+        프레임과 같은 객체면 재사용합니다 (permessage-deflate의 클라이언트별 재압축 회피).
+        여러 Site의 flush가 교차하므로 최근 DEFLATE_CACHE_SIZE개 프레임을 보관합니다.
+        """
+        cache = self._deflate_cache
+        cached = cache.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        
+        compressed = zlib.compress(message.encode("utf-8"), COMPRESS_LEVEL)
+        if len(cache) >= DEFLATE_CACHE_SIZE:
+            # 가장 오래된 항목 제거 (dict 삽입 순서)
+            del cache[next(iter(cache))]
+        cache[id(message)] = (message, compressed)
+        return compressed
     
     async def broadcast_to_room(
         self,
@@ -353,22 +689,108 @@ class MultiSiteWebSocketHandler:
         Returns:
             int: 전송 성공 수
         """
-        room = self._rooms.get(site_id)
-        if not room:
-            return 0
+        return await self.broadcast_to_room_raw(site_id, dumps_text(data), subscription_type)
+    
+    async def broadcast_to_room_raw(
+        self,
+        site_id: str,
+        text: str,
+        subscription_type: Optional[SubscriptionType] = None
+    ) -> int:
+        """
+        직렬화된 JSON 문자열을 Room 내 클라이언트들에게 브로드캐스트
+        
+        호출 측에서 한 번 직렬화한 프레임을 모든 구독자가 공유합니다.
+        
+        Args:
+            site_id: Site ID
+            text: JSON 문자열
+            subscription_type: 특정 타입만 전송 (None이면 전체)
+        
+        Returns:
+            int: 전송 성공 수
+        """
+        # 대상 클라이언트 스냅샷은 Lock 안에서, 전송은 Lock 밖에서
+        async with self._lock:
+            room = self._rooms.get(site_id)
+            if not room:
+                return 0
+            
+            clients = room.snapshot(subscription_type)
         
-        # 대상 클라이언트 선택
-        clients = []
-        if subscription_type is None or subscription_type == SubscriptionType.SUMMARY:
-            clients.extend(room.summary_clients)
-        if subscription_type is None or subscription_type == SubscriptionType.FULL:
-            clients.extend(room.full_clients)
+        return await self._enqueue_many(site_id, clients, text)
+    
+    async def broadcast_items_to_room(
+        self,
+        site_id: str,
+        text: str,
+        items: List[Tuple[int, Any]],
+        render: Callable[[List[Any]], str],
+        subscription_type: Optional[SubscriptionType] = None
+    ) -> int:
+        """
+        설비별 항목 프레임을 클라이언트 설비 필터에 맞춰 브로드캐스트
+        
+        필터 없는 클라이언트는 전체 프레임(text)을 공유하고, 필터가 있는
+        클라이언트는 자신의 equipment_id 항목만 담은 프레임을 받습니다.
+        같은 필터는 한 번만 직렬화하며, 해당 항목이 없으면 전송하지 않습니다.
+        
+        Args:
+            site_id: Site ID
+            text: 전체 항목 프레임 (직렬화 완료)
+            items: (equipment_id, 항목) 목록
+            render: 항목 부분 목록 -> 프레임 문자열
+            subscription_type: 특정 타입만 전송 (None이면 전체)
         
-        # 병렬 전송
-        tasks = [self.send_to_client(client, data) for client in clients]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            int: 전송 성공 수
+        """
+        async with self._lock:
+            room = self._rooms.get(site_id)
+            if not room:
+                return 0
+            
+            clients = room.snapshot(subscription_type)
         
-        success_count = sum(1 for r in results if r is True)
+        groups: Dict[Optional[FrozenSet[int]], List[WebSocketClient]] = {}
+        for client in clients:
+            groups.setdefault(client.equipment_filter, []).append(client)
+        
+        success_count = 0
+        for equipment_filter, group in groups.items():
+            if equipment_filter is None:
+                group_text = text
+            else:
+                subset = [item for eq_id, item in items if eq_id in equipment_filter]
+                if not subset:
+                    continue
+                group_text = text if len(subset) == len(items) else render(subset)
+            success_count += await self._enqueue_many(site_id, group, group_text)
+        
+        return success_count
+    
+    async def _enqueue_many(
+        self,
+        site_id: str,
+        clients: List[WebSocketClient],
+        text: str
+    ) -> int:
+        """
+        직렬화된 메시지를 여러 클라이언트 대기열에 적재
+        
+        대규모 Room에서는 ENQUEUE_YIELD_EVERY명마다 이벤트 루프에 양보하여
+        다른 작업(수신, flush)이 밀리지 않게 합니다. 전송 실패 클라이언트는
+        _writer에서 정리됩니다.
+        
+        Returns:
+            int: 적재 성공 수
+        """
+        success_count = 0
+        for index, client in enumerate(clients, 1):
+            if self._enqueue(client, text):
+                success_count += 1
+            if index % ENQUEUE_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
         
         if success_count < len(clients):
             logger.warning(
@@ -386,6 +808,12 @@ class MultiSiteWebSocketHandler:
         """
         모든 Room에 브로드캐스트
         
+        Note:
+            TCP_CORK 등 소켓 옵션으로 쓰기를 묶는 방식은 ASGI scope가 transport/소켓을
+            노출하지 않아 적용할 수 없습니다. 대신 각 Room 브로드캐스트는 대기열 적재만
+            하므로, FLUSH_DELAY 안에 쌓인 메시지는 클라이언트당 한 프레임(= 한 번의
+            write)으로 전송됩니다.
+        
         Args:
             data: 전송할 데이터
             subscription_type: 특정 타입만 전송
@@ -393,14 +821,25 @@ class MultiSiteWebSocketHandler:
         Returns:
             Dict[str, int]: Site별 전송 성공 수
         """
-        results = {}
+        # 모든 Room 스냅샷을 Lock 1회로 확보
+        async with self._lock:
+            targets = [
+                (site_id, room.snapshot(subscription_type))
+                for site_id, room in self._rooms.items()
+            ]
         
-        for site_id in list(self._rooms.keys()):
-            # Site ID를 데이터에 추가
-            site_data = {**data, "site_id": site_id}
-            results[site_id] = await self.broadcast_to_room(
-                site_id, site_data, subscription_type
-            )
+        # data에 site_id가 없으면 한 번 직렬화한 본문 끝에 site_id만 이어 붙임
+        # (있으면 {**data, "site_id": ...}와 같은 결과를 위해 Site별 직렬화)
+        base = None if "site_id" in data else dumps_text(data)
+        
+        results = {}
+        for site_id, clients in targets:
+            if base is None:
+                text = dumps_text({**data, "site_id": site_id})
+            else:
+                site_field = f'"site_id":{dumps_text(site_id)}}}'
+                text = base[:-1] + ("," if len(base) > 2 else "") + site_field
+            results[site_id] = await self._enqueue_many(site_id, clients, text)
         
         return results
     
@@ -416,25 +855,23 @@ class MultiSiteWebSocketHandler:
             client: 클라이언트 정보
             message: 수신된 메시지
         """
+        # 파싱 전 빠른 거부: 과대 메시지, JSON 객체가 아닌 메시지
+        if len(message) > MAX_CLIENT_MESSAGE_SIZE:
+            logger.warning(
+                f"⚠️ 메시지 크기 초과 무시 ({client.client_id}): {len(message)}자"
+            )
+            return
+        if not message.lstrip().startswith("{"):
+            logger.error(f"❌ JSON 파싱 실패: {message[:100]}")
+            return
+        
         try:
-            data = json.loads(message)
+            data = loads_text(message)
             msg_type = data.get("type", "unknown")
             
-            if msg_type == "ping":
-                await self._handle_ping(client, data)
-            elif msg_type == "pause":
-                await self._handle_pause(client, data)
-            elif msg_type == "resume":
-                await self._handle_resume(client, data)
-            elif msg_type == "change_interval":
-                await self._handle_change_interval(client, data)
-            # =============================================
-            # 🆕 v1.1.0: subscription_change 핸들러
-            # Frontend SubscriptionLevelManager가 전송하는
-            # UI Context 기반 구독 레벨 변경 요청 처리
-            # =============================================
-            elif msg_type == "subscription_change":
-                await self._handle_subscription_change(client, data)
+            message_handler = self._dispatch.get(msg_type)
+            if message_handler is not None:
+                await message_handler(client, data)
             else:
                 logger.warning(f"⚠️ 알 수 없는 메시지 타입: {msg_type}")
                 
@@ -447,7 +884,7 @@ class MultiSiteWebSocketHandler:
         """Ping/Pong 처리"""
         await self.send_to_client(client, {
             "type": "pong",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
     
     async def _handle_pause(self, client: WebSocketClient, data: Dict):
@@ -456,7 +893,7 @@ class MultiSiteWebSocketHandler:
         logger.info(f"⏸️ 클라이언트 일시 정지: {client.client_id}")
         await self.send_to_client(client, {
             "type": "paused",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
     
     async def _handle_resume(self, client: WebSocketClient, data: Dict):
@@ -465,7 +902,7 @@ class MultiSiteWebSocketHandler:
         logger.info(f"▶️ 클라이언트 재개: {client.client_id}")
         await self.send_to_client(client, {
             "type": "resumed",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
     
     async def _handle_change_interval(self, client: WebSocketClient, data: Dict):
@@ -477,9 +914,35 @@ class MultiSiteWebSocketHandler:
             await self.send_to_client(client, {
                 "type": "interval_changed",
                 "interval_ms": new_interval,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             })
     
+    async def _handle_set_equipment_filter(self, client: WebSocketClient, data: Dict):
+        """
+        Delta 수신 설비 필터 설정
+        
+        {"type": "set_equipment_filter", "equipment_ids": [1, 2, 3]}
+        equipment_ids가 null이면 필터 해제 (전체 수신)
+        """
+        equipment_ids = data.get("equipment_ids")
+        if equipment_ids is None:
+            client.equipment_filter = None
+        elif isinstance(equipment_ids, list) and all(
+            isinstance(eq_id, int) and not isinstance(eq_id, bool) for eq_id in equipment_ids
+        ):
+            client.equipment_filter = frozenset(equipment_ids)
+        else:
+            logger.warning(f"⚠️ 잘못된 equipment_ids 무시 ({client.client_id}): {str(equipment_ids)[:100]}")
+            return
+        
+        filter_size = None if client.equipment_filter is None else len(client.equipment_filter)
+        logger.debug(f"🎯 설비 필터: {client.client_id} → {filter_size if filter_size is not None else '전체'}")
+        await self.send_to_client(client, {
+            "type": "equipment_filter_set",
+            "equipment_count": filter_size,
+            "timestamp": _now_iso()
+        })
+    
     # =============================================
     # 🆕 v1.1.0: subscription_change 핸들러
     # =============================================
@@ -519,12 +982,14 @@ class MultiSiteWebSocketHandler:
         selected_ids = payload.get("selected_ids", [])
         websocket_state = payload.get("websocket_state", "ACTIVE")
         
-        logger.info(
-            f"📊 구독 변경 요청: {client.client_id} | "
-            f"{previous_context} → {context}, "
-            f"all={all_level}, selected={selected_level} "
-            f"({len(selected_ids)}개), ws_state={websocket_state}"
-        )
+        # pan/zoom마다 발생하므로 요청 상세 로그는 DEBUG에서만 포맷팅
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"📊 구독 변경 요청: {client.client_id} | "
+                f"{previous_context} → {context}, "
+                f"all={all_level}, selected={selected_level} "
+                f"({len(selected_ids)}개), ws_state={websocket_state}"
+            )
         
         # ClientSubscriptionManager로 구독 변경 위임
         subscription_applied = False
@@ -544,7 +1009,10 @@ class MultiSiteWebSocketHandler:
                 
                 if subscription_applied:
                     logger.info(
-                        f"✅ 구독 변경 적용됨: {client.client_id} → {context}"
+                        f"✅ 구독 변경 적용됨: {client.client_id} | "
+                        f"{previous_context} → {context}, "
+                        f"all={all_level}, selected={selected_level} "
+                        f"({len(selected_ids)}개)"
                     )
                 else:
                     logger.warning(
@@ -564,6 +1032,9 @@ class MultiSiteWebSocketHandler:
             )
         
         # ACK 응답 전송
+        # - dict 리터럴이 템플릿 copy+update보다 빠름
+        # - 고정 문자열 템플릿에 필드별 직렬화 값을 끼우는 방식은 가변 필드마다
+        #   dumps_text 호출이 필요해 dict 1회 직렬화보다 느림
         await self.send_to_client(client, {
             "type": "subscription_change_ack",
             "success": subscription_applied or not self._subscription_manager,
@@ -573,7 +1044,7 @@ class MultiSiteWebSocketHandler:
             "selected_level": selected_level,
             "selected_count": len(selected_ids),
             "websocket_state": websocket_state,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
     
     # ============================================
@@ -595,7 +1066,7 @@ class MultiSiteWebSocketHandler:
             "rooms": room_stats,
             # 🆕 v1.1.0: 구독 관리자 상태
             "subscription_manager_available": self._subscription_manager is not None,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         }
     
     def get_room_stats(self, site_id: str) -> Optional[Dict[str, Any]]:
@@ -611,6 +1082,15 @@ class MultiSiteWebSocketHandler:
         room = self._rooms.get(site_id)
         return room.to_dict() if room else None
     
+    def get_room_version(self, site_id: str) -> Optional[int]:
+        """
+        Room 클라이언트 구성 버전 (Room이 없으면 None)
+        
+        값이 같으면 그 사이 클라이언트 추가/제거가 없었음을 의미합니다.
+        """
+        room = self._rooms.get(site_id)
+        return room.version if room else None
+    
     def get_client_info(self, client_id: str) -> Optional[Dict[str, Any]]:
         """
         클라이언트 정보 조회
@@ -632,16 +1112,23 @@ class MultiSiteWebSocketHandler:
         """모든 연결 종료"""
         logger.info("🔌 모든 WebSocket 연결 종료 시작")
         
-        for client in list(self._clients.values()):
-            try:
-                await client.websocket.close(1000, "Server shutdown")
-            except Exception as e:
-                logger.warning(f"⚠️ WebSocket 종료 실패: {e}")
+        # 종료 중 dict 변경에 대비해 스냅샷 후 동시 종료
+        clients = list(self._clients.values())
+        await asyncio.gather(*(self._safe_close(client) for client in clients))
         
         self._rooms.clear()
         self._clients.clear()
         
-        logger.info("✅ 모든 WebSocket 연결 종료 완료")
+        logger.info(f"✅ 모든 WebSocket 연결 종료 완료 ({len(clients)}개)")
+    
+    async def _safe_close(self, client: WebSocketClient):
+        """클라이언트 종료 (대기 메시지 폐기, 실패 시 로그만 남김)"""
+        self._stop_writer(client)
+        
+        try:
+            await client.websocket.close(1000, "Server shutdown")
+        except Exception as e:
+            logger.warning(f"⚠️ WebSocket 종료 실패 ({client.client_id}): {e}")
 
 
 # ============================================
@@ -669,7 +1156,8 @@ async def handle_site_websocket(
     websocket: WebSocket,
     site_id: str,
     subscription_type: str,
-    interval_ms: Optional[int] = None
+    interval_ms: Optional[int] = None,
+    compress: Optional[bool] = None
 ):
     """
     Site WebSocket 연결 처리 (엔드포인트용)
@@ -679,13 +1167,17 @@ async def handle_site_websocket(
         site_id: Site ID
         subscription_type: "summary" 또는 "full"
         interval_ms: 메시지 간격
+        compress: 압축 프레임 수신 여부 (None이면 쿼리 파라미터 ?compress=1)
     """
     handler = get_multi_site_ws_handler()
     
     # 구독 타입 변환
     sub_type = SubscriptionType.SUMMARY if subscription_type == "summary" else SubscriptionType.FULL
     
-    client = await handler.connect(websocket, site_id, sub_type, interval_ms)
+    if compress is None:
+        compress = websocket.query_params.get("compress") == "1"
+    
+    client = await handler.connect(websocket, site_id, sub_type, interval_ms, compress)
     
     try:
         # 연결 확인 메시지
@@ -695,22 +1187,21 @@ async def handle_site_websocket(
             "subscription_type": subscription_type,
             "interval_ms": client.interval_ms,
             "client_id": client.client_id,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now_iso()
         })
         
         # 메시지 수신 루프
         while True:
             try:
-                message = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=300  # 5분 타임아웃
-                )
+                # asyncio.timeout: wait_for와 달리 수신마다 별도 Task를 만들지 않음
+                async with asyncio.timeout(RECEIVE_TIMEOUT):
+                    message = await websocket.receive_text()
                 await handler.handle_message(client, message)
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 # Ping 전송
                 await handler.send_to_client(client, {
                     "type": "ping",
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 })
                 
     except WebSocketDisconnect:
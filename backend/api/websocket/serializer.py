@@ -0,0 +1,97 @@
+"""
+serializer.py
+WebSocket 메시지 직렬화 유틸리티
+
+브로드캐스트 시 동일한 메시지를 클라이언트 수만큼 반복 직렬화하지 않도록
+한 번 인코딩한 텍스트 프레임을 모든 클라이언트에 재사용하기 위한 헬퍼입니다.
+
+@version 1.1.1
+@changelog
+- v1.1.1: orjson/json 폴백 출력 통일 (2026-10-17)
+          - numpy 값은 숫자/배열, 비-str 키는 문자열 키, datetime은 ISO 8601로 직렬화
+- v1.1.0: loads_text() 추가 (2026-10-17)
+          - 수신 메시지 파싱도 orjson 사용 (미설치 시 json 폴백)
+- v1.0.0: 초기 버전 (2026-10-17)
+          - dumps_text(): orjson 사용 (미설치 시 json 폴백)
+
+@dependencies
+- orjson (optional)
+
+작성일: 2026-10-17
+수정일: 2026-10-17
+"""
+
+import json
+import logging
+from datetime import date, datetime, time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# orjson (optional)
+# ============================================
+
+_orjson_available = False
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    logger.debug("orjson 미설치 - 표준 json 모듈로 직렬화합니다")
+
+if _orjson_available:
+    # numpy 값은 숫자/배열로, 비-str 키(int 등)는 문자열 키로 (json 폴백과 동일한 출력)
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """json 폴백용 변환 (orjson 출력과 동일하게 numpy는 숫자/배열, datetime은 ISO 8601)"""
+    if type(value).__module__ == "numpy":
+        return value.tolist()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps_text(message: Any) -> str:
+    """
+    메시지를 WebSocket 텍스트 프레임용 JSON 문자열로 직렬화
+
+    Starlette의 send_json()과 동일하게 공백 없는 구분자와 비-ASCII 문자를
+    그대로 사용합니다. numpy 값은 숫자/배열, datetime은 ISO 8601 문자열, 그 밖에
+    직렬화할 수 없는 값은 문자열로 변환됩니다 (orjson 설치 여부와 무관하게 같은 출력).
+
+    Note:
+        Frontend는 텍스트 프레임을 JSON.parse로 처리하므로 bytes(바이너리 프레임)가
+        아닌 str을 반환합니다. ASGI websocket.send는 텍스트 프레임에 str만 허용하므로
+        재사용 bytearray 버퍼로 할당을 줄이는 방식은 적용할 수 없고, 대신
+        브로드캐스트당 1회 직렬화한 str을 모든 클라이언트가 공유합니다.
+
+    Args:
+        message: 직렬화할 메시지
+
+    Returns:
+        str: JSON 문자열
+    """
+    if _orjson_available:
+        return orjson.dumps(message, default=str, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+def loads_text(text: str) -> Any:
+    """
+    수신한 JSON 문자열(또는 bytes) 파싱
+
+    Args:
+        text: JSON 문자열
+
+    Returns:
+        Any: 파싱 결과
+
+    Raises:
+        json.JSONDecodeError: JSON 형식 오류 (orjson.JSONDecodeError도 이 예외의 하위 클래스)
+    """
+    if _orjson_available:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -4,8 +4,14 @@
 - 데이터 압축
 - 배치 처리
 
-@version 2.0.0
+@version 2.0.2
 @changelog
+- v2.0.2: 배치 버퍼를 collections.deque로 변경 (2026-10-17)
+          - get_batch()는 batch_size만큼 popleft (버퍼 길이와 무관)
+          - 설비별 버퍼 상한 MAX_BATCH_BUFFER (초과 시 오래된 데이터부터 폐기)
+- v2.0.1: format_* 핫패스 정리 (2026-10-17)
+          - timestamp 기본값(datetime.now)은 값이 없을 때만 생성
+          - format_equipment_status() 선택 필드는 고정 튜플 순회로 복사
 - v2.0.0: Equipment Detail Panel용 확장 필드 추가
           - lot_start_time, cpu_usage_percent
           - product_model, lot_id, equipment_name, line_name
@@ -14,17 +20,52 @@
 - v1.0.0: 초기 버전
 
 작성일: 2026-01-08
+수정일: 2026-10-17
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Deque
+from collections import deque
 import json
 from datetime import datetime
 
 
+# 설비별 배치 버퍼 최대 길이 (소비가 밀리면 오래된 데이터부터 폐기)
+MAX_BATCH_BUFFER = 140
+
+
+# format_equipment_status()에서 값이 있을 때만 그대로 복사하는 선택 필드 (출력 순서 유지)
+_OPTIONAL_STATUS_FIELDS = (
+    # Phase 1 Monitoring용 필드 (v1.1.0)
+    "frontend_id",
+    "previous_status",
+    # 센서 데이터 (기존 기능)
+    "temperature",
+    "pressure",
+    # 🆕 v2.0.0: Equipment Detail Panel용 확장 필드
+    "equipment_name",
+    "line_name",
+    "product_model",
+    "lot_id",
+    "lot_start_time",
+)
+
+
+# dict.get() 기본값 구분용 (None 값과 키 없음 구분)
+_MISSING = object()
+
+
+def _timestamp_or_now(data: dict, key: str = "timestamp"):
+    """data[key]가 있으면 그대로, 없을 때만 현재 시각 생성"""
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
+        return datetime.now().isoformat()
+    return value
+
+
 class StreamHandler:
     def __init__(self):
         self.batch_size = 10
-        self.batch_buffer: Dict[str, List] = {}
+        self.batch_buffer: Dict[str, Deque[dict]] = {}
     
     def format_equipment_status(self, data: dict) -> dict:
         """
@@ -62,58 +103,20 @@ class StreamHandler:
             "type": "equipment_status",
             "equipment_id": data.get("equipment_id"),
             "status": data.get("status"),
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data)
         }
         
         # ============================================
-        # Phase 1 Monitoring용 필드 (v1.1.0)
-        # ============================================
-        if "frontend_id" in data:
-            formatted["frontend_id"] = data.get("frontend_id")
-        
-        if "previous_status" in data:
-            formatted["previous_status"] = data.get("previous_status")
-        
-        # 센서 데이터 (기존 기능)
-        if "temperature" in data:
-            formatted["temperature"] = data.get("temperature")
-        
-        if "pressure" in data:
-            formatted["pressure"] = data.get("pressure")
-        
-        # ============================================
-        # 🆕 v2.0.0: Equipment Detail Panel용 확장 필드
+        # 선택 필드 (v1.1.0 / v2.0.0) - 값이 있을 때만 포함
         # ============================================
-        
-        # 설비 기본 정보
-        if "equipment_name" in data:
-            formatted["equipment_name"] = data.get("equipment_name")
-        
-        if "line_name" in data:
-            formatted["line_name"] = data.get("line_name")
-        
-        # Lot 정보
-        if "product_model" in data:
-            formatted["product_model"] = data.get("product_model")
-        
-        if "lot_id" in data:
-            formatted["lot_id"] = data.get("lot_id")
-        
-        # 🆕 v2.0.0: Lot 시작 시간 (Duration Timer용)
-        if "lot_start_time" in data:
-            formatted["lot_start_time"] = data.get("lot_start_time")
+        for key in _OPTIONAL_STATUS_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                formatted[key] = value
         
         # 🆕 v2.0.0: CPU 사용율 (PC Info Tab용)
         if "cpu_usage_percent" in data:
-            cpu_val = data.get("cpu_usage_percent")
-            # float 변환 (None이 아닌 경우)
-            if cpu_val is not None:
-                try:
-                    formatted["cpu_usage_percent"] = float(cpu_val)
-                except (ValueError, TypeError):
-                    formatted["cpu_usage_percent"] = None
-            else:
-                formatted["cpu_usage_percent"] = None
+            formatted["cpu_usage_percent"] = self._safe_float(data["cpu_usage_percent"])
         
         return formatted
     
@@ -162,8 +165,8 @@ class StreamHandler:
             "cpu_usage_percent": self._safe_float(data.get("cpu_usage_percent")),
             
             # 타임스탬프
-            "timestamp": data.get("timestamp", datetime.now().isoformat()),
-            "last_updated": data.get("last_updated", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data),
+            "last_updated": _timestamp_or_now(data, "last_updated")
         }
     
     def _safe_float(self, value) -> Optional[float]:
@@ -185,7 +188,7 @@ class StreamHandler:
             "product_count": data.get("product_count"),
             "good_count": data.get("good_count"),
             "defect_count": data.get("defect_count"),
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data)
         }
     
     def format_alarm(self, data: dict) -> dict:
@@ -196,7 +199,7 @@ class StreamHandler:
             "alarm_code": data.get("alarm_code"),
             "severity": data.get("severity", "WARNING"),
             "message": data.get("message"),
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data)
         }
     
     # =========================================================================
@@ -223,7 +226,7 @@ class StreamHandler:
             "equipment_id": data.get("equipment_id"),
             "frontend_id": data.get("frontend_id"),
             "cpu_usage_percent": self._safe_float(data.get("cpu_usage_percent")),
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data)
         }
     
     # =========================================================================
@@ -253,7 +256,7 @@ class StreamHandler:
             "lot_id": data.get("lot_id"),
             "product_model": data.get("product_model"),
             "lot_start_time": data.get("lot_start_time"),
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": _timestamp_or_now(data)
         }
     
     # =========================================================================
@@ -262,18 +265,17 @@ class StreamHandler:
     
     def add_to_batch(self, equipment_id: str, data: dict):
         """배치 버퍼에 데이터 추가"""
-        if equipment_id not in self.batch_buffer:
-            self.batch_buffer[equipment_id] = []
+        buffer = self.batch_buffer.get(equipment_id)
+        if buffer is None:
+            buffer = self.batch_buffer[equipment_id] = deque(maxlen=MAX_BATCH_BUFFER)
         
-        self.batch_buffer[equipment_id].append(data)
+        buffer.append(data)
     
     def get_batch(self, equipment_id: str) -> List[dict]:
         """배치 데이터 가져오기"""
-        if equipment_id in self.batch_buffer:
-            if len(self.batch_buffer[equipment_id]) >= self.batch_size:
-                batch = self.batch_buffer[equipment_id][:self.batch_size]
-                self.batch_buffer[equipment_id] = self.batch_buffer[equipment_id][self.batch_size:]
-                return batch
+        buffer = self.batch_buffer.get(equipment_id)
+        if buffer is not None and len(buffer) >= self.batch_size:
+            return [buffer.popleft() for _ in range(self.batch_size)]
         return []
     
     def clear_batch(self, equipment_id: str):
@@ -2,8 +2,43 @@
 summary_stream.py
 Site Summary 데이터 스트리밍 서비스
 
-@version 1.0.0
+@version 1.2.13
 @changelog
+- v1.2.13: SiteDataCache._previous_state 제거 (2026-10-17)
+          - Delta 비교는 _previous_rows 튜플로만 수행하므로 설비 상태 dict 보관 불필요
+- v1.2.12: SiteSummaryData 직렬화 캐시 제거 (2026-10-17)
+          - Summary 객체는 주기마다 새로 만들어져 to_message_text()가 객체당 1회만 호출됨
+          - 호출처가 없던 SiteDataCache.get_last_summary_text() 제거
+- v1.2.11: SiteDataCache __slots__ 적용 (2026-10-17)
+- v1.2.10: 내용이 같은 Summary는 재전송 생략 (2026-10-17)
+          - SiteSummaryData.content_key(): last_updated를 제외한 필드 튜플
+          - 직전 전송과 내용이 같고 Room 구성도 그대로면 브로드캐스트 생략
+            (새 구독자가 들어온 주기에는 그대로 전송)
+- v1.2.9: Delta를 클라이언트 설비 필터별로 잘라 전송 (2026-10-17)
+          - broadcast_items_to_room() 사용, 필터가 같은 클라이언트는 직렬화 결과 공유
+- v1.2.8: SiteDataCache 갱신 시각을 time.monotonic()으로 기록 (2026-10-17)
+          - 매 주기 datetime 생성 제거, get_last_update()에서 필요 시 UTC datetime 변환
+- v1.2.7: 스트림 작업 키를 (site_id, stream_type) 튜플로 변경 (2026-10-17)
+          - Site별 stream_type 집합으로 활성 여부 O(1) 판정
+          - 접두사 비교(startswith)로 다른 Site를 활성으로 오판하던 문제 해결
+- v1.2.6: SiteSummaryData 직렬화 결과 캐시 (2026-10-17)
+          - to_message_text(): summary 메시지를 최초 1회만 직렬화
+          - SiteDataCache.get_last_summary_text() 추가
+- v1.2.5: 스트림 루프 deadline 기반 주기 (2026-10-17)
+          - 작업 시간만큼 주기가 밀리지 않도록 loop.time() deadline 기준 대기
+          - 두 번째 주기부터 Site별 임의 위상으로 분산 (동시 브로드캐스트 완화)
+- v1.2.4: Mock frontend_id 사전 생성, 상태 문자열 재사용 (2026-10-17)
+- v1.2.3: Mock Full 데이터를 numpy 일괄 난수로 생성 (2026-10-17)
+- v1.2.2: update_state()의 이전 상태 dict 복사 제거 (2026-10-17)
+- v1.2.1: Delta 계산을 설비별 값 튜플 비교로 변경 (2026-10-17)
+          - COMPARE_FIELDS 상수화, 변경 없는 설비는 튜플 1회 비교로 통과
+- v1.2.0: 스트림 루프에서 프레임 1회 직렬화 (2026-10-17)
+          - broadcast_to_room_raw()로 직렬화된 프레임을 전달
+- v1.1.1: SiteSummaryData/EquipmentDelta/SiteFullData __slots__ 적용 (2026-10-17)
+- v1.1.0: Delta 병합 전송 (2026-10-17)
+          - 직전 전송 후 DELTA_MERGE_WINDOW 안에 들어온 Delta는 모아서 전송
+          - 같은 frontend_id의 Delta는 changes를 합쳐 하나로 병합
+          - 평상시(간격 > DELTA_MERGE_WINDOW)에는 기존과 동일하게 즉시 전송
 - v1.0.0: Phase 3 - WebSocket Pool Manager Backend 구현 (2026-02-04)
           - Summary/Full 데이터 스트리밍
           - Timer 기반 주기적 전송
@@ -14,27 +49,51 @@ Site Summary 데이터 스트리밍 서비스
 - ../database/multi_connection_manager.py (MultiConnectionManager)
 - ../services/uds/uds_service.py (UDSService)
 - ./multi_site_handler.py (MultiSiteWebSocketHandler)
+- ./serializer.py (dumps_text)
+- numpy (Mock 데이터 생성)
 
 작성일: 2026-02-04
-수정일: 2026-02-04
+수정일: 2026-10-17
 """
 
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any, Set
+import random
+import time
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
+from .serializer import dumps_text
+
 logger = logging.getLogger(__name__)
 
 
+# Mock 데이터 생성용 (개발용)
+_MOCK_STATUSES = ("RUN", "IDLE", "STOP", "DISC")
+_MOCK_STATUS_WEIGHTS = [0.7, 0.15, 0.1, 0.05]
+_mock_rng = np.random.default_rng()
+_MOCK_EQUIPMENT_COUNT = 117
+
+# Delta 계산 시 비교할 필드 (순서 고정 - 설비별 값 튜플의 인덱스)
+COMPARE_FIELDS = (
+    "status", "alarm_code", "cpu", "memory",
+    "production_count", "tact_time", "lot_code"
+)
+
+# 직전 Delta 전송 후 이 시간(초) 안에 들어온 Delta는 병합하여 한 번에 전송
+DELTA_MERGE_WINDOW = 0.1
+
+
 # ============================================
 # Data Classes
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class SiteSummaryData:
     """Site 요약 데이터"""
     site_id: str
@@ -48,6 +107,17 @@ class SiteSummaryData:
     critical_equipments: List[Dict] = field(default_factory=list)
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
+    def to_message_text(self) -> str:
+        """WebSocket summary 메시지 JSON 문자열"""
+        return dumps_text({"type": "summary", **self.to_dict()})
+    
+    def content_key(self) -> Tuple[Any, ...]:
+        """last_updated를 제외한 내용 비교용 튜플 (같으면 전송 내용 동일)"""
+        return (
+            self.status, self.has_layout, self.has_mapping, self.process,
+            self.stats, self.production, self.alarms, self.critical_equipments
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리 변환"""
         return {
@@ -64,7 +134,7 @@ class SiteSummaryData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentDelta:
     """설비 상태 변경 (Delta)"""
     frontend_id: str
@@ -82,7 +152,7 @@ class EquipmentDelta:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteFullData:
     """Site Full 데이터 (Delta Update)"""
     site_id: str
@@ -112,11 +182,18 @@ class SiteDataCache:
     이전 상태를 저장하여 Delta 계산에 활용
     """
     
+    __slots__ = (
+        "site_id", "_previous_rows", "_last_summary", "_last_update"
+    )
+    
     def __init__(self, site_id: str):
         self.site_id = site_id
-        self._previous_state: Dict[int, Dict[str, Any]] = {}
+        # 설비별 COMPARE_FIELDS 값 튜플 (변경 없음은 튜플 1회 비교로 판정)
+        # eq_id 인덱스 list 대신 dict 유지 (실제 DB의 equipment_id는 연속 보장이 없음)
+        self._previous_rows: Dict[int, Tuple[Any, ...]] = {}
         self._last_summary: Optional[SiteSummaryData] = None
-        self._last_update: Optional[datetime] = None
+        # 마지막 갱신 시각 (time.monotonic(), 조회 시 get_last_update()로 변환)
+        self._last_update: Optional[float] = None
     
     def update_state(self, current_state: Dict[int, Dict[str, Any]]) -> List[EquipmentDelta]:
         """
@@ -129,67 +206,67 @@ class SiteDataCache:
             List[EquipmentDelta]: 변경된 항목들
         """
         deltas = []
+        previous_rows = self._previous_rows
+        rows: Dict[int, Tuple[Any, ...]] = {}
         
         for eq_id, current in current_state.items():
-            previous = self._previous_state.get(eq_id)
+            row = tuple(map(current.get, COMPARE_FIELDS))
+            rows[eq_id] = row
+            previous_row = previous_rows.get(eq_id)
             
-            if previous is None:
+            if previous_row is None:
                 # 새로운 설비
                 deltas.append(EquipmentDelta(
                     frontend_id=current.get("frontend_id", f"EQ-{eq_id}"),
                     equipment_id=eq_id,
                     changes=current
                 ))
-            else:
-                # 변경 확인
-                changes = self._detect_changes(previous, current)
-                if changes:
-                    deltas.append(EquipmentDelta(
-                        frontend_id=current.get("frontend_id", f"EQ-{eq_id}"),
-                        equipment_id=eq_id,
-                        changes=changes
-                    ))
-        
-        # 상태 저장
-        self._previous_state = current_state.copy()
-        self._last_update = datetime.now(timezone.utc)
+            elif row != previous_row:
+                # 값 튜플 동등 비교가 곧 설비별 fingerprint 비교
+                # (해시 비교는 해시 계산 비용이 추가되고 충돌 시 변경을 놓칠 수 있어 사용하지 않음)
+                # 변경된 필드만 추출
+                deltas.append(EquipmentDelta(
+                    frontend_id=current.get("frontend_id", f"EQ-{eq_id}"),
+                    equipment_id=eq_id,
+                    changes=self._detect_changes(previous_row, row)
+                ))
+        
+        # 상태 저장 (다음 주기 비교용 값 튜플)
+        self._previous_rows = rows
+        self._last_update = time.monotonic()
         
         return deltas
     
     def _detect_changes(
         self,
-        previous: Dict[str, Any],
-        current: Dict[str, Any]
+        previous: Tuple[Any, ...],
+        current: Tuple[Any, ...]
     ) -> Dict[str, Any]:
-        """변경 항목 감지"""
-        changes = {}
-        
-        # 비교할 필드들
-        compare_fields = [
-            "status", "alarm_code", "cpu", "memory",
-            "production_count", "tact_time", "lot_code"
-        ]
-        
-        for field in compare_fields:
-            prev_val = previous.get(field)
-            curr_val = current.get(field)
-            
-            if prev_val != curr_val:
-                changes[field] = curr_val
-        
-        return changes
+        """변경 항목 감지 (COMPARE_FIELDS 순서의 값 튜플 비교)"""
+        return {
+            field: curr_val
+            for field, prev_val, curr_val in zip(COMPARE_FIELDS, previous, current)
+            if prev_val != curr_val
+        }
     
     def set_summary(self, summary: SiteSummaryData):
         """Summary 데이터 설정"""
         self._last_summary = summary
     
+    def get_last_update(self) -> Optional[datetime]:
+        """마지막 상태 갱신 시각 (UTC)"""
+        if self._last_update is None:
+            return None
+        wall = time.time() - (time.monotonic() - self._last_update)
+        return datetime.fromtimestamp(wall, timezone.utc)
+    
     def get_last_summary(self) -> Optional[SiteSummaryData]:
         """마지막 Summary 반환"""
         return self._last_summary
     
     def clear(self):
         """캐시 초기화"""
-        self._previous_state.clear()
+        self._previous_rows = {}
         self._last_summary = None
         self._last_update = None
 
@@ -226,11 +303,25 @@ class SummaryStreamService:
         # Site별 캐시
         self._caches: Dict[str, SiteDataCache] = {}
         
+        # Mock 데이터용 frontend_id (변하지 않으므로 1회 생성)
+        self._frontend_ids = tuple(
+            f"EQ-{(eq_id - 1) // 6 + 1:02d}-{(eq_id - 1) % 6 + 1:02d}"
+            for eq_id in range(1, _MOCK_EQUIPMENT_COUNT + 1)
+        )
+        
         # 스트리밍 작업
-        self._stream_tasks: Dict[str, asyncio.Task] = {}
+        self._stream_tasks: Dict[Tuple[str, str], asyncio.Task] = {}  # (site_id, stream_type)
         
-        # 활성 Site
-        self._active_sites: Set[str] = set()
+        # 활성 Site → 실행 중인 stream_type
+        self._active_sites: Dict[str, Set[str]] = {}
+        
+        # Site별 Delta 병합 상태
+        self._last_delta_sent: Dict[str, float] = {}                    # time.monotonic()
+        self._pending_deltas: Dict[str, Dict[str, EquipmentDelta]] = {}  # frontend_id → Delta
+        self._delta_flush_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Site별 마지막 Summary 전송 (Room 구성 버전, content_key)
+        self._last_summary_sent: Dict[str, Tuple[Optional[int], Tuple[Any, ...]]] = {}
         
         # 실행 중 플래그
         self._running = False
@@ -271,7 +362,7 @@ class SummaryStreamService:
             stream_type: "summary" 또는 "full"
             interval_ms: 간격 (밀리초)
         """
-        task_key = f"{site_id}:{stream_type}"
+        task_key = (site_id, stream_type)
         
         # 기존 작업이 있으면 중지
         await self.stop_stream(site_id, stream_type)
@@ -287,9 +378,9 @@ class SummaryStreamService:
             )
         
         self._stream_tasks[task_key] = task
-        self._active_sites.add(site_id)
+        self._active_sites.setdefault(site_id, set()).add(stream_type)
         
-        logger.info(f"▶️ 스트림 시작: {task_key} ({interval_ms}ms)")
+        logger.info(f"▶️ 스트림 시작: {site_id}:{stream_type} ({interval_ms}ms)")
     
     async def stop_stream(self, site_id: str, stream_type: Optional[str] = None):
         """
@@ -299,24 +390,29 @@ class SummaryStreamService:
             site_id: Site ID
             stream_type: "summary", "full" 또는 None (전체)
         """
-        if stream_type:
-            task_keys = [f"{site_id}:{stream_type}"]
-        else:
-            task_keys = [f"{site_id}:summary", f"{site_id}:full"]
+        stream_types = (stream_type,) if stream_type else ("summary", "full")
+        site_streams = self._active_sites.get(site_id)
         
-        for task_key in task_keys:
-            task = self._stream_tasks.pop(task_key, None)
+        for current_type in stream_types:
+            if site_streams is not None:
+                site_streams.discard(current_type)
+            task = self._stream_tasks.pop((site_id, current_type), None)
             if task and not task.done():
                 task.cancel()
                 try:
                     await task
                 except asyncio.CancelledError:
                     pass
-                logger.info(f"⏹️ 스트림 중지: {task_key}")
+                logger.info(f"⏹️ 스트림 중지: {site_id}:{current_type}")
+        
+        if stream_type in (None, "full"):
+            self._cancel_delta_flush(site_id)
+        if stream_type in (None, "summary"):
+            self._last_summary_sent.pop(site_id, None)
         
         # 더 이상 해당 Site의 스트림이 없으면 제거
-        if not any(k.startswith(site_id) for k in self._stream_tasks):
-            self._active_sites.discard(site_id)
+        if site_streams is not None and not site_streams:
+            self._active_sites.pop(site_id, None)
     
     async def stop_all_streams(self):
         """모든 스트림 중지"""
@@ -330,6 +426,12 @@ class SummaryStreamService:
         
         self._stream_tasks.clear()
         self._active_sites.clear()
+        
+        for site_id in list(self._delta_flush_tasks):
+            self._cancel_delta_flush(site_id)
+        self._pending_deltas.clear()
+        self._last_delta_sent.clear()
+        self._last_summary_sent.clear()
         logger.info("⏹️ 모든 스트림 중지됨")
     
     # ============================================
@@ -339,6 +441,9 @@ class SummaryStreamService:
     async def _summary_stream_loop(self, site_id: str, interval_ms: int):
         """Summary 스트림 루프"""
         interval_sec = interval_ms / 1000
+        loop = asyncio.get_running_loop()
+        # 첫 전송은 즉시, 이후 주기는 Site별 임의 위상으로 분산
+        next_tick = loop.time() + random.uniform(0, interval_sec)
         
         while True:
             try:
@@ -346,29 +451,32 @@ class SummaryStreamService:
                 summary = await self._fetch_site_summary(site_id)
                 
                 if summary and self._ws_handler:
-                    # WebSocket 브로드캐스트
-                    message = {
-                        "type": "summary",
-                        **summary.to_dict()
-                    }
-                    
-                    from .multi_site_handler import SubscriptionType
-                    await self._ws_handler.broadcast_to_room(
-                        site_id, message, SubscriptionType.SUMMARY
-                    )
+                    # 직전 전송과 내용이 같고 그 사이 구독자 변동이 없으면 생략
+                    sent = (self._ws_handler.get_room_version(site_id), summary.content_key())
+                    if sent != self._last_summary_sent.get(site_id):
+                        # WebSocket 브로드캐스트
+                        from .multi_site_handler import SubscriptionType
+                        await self._ws_handler.broadcast_to_room_raw(
+                            site_id, summary.to_message_text(), SubscriptionType.SUMMARY
+                        )
+                        self._last_summary_sent[site_id] = sent
                 
-                await asyncio.sleep(interval_sec)
+                next_tick = await self._sleep_until(next_tick, interval_sec)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ Summary 스트림 에러 ({site_id}): {e}")
                 await asyncio.sleep(5)  # 에러 시 5초 대기
+                next_tick = loop.time()
     
     async def _full_stream_loop(self, site_id: str, interval_ms: int):
         """Full (Delta) 스트림 루프"""
         interval_sec = interval_ms / 1000
         cache = self._get_cache(site_id)
+        loop = asyncio.get_running_loop()
+        # 첫 전송은 즉시, 이후 주기는 Site별 임의 위상으로 분산
+        next_tick = loop.time() + random.uniform(0, interval_sec)
         
         while True:
             try:
@@ -380,24 +488,119 @@ class SummaryStreamService:
                     deltas = cache.update_state(current_state)
                     
                     if deltas and self._ws_handler:
-                        # WebSocket 브로드캐스트
-                        full_data = SiteFullData(
-                            site_id=site_id,
-                            updates=deltas
-                        )
-                        
-                        from .multi_site_handler import SubscriptionType
-                        await self._ws_handler.broadcast_to_room(
-                            site_id, full_data.to_dict(), SubscriptionType.FULL
-                        )
+                        await self._publish_deltas(site_id, deltas)
                 
-                await asyncio.sleep(interval_sec)
+                next_tick = await self._sleep_until(next_tick, interval_sec)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ Full 스트림 에러 ({site_id}): {e}")
                 await asyncio.sleep(5)  # 에러 시 5초 대기
+                next_tick = loop.time()
+    
+    @staticmethod
+    async def _sleep_until(next_tick: float, interval_sec: float) -> float:
+        """
+        다음 주기 시각(loop.time() 기준)까지 대기 후 그다음 주기 시각 반환
+        
+        작업 시간만큼 주기가 밀리지 않도록 고정 deadline 기준으로 대기합니다.
+        한 주기 이상 밀렸으면 밀린 주기를 몰아서 실행하지 않고 현재 시각부터 다시 맞춥니다.
+        """
+        now = asyncio.get_running_loop().time()
+        if next_tick > now:
+            await asyncio.sleep(next_tick - now)
+            return next_tick + interval_sec
+        return max(next_tick + interval_sec, now)
+    
+    # ============================================
+    # Delta 병합 전송
+    # ============================================
+    
+    async def _publish_deltas(self, site_id: str, deltas: List[EquipmentDelta]):
+        """
+        Delta 전송 (직전 전송 직후면 병합 대기)
+        
+        직전 전송 후 DELTA_MERGE_WINDOW가 지났고 대기 중인 Delta가 없으면 즉시
+        전송합니다. 그렇지 않으면 frontend_id별로 병합해 두었다가 창이 끝날 때
+        한 번에 전송합니다.
+        """
+        pending = self._pending_deltas.get(site_id)
+        elapsed = time.monotonic() - self._last_delta_sent.get(site_id, 0.0)
+        
+        if pending is None and elapsed >= DELTA_MERGE_WINDOW:
+            await self._send_deltas(site_id, deltas)
+            return
+        
+        if pending is None:
+            pending = self._pending_deltas[site_id] = {}
+        for delta in deltas:
+            previous = pending.get(delta.frontend_id)
+            if previous is None:
+                pending[delta.frontend_id] = delta
+            else:
+                # 이전 변경 위에 새 변경을 덮어써 최종 상태만 전송
+                pending[delta.frontend_id] = EquipmentDelta(
+                    frontend_id=delta.frontend_id,
+                    equipment_id=delta.equipment_id,
+                    changes={**previous.changes, **delta.changes},
+                    timestamp=delta.timestamp
+                )
+        
+        if site_id not in self._delta_flush_tasks:
+            self._delta_flush_tasks[site_id] = asyncio.create_task(
+                self._flush_deltas_after(site_id, max(DELTA_MERGE_WINDOW - elapsed, 0.0))
+            )
+    
+    async def _flush_deltas_after(self, site_id: str, delay: float):
+        """병합 대기 중인 Delta 일괄 전송"""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._delta_flush_tasks.pop(site_id, None)
+        
+        pending = self._pending_deltas.pop(site_id, None)
+        if not pending:
+            return
+        
+        try:
+            await self._send_deltas(site_id, list(pending.values()))
+        except Exception as e:
+            logger.error(f"❌ Delta 병합 전송 실패 ({site_id}): {e}")
+    
+    async def _send_deltas(self, site_id: str, deltas: List[EquipmentDelta]):
+        """Delta를 SiteFullData 메시지로 Full 구독자에게 브로드캐스트"""
+        self._last_delta_sent[site_id] = time.monotonic()
+        
+        full_data = SiteFullData(
+            site_id=site_id,
+            updates=deltas
+        )
+        
+        def render(subset: List[EquipmentDelta]) -> str:
+            # 설비 필터가 있는 클라이언트용 부분 프레임 (timestamp는 전체 프레임과 동일)
+            return dumps_text(SiteFullData(
+                site_id=site_id,
+                updates=subset,
+                timestamp=full_data.timestamp
+            ).to_dict())
+        
+        from .multi_site_handler import SubscriptionType
+        await self._ws_handler.broadcast_items_to_room(
+            site_id,
+            dumps_text(full_data.to_dict()),
+            [(delta.equipment_id, delta) for delta in deltas],
+            render,
+            SubscriptionType.FULL
+        )
+    
+    def _cancel_delta_flush(self, site_id: str):
+        """Site의 병합 대기 Delta 폐기"""
+        task = self._delta_flush_tasks.pop(site_id, None)
+        if task and not task.done():
+            task.cancel()
+        self._pending_deltas.pop(site_id, None)
+        self._last_delta_sent.pop(site_id, None)
     
     # ============================================
     # 데이터 수집
@@ -461,24 +664,32 @@ class SummaryStreamService:
             # TODO: 실제 DB 조회 구현
             # UDS Service를 통해 데이터 조회
             
-            # Mock 데이터 (개발용)
-            import random
+            # Mock 데이터 (개발용) - 필드별로 한 번에 생성
+            # (.tolist()로 Python 기본 타입 변환: numpy 스칼라는 JSON 직렬화 불가)
+            equipment_count = _MOCK_EQUIPMENT_COUNT
+            rng = _mock_rng
             
-            equipment_count = 117
-            data = {}
+            # 상태는 인덱스로 뽑아 _MOCK_STATUSES의 문자열 객체를 그대로 재사용
+            status_indices = rng.choice(
+                len(_MOCK_STATUSES), size=equipment_count, p=_MOCK_STATUS_WEIGHTS
+            ).tolist()
+            cpus = rng.uniform(20, 80, equipment_count).round(1).tolist()
+            memories = rng.uniform(40, 90, equipment_count).round(1).tolist()
+            production_counts = rng.integers(100, 501, equipment_count).tolist()
+            tact_times = rng.uniform(8, 15, equipment_count).round(2).tolist()
             
-            for eq_id in range(1, equipment_count + 1):
-                statuses = ["RUN", "IDLE", "STOP", "DISC"]
-                weights = [0.7, 0.15, 0.1, 0.05]
-                
+            frontend_ids = self._frontend_ids
+            data = {}
+            for index in range(equipment_count):
+                eq_id = index + 1
                 data[eq_id] = {
                     "equipment_id": eq_id,
-                    "frontend_id": f"EQ-{(eq_id - 1) // 6 + 1:02d}-{(eq_id - 1) % 6 + 1:02d}",
-                    "status": random.choices(statuses, weights=weights)[0],
-                    "cpu": round(random.uniform(20, 80), 1),
-                    "memory": round(random.uniform(40, 90), 1),
-                    "production_count": random.randint(100, 500),
-                    "tact_time": round(random.uniform(8, 15), 2)
+                    "frontend_id": frontend_ids[index],
+                    "status": _MOCK_STATUSES[status_indices[index]],
+                    "cpu": cpus[index],
+                    "memory": memories[index],
+                    "production_count": production_counts[index],
+                    "tact_time": tact_times[index]
                 }
             
             return data
@@ -495,7 +706,9 @@ class SummaryStreamService:
         """서비스 상태 조회"""
         return {
             "active_sites": list(self._active_sites),
-            "active_streams": list(self._stream_tasks.keys()),
+            "active_streams": [
+                f"{site_id}:{stream_type}" for site_id, stream_type in self._stream_tasks
+            ],
             "cache_count": len(self._caches),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
@@ -503,8 +716,8 @@ class SummaryStreamService:
     def is_streaming(self, site_id: str, stream_type: Optional[str] = None) -> bool:
         """스트리밍 중인지 확인"""
         if stream_type:
-            return f"{site_id}:{stream_type}" in self._stream_tasks
-        return any(k.startswith(site_id) for k in self._stream_tasks)
+            return (site_id, stream_type) in self._stream_tasks
+        return bool(self._active_sites.get(site_id))
 
 
 # ============================================
@@ -20,6 +20,19 @@ from backend.api.database.multi_connection_manager import connection_manager
 console = Console()
 
 
+def _grouped_rows(grouped, format_value):
+    """
+    {site_id: {db_name: value}} 또는 {site_id: [db_name, ...]} 구조를 테이블 행으로 변환
+    
+    같은 사이트의 두 번째 행부터는 사이트 칸을 비워 둡니다.
+    """
+    return [
+        (site_id if i == 0 else "", db_name, format_value(db_name, entries))
+        for site_id, entries in grouped.items()
+        for i, db_name in enumerate(entries)
+    ]
+
+
 @click.group()
 def cli():
     """데이터베이스 연결 관리 도구"""
@@ -51,10 +64,9 @@ def status():
     table.add_column("데이터베이스", style="green")
     table.add_column("상태", style="yellow")
     
-    for site_id, db_list in summary['enabled_connections'].items():
-        for i, db_name in enumerate(db_list):
-            site_display = site_id if i == 0 else ""
-            table.add_row(site_display, db_name, "✓ 활성화")
+    rows = _grouped_rows(summary['enabled_connections'], lambda db_name, dbs: "✓ 활성화")
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -167,11 +179,12 @@ def test():
     table.add_column("데이터베이스", style="green")
     table.add_column("결과", style="yellow")
     
-    for site_id, db_results in results.items():
-        for i, (db_name, status) in enumerate(db_results.items()):
-            site_display = site_id if i == 0 else ""
-            result = "[green]✓ 성공[/]" if status else "[red]✗ 실패[/]"
-            table.add_row(site_display, db_name, result)
+    rows = _grouped_rows(
+        results,
+        lambda db_name, db_results: "[green]✓ 성공[/]" if db_results[db_name] else "[red]✗ 실패[/]"
+    )
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -0,0 +1,47 @@
+# backend/config/env_loader.py
+"""
+.env 파일 로드 (파싱 결과 캐시)
+
+settings.py와 multi_site_settings.py가 같은 .env를 각각 로드하므로,
+파일이 바뀌지 않았으면 다시 읽지 않고 캐시된 값만 환경 변수에 반영합니다.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from dotenv import dotenv_values
+
+# .env 파싱 결과 캐시: 경로 -> (mtime_ns, 파싱 결과)
+_ENV_FILE_CACHE: Dict[Path, Tuple[int, Dict[str, Optional[str]]]] = {}
+
+
+def load_env_file(env_file: Path, override: bool = False) -> bool:
+    """
+    .env 파일을 환경 변수에 반영 (load_dotenv와 동일한 규칙, 단 ${VAR} 치환은 파일 값 우선)
+    
+    Args:
+        env_file: .env 파일 경로
+        override: True면 이미 설정된 환경 변수도 덮어씀
+    
+    Returns:
+        bool: 파일이 있으면 True
+    """
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    
+    cached = _ENV_FILE_CACHE.get(env_file)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, dotenv_values(env_file))
+        _ENV_FILE_CACHE[env_file] = cached
+    
+    for key, value in cached[1].items():
+        # 값 없이 키만 있는 줄은 load_dotenv와 같이 무시
+        if value is None:
+            continue
+        if override or key not in os.environ:
+            os.environ[key] = value
+    
+    return True
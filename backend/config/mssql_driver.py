@@ -0,0 +1,48 @@
+# backend/config/mssql_driver.py
+"""
+MSSQL ODBC 드라이버 감지 (결과 캐시)
+
+settings.py와 multi_site_settings.py가 같은 감지 결과를 공유합니다.
+설치된 드라이버는 프로세스 실행 중 바뀌지 않으므로 최초 1회만 감지합니다.
+"""
+
+from functools import cache
+
+# 우선순위: Driver 18 > Driver 17 > 기타
+PREFERRED_MSSQL_DRIVERS = (
+    'ODBC Driver 18 for SQL Server',
+    'ODBC Driver 17 for SQL Server',
+    'ODBC Driver 13 for SQL Server',
+    'SQL Server Native Client 11.0',
+    'SQL Server',
+)
+
+DEFAULT_MSSQL_DRIVER = 'ODBC Driver 17 for SQL Server'
+
+
+@cache
+def detect_mssql_driver() -> str:
+    """
+    설치된 MSSQL ODBC 드라이버 자동 감지
+    
+    Returns:
+        str: 드라이버 이름 (예: 'ODBC Driver 18 for SQL Server')
+    """
+    try:
+        import pyodbc
+    except ImportError:
+        print("⚠ pyodbc를 찾을 수 없습니다. 기본 드라이버를 사용합니다.")
+        return DEFAULT_MSSQL_DRIVER
+    
+    drivers = pyodbc.drivers()
+    
+    for driver in PREFERRED_MSSQL_DRIVERS:
+        if driver in drivers:
+            return driver
+    
+    # SQL Server 관련 드라이버 찾기
+    for driver in drivers:
+        if 'SQL Server' in driver:
+            return driver
+    
+    return DEFAULT_MSSQL_DRIVER
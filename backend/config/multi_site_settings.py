@@ -7,10 +7,20 @@ Pydantic v2 호환 버전
 import os
 import json
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from dotenv import load_dotenv
+
+from .env_loader import load_env_file
+from .mssql_driver import detect_mssql_driver
+
+# orjson (optional) - 미설치 시 표준 json 사용
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 예외 처리는 동일
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -18,8 +28,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 def load_environment():
     """환경 변수 로드"""
     env_file = PROJECT_ROOT / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
+    if load_env_file(env_file):
         print(f"✓ .env 파일 로드: {env_file}")
         return True
     else:
@@ -27,45 +36,39 @@ def load_environment():
         return False
 
 
+# 설정 파일 파싱 결과 캐시: 경로 -> (mtime_ns, 파싱 결과)
+# 파일이 바뀌지 않았으면 MultiSiteSettings를 다시 만들 때 재파싱하지 않음
+_CONFIG_FILE_CACHE: Dict[Path, Tuple[int, dict]] = {}
+
+
+def _load_config_file(config_path: Path) -> dict:
+    """
+    JSON 설정 파일 로드 (mtime 기준 캐시)
+    
+    반환된 dict는 캐시와 공유되므로 수정하지 않아야 합니다.
+    """
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _CONFIG_FILE_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    parsed = _json_loads(config_path.read_bytes())
+    _CONFIG_FILE_CACHE[config_path] = (mtime_ns, parsed)
+    return parsed
+
+
 class DatabaseConfig:
     """개별 데이터베이스 설정"""
     
     @staticmethod
     def get_mssql_driver():
         """
-        설치된 MSSQL ODBC 드라이버 자동 감지
+        설치된 MSSQL ODBC 드라이버 자동 감지 (결과는 프로세스 단위로 캐시)
         
         Returns:
             str: 드라이버 이름 (예: 'ODBC Driver 18 for SQL Server')
         """
-        try:
-            import pyodbc
-            drivers = pyodbc.drivers()
-            
-            # 우선순위: Driver 18 > Driver 17 > 기타
-            preferred_drivers = [
-                'ODBC Driver 18 for SQL Server',
-                'ODBC Driver 17 for SQL Server',
-                'ODBC Driver 13 for SQL Server',
-                'SQL Server Native Client 11.0',
-                'SQL Server'
-            ]
-            
-            for driver in preferred_drivers:
-                if driver in drivers:
-                    return driver
-            
-            # SQL Server 관련 드라이버 찾기
-            for driver in drivers:
-                if 'SQL Server' in driver:
-                    return driver
-            
-            # 기본값
-            return 'ODBC Driver 17 for SQL Server'
-            
-        except ImportError:
-            print("⚠ pyodbc를 찾을 수 없습니다. 기본 드라이버를 사용합니다.")
-            return 'ODBC Driver 17 for SQL Server'
+        return detect_mssql_driver()
     
     def __init__(self, site_id: str, db_key: str, config: dict):
         self.site_id = site_id
@@ -82,10 +85,19 @@ class DatabaseConfig:
             self.odbc_driver = self.get_mssql_driver()
         else:
             self.odbc_driver = None
+        
+        # 연결 URL은 생성 시 1회만 조립 (지원하지 않는 타입은 None)
+        self._connection_url = self._build_connection_url()
     
     @property
     def connection_url(self) -> str:
-        """연결 URL 생성"""
+        """연결 URL"""
+        if self._connection_url is None:
+            raise ValueError(f"Unsupported database type: {self.db_type}")
+        return self._connection_url
+    
+    def _build_connection_url(self) -> Optional[str]:
+        """연결 URL 생성 (지원하지 않는 타입이면 None)"""
         if self.db_type == 'postgresql':
             return (
                 f"postgresql://{self.user}:{self.password}@"
@@ -111,7 +123,7 @@ class DatabaseConfig:
                 f"&Encrypt=yes"
             )
         else:
-            raise ValueError(f"Unsupported database type: {self.db_type}")
+            return None
     
     def __repr__(self):
         return f"<DatabaseConfig {self.site_id}:{self.db_key} @ {self.host}>"
@@ -168,7 +180,7 @@ class MultiSiteSettings(BaseSettings):
         # 방법 1: DATABASE_SITES (JSON 문자열)
         if self.DATABASE_SITES:
             try:
-                self._sites_config = json.loads(self.DATABASE_SITES)
+                self._sites_config = _json_loads(self.DATABASE_SITES)
                 print("✓ DATABASE_SITES JSON 파싱 성공")
             except json.JSONDecodeError as e:
                 print(f"✗ DATABASE_SITES JSON 파싱 실패: {e}")
@@ -182,8 +194,7 @@ class MultiSiteSettings(BaseSettings):
                 raise ValueError(f"데이터베이스 설정 파일을 찾을 수 없음: {config_path}")
             
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    self._sites_config = json.load(f)
+                self._sites_config = _load_config_file(config_path)
                 print(f"✓ 설정 파일 로드: {config_path}")
             except json.JSONDecodeError as e:
                 raise ValueError(f"설정 파일 JSON 파싱 실패: {e}")
@@ -7,10 +7,11 @@
 
 import os
 from pathlib import Path
-from typing import Optional
-from pydantic import Field, field_validator
+from typing import Annotated, Any, List, Literal, Optional
+from pydantic import BeforeValidator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from dotenv import load_dotenv
+from .env_loader import load_env_file
+from .mssql_driver import detect_mssql_driver
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -24,21 +25,25 @@ def load_environment():
     """환경 변수 로드"""
     # 기본 .env 파일 로드
     env_file = PROJECT_ROOT / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
+    if load_env_file(env_file):
         print(f"✓ .env 파일 로드됨: {env_file}")
     
     # 환경별 .env 파일 로드 (우선순위 높음)
     environment = os.getenv('ENVIRONMENT', 'development')
     env_specific_file = PROJECT_ROOT / f'.env.{environment}'
     
-    if env_specific_file.exists():
-        load_dotenv(env_specific_file, override=True)
+    if load_env_file(env_specific_file, override=True):
         print(f"✓ .env.{environment} 파일 로드됨: {env_specific_file}")
     
     return environment
 
 
+# 허용 값 타입 (문자열만 대소문자 정규화 후 Literal 검증, 문자열이 아니면 ValidationError)
+DatabaseType = Annotated[Literal['postgresql', 'mysql', 'mssql'], BeforeValidator(lambda v: v.lower() if isinstance(v, str) else v)]
+LogLevel = Annotated[Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], BeforeValidator(lambda v: v.upper() if isinstance(v, str) else v)]
+EnvironmentType = Annotated[Literal['development', 'production', 'test'], BeforeValidator(lambda v: v.lower() if isinstance(v, str) else v)]
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정 - Pydantic v2"""
     
@@ -47,43 +52,19 @@ class Settings(BaseSettings):
         env_file='.env',
         env_file_encoding='utf-8',
         case_sensitive=True,
-        extra='ignore'  # 추가 필드 무시 (다른 설정 파일과 충돌 방지)
+        extra='ignore',  # 추가 필드 무시 (다른 설정 파일과 충돌 방지)
+        frozen=True      # 로드 후 변경 불가 (파생 값을 생성 시 1회만 계산)
     )
     
     @staticmethod
     def get_mssql_driver():
         """
-        설치된 MSSQL ODBC 드라이버 자동 감지
+        설치된 MSSQL ODBC 드라이버 자동 감지 (결과는 프로세스 단위로 캐시)
         
         Returns:
             str: 드라이버 이름
         """
-        try:
-            import pyodbc
-            drivers = pyodbc.drivers()
-            
-            # 우선순위: Driver 18 > Driver 17 > 기타
-            preferred_drivers = [
-                'ODBC Driver 18 for SQL Server',
-                'ODBC Driver 17 for SQL Server',
-                'ODBC Driver 13 for SQL Server',
-                'SQL Server Native Client 11.0',
-                'SQL Server'
-            ]
-            
-            for driver in preferred_drivers:
-                if driver in drivers:
-                    return driver
-            
-            # SQL Server 관련 드라이버 찾기
-            for driver in drivers:
-                if 'SQL Server' in driver:
-                    return driver
-            
-            return 'ODBC Driver 17 for SQL Server'
-            
-        except ImportError:
-            return 'ODBC Driver 17 for SQL Server'
+        return detect_mssql_driver()
     
     # =============================================================================
     # DATABASE CONFIGURATION
@@ -94,7 +75,7 @@ class Settings(BaseSettings):
     REMOTE_DB_NAME: Optional[str] = Field(default=None)
     REMOTE_DB_USER: Optional[str] = Field(default=None)
     REMOTE_DB_PASSWORD: Optional[str] = Field(default=None)
-    DATABASE_TYPE: str = Field(default='postgresql')
+    DATABASE_TYPE: DatabaseType = Field(default='postgresql')
     
     # =============================================================================
     # CONNECTION POOL SETTINGS
@@ -110,9 +91,9 @@ class Settings(BaseSettings):
     # APPLICATION SETTINGS
     # =============================================================================
     
-    ENVIRONMENT: str = Field(default='development')
+    ENVIRONMENT: EnvironmentType = Field(default='development')
     APP_PORT: int = Field(default=8000)
-    LOG_LEVEL: str = Field(default='INFO')
+    LOG_LEVEL: LogLevel = Field(default='INFO')
     
     # =============================================================================
     # SECURITY SETTINGS
@@ -138,42 +119,33 @@ class Settings(BaseSettings):
     WEBSOCKET_INTERVAL: int = Field(default=1)
     
     # =============================================================================
-    # VALIDATORS (Pydantic v2 스타일)
+    # COMPUTED PROPERTIES
     # =============================================================================
     
-    @field_validator('DATABASE_TYPE')
-    @classmethod
-    def validate_database_type(cls, v: str) -> str:
-        """데이터베이스 타입 검증"""
-        allowed_types = ['postgresql', 'mysql', 'mssql']
-        if v.lower() not in allowed_types:
-            raise ValueError(f"DATABASE_TYPE must be one of {allowed_types}")
-        return v.lower()
+    # 파생 값 캐시 (pydantic 필드가 아님, model_post_init/model_copy에서 계산)
+    _database_url: Optional[str] = None
+    _cors_origins_list: List[str] = []
     
-    @field_validator('LOG_LEVEL')
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """로그 레벨 검증"""
-        allowed_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in allowed_levels:
-            raise ValueError(f"LOG_LEVEL must be one of {allowed_levels}")
-        return v.upper()
-    
-    @field_validator('ENVIRONMENT')
-    @classmethod
-    def validate_environment(cls, v: str) -> str:
-        """환경 검증"""
-        allowed_envs = ['development', 'production', 'test']
-        if v.lower() not in allowed_envs:
-            raise ValueError(f"ENVIRONMENT must be one of {allowed_envs}")
-        return v.lower()
+    def model_post_init(self, __context: Any) -> None:
+        """설정은 frozen이므로 파생 값을 생성 시 1회만 계산"""
+        self._database_url = self._build_database_url()
+        if self.CORS_ORIGINS == '*':
+            self._cors_origins_list = ['*']
+        else:
+            self._cors_origins_list = [origin.strip() for origin in self.CORS_ORIGINS.split(',')]
     
-    # =============================================================================
-    # COMPUTED PROPERTIES
-    # =============================================================================
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> 'Settings':
+        """복사본은 model_post_init을 거치지 않으므로 파생 값을 다시 계산"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
     
     @property
     def database_url(self) -> Optional[str]:
+        """데이터베이스 연결 URL"""
+        return self._database_url
+    
+    def _build_database_url(self) -> Optional[str]:
         """데이터베이스 연결 URL 생성"""
         # 필수 필드가 없으면 None 반환
         if not all([self.REMOTE_DB_HOST, self.REMOTE_DB_USER, 
@@ -211,10 +183,8 @@ class Settings(BaseSettings):
     
     @property
     def cors_origins_list(self) -> list:
-        """CORS 허용 도메인 리스트 반환"""
-        if self.CORS_ORIGINS == '*':
-            return ['*']
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(',')]
+        """CORS 허용 도메인 리스트 반환 (읽기 전용으로 사용)"""
+        return self._cors_origins_list
     
     @property
     def is_development(self) -> bool:
@@ -8,23 +8,58 @@
 import simpy
 import numpy as np
 import asyncio
-import aioredis
+from collections import deque
+from redis import asyncio as redis_asyncio
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 import json
+import logging
 import sys
+import threading
+import time
 from pathlib import Path
 
+# orjson (optional) - 미설치 시 표준 json 사용
+try:
+    import orjson
+    
+    def _dumps(data: dict) -> bytes:
+        # numpy 스칼라가 섞여도 직렬화되도록 OPT_SERIALIZE_NUMPY
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _dumps = json.dumps
+
+# uvloop (optional, Windows 미지원) - 발행 worker의 이벤트 루프 오버헤드 감소
+try:
+    import uvloop
+    _uvloop_available = True
+except ImportError:
+    _uvloop_available = False
+
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from utils.logging_config import get_simulator_logger
+try:
+    from utils.logging_config import get_simulator_logger
+except ImportError:
+    # utils.logging_config가 없는 환경 (테스트 등) - 표준 logging 사용
+    def get_simulator_logger(level: str = "INFO") -> logging.Logger:
+        simulator_logger = logging.getLogger("simulator")
+        simulator_logger.setLevel(level)
+        return simulator_logger
 
 # 로거 초기화
 logger = get_simulator_logger(level="INFO")
 
+# 생산 사이클 난수 버퍼 크기 (설비별로 한 번에 생성, 소진 시 재생성)
+RANDOM_BUFFER_SIZE = 256
+# 고장/수리 시간 난수 버퍼 크기 (고장은 드물어 작게 유지)
+FAILURE_BUFFER_SIZE = 32
+# 시뮬레이션 1시간당 실제 경과 초 (3600 → 실시간, tick 1회(1/3600h)가 실제 1초)
+REALTIME_FACTOR = 3600
+
 
 @dataclass
 class EquipmentConfig:
@@ -50,120 +85,169 @@ class Equipment:
         self.temperature = config.temperature_baseline
         self.current_batch = None
         
+        # 생산 사이클용 난수 버퍼 (사이클마다 스칼라 난수 호출 대신 일괄 생성)
+        self._refill_random_buffers()
+        # (고장 시간, 수리 시간) 난수 쌍 (첫 고장 판정 시 생성)
+        self._failure_samples = iter(())
+        
         # 프로세스 시작
+        # (상태 모니터링은 ProductionSimulator의 공용 tick에서 tick_once() 호출)
         self.process = env.process(self.run())
         self.failure_process = env.process(self.failure_cycle())
-        self.monitoring_process = env.process(self.monitor())
         
         logger.debug(f"설비 초기화: {self.config.id} (row={config.row}, col={config.col})")
         
+    def _refill_random_buffers(self):
+        """
+        생산 사이클 난수 RANDOM_BUFFER_SIZE개 일괄 생성
+        
+        .tolist()로 Python float/bool 변환 (이후 스칼라 연산은 numpy 스칼라보다 빠름)
+        """
+        cycle_time = self.config.cycle_time
+        # 실제 사이클 타임 (변동 ±10%)
+        self._cycle_buf = np.random.normal(
+            cycle_time, cycle_time * 0.1, RANDOM_BUFFER_SIZE
+        ).tolist()
+        # 작업 중 온도 상승
+        self._heat_buf = np.random.uniform(0.5, 1.5, RANDOM_BUFFER_SIZE).tolist()
+        # 불량 여부 (2%)
+        self._defect_buf = (np.random.random(RANDOM_BUFFER_SIZE) < 0.02).tolist()
+        self._buf_i = 0
+    
+    def _next_failure_times(self) -> Tuple[float, float]:
+        """
+        다음 (고장까지 시간, 수리 시간) 반환 (지수 분포, 소진 시 FAILURE_BUFFER_SIZE개 일괄 생성)
+        """
+        sample = next(self._failure_samples, None)
+        if sample is None:
+            self._failure_samples = zip(
+                np.random.exponential(self.config.mtbf, FAILURE_BUFFER_SIZE).tolist(),
+                np.random.exponential(self.config.mttr, FAILURE_BUFFER_SIZE).tolist()
+            )
+            sample = next(self._failure_samples)
+        return sample
+    
     def run(self):
-        """생산 프로세스"""
+        """
+        생산 프로세스
+        
+        고장 시 failure_cycle이 interrupt하면 진행 중 사이클을 버리고 수리 완료까지 대기
+        (down 상태에서 0.1h마다 깨어나 상태를 재확인하지 않음)
+        """
         while True:
-            if self.status == "running":
-                # 생산 사이클 시작
-                cycle_start = self.env.now
-                
-                # 실제 사이클 타임 (변동 ±10%)
-                actual_cycle = np.random.normal(
-                    self.config.cycle_time, 
-                    self.config.cycle_time * 0.1
-                )
-                
+            # 생산 사이클 시작
+            cycle_start = self.env.now
+            
+            if self._buf_i == RANDOM_BUFFER_SIZE:
+                self._refill_random_buffers()
+            i = self._buf_i
+            self._buf_i = i + 1
+            
+            # 실제 사이클 타임 (변동 ±10%)
+            actual_cycle = self._cycle_buf[i]
+            
+            try:
                 yield self.env.timeout(actual_cycle / 3600)  # 시간 단위로 변환
-                
-                # 생산 완료
-                self.production_count += 1
-                self.runtime_hours += actual_cycle / 3600
-                
-                # 온도 상승 (작업 중)
-                self.temperature += np.random.uniform(0.5, 1.5)
-                
-                # 불량 확률 (2%)
-                is_defect = np.random.random() < 0.02
-                
-                # 데이터 발행
-                self.emit_production_data(is_defect, actual_cycle)
-                
-                if self.production_count % 100 == 0:
-                    logger.info(
-                        f"{self.config.id}: {self.production_count}개 생산 완료 "
-                        f"(온도: {self.temperature:.1f}°C)"
-                    )
-                
-            else:
-                # idle 또는 down 상태에서는 대기
-                yield self.env.timeout(0.1)
+            except simpy.Interrupt:
+                # 고장 발생 → 수리 완료까지 대기
+                yield self._resume_event
+                continue
+            
+            # 생산 완료
+            self.production_count += 1
+            self.runtime_hours += actual_cycle / 3600
+            
+            # 온도 상승 (작업 중)
+            self.temperature += self._heat_buf[i]
+            
+            # 불량 확률 (2%)
+            is_defect = self._defect_buf[i]
+            
+            # 데이터 발행
+            self.emit_production_data(is_defect, actual_cycle)
+            
+            if self.production_count % 100 == 0:
+                logger.info(
+                    "%s: %d개 생산 완료 (온도: %.1f°C)",
+                    self.config.id, self.production_count, self.temperature
+                )
                 
     def failure_cycle(self):
         """고장 발생 프로세스"""
         while True:
-            # MTBF 기반 고장 시간 계산 (지수 분포)
-            time_to_failure = np.random.exponential(self.config.mtbf)
+            # MTBF 기반 고장 시간, MTTR 기반 수리 시간 (지수 분포)
+            time_to_failure, repair_time = self._next_failure_times()
             yield self.env.timeout(time_to_failure)
             
             # 고장 발생
             if self.status == "running":
                 logger.warning(
-                    f"[{self.env.now:.2f}h] {self.config.id} - 고장 발생 "
-                    f"(MTBF: {self.config.mtbf:.1f}h)"
+                    "[%.2fh] %s - 고장 발생 (MTBF: %.1fh)",
+                    self.env.now, self.config.id, self.config.mtbf
                 )
                 self.status = "down"
+                self._resume_event = self.env.event()
+                self.process.interrupt("down")
                 self.emit_alarm("EQUIPMENT_DOWN", "CRITICAL")
                 
-                # MTTR 기반 수리 시간
-                repair_time = np.random.exponential(self.config.mttr)
+                # 수리
                 yield self.env.timeout(repair_time)
                 
                 # 수리 완료
                 logger.info(
-                    f"[{self.env.now:.2f}h] {self.config.id} - 수리 완료 "
-                    f"(수리 시간: {repair_time:.2f}h)"
+                    "[%.2fh] %s - 수리 완료 (수리 시간: %.2fh)",
+                    self.env.now, self.config.id, repair_time
                 )
                 self.status = "running"
                 self.temperature = self.config.temperature_baseline
                 self.emit_alarm("EQUIPMENT_RESTORED", "INFO")
+                self._resume_event.succeed()
                 
-    def monitor(self):
-        """상태 모니터링 프로세스 (1초마다)"""
-        while True:
-            yield self.env.timeout(1/3600)  # 1초 = 1/3600 시간
-            
-            # 온도 자연 냉각
-            if self.status != "running":
-                self.temperature = max(
-                    self.temperature - 0.1,
-                    self.config.temperature_baseline
-                )
-            
-            # 상태 데이터 발행
-            self.emit_status_data()
-            
-            # 온도 알람 체크
-            if self.temperature > 85:
-                logger.warning(
-                    f"{self.config.id} - 높은 온도 감지: {self.temperature:.1f}°C"
-                )
-                self.emit_alarm("TEMP_HIGH", "WARNING")
+    def tick_once(self, timestamp: Optional[str] = None) -> dict:
+        """
+        상태 모니터링 1회 (ProductionSimulator가 1초마다 호출)
+        
+        Args:
+            timestamp: 이번 tick의 ISO 시각 (tick마다 1회 생성해 전체 설비가 공유)
+        
+        Returns:
+            dict: 이번 tick의 상태 행 (equipment_snapshot에 포함)
+        """
+        # 온도 자연 냉각
+        if self.status != "running":
+            self.temperature = max(
+                self.temperature - 0.1,
+                self.config.temperature_baseline
+            )
+        
+        # 온도 알람 체크
+        if self.temperature > 85:
+            logger.warning(
+                "%s - 높은 온도 감지: %.1f°C", self.config.id, self.temperature
+            )
+            self.emit_alarm("TEMP_HIGH", "WARNING", timestamp)
+        
+        return self.status_row()
                 
-    def emit_status_data(self):
-        """상태 데이터 발행"""
-        data = {
-            "type": "equipment_status",
-            "timestamp": datetime.now().isoformat(),
+    def status_row(self) -> dict:
+        """
+        상태 데이터 1행 (발행은 ProductionSimulator가 전체 설비 묶음으로 처리)
+        
+        dict 리터럴로 매번 생성 (발행 전까지 대기열에 남으므로 dict 재사용 불가)
+        (equipment_id는 설비별 config.id 문자열 하나를 계속 참조하므로 intern 불필요)
+        
+        실수 값은 round() 없이 그대로 전달 (표시 자릿수는 소비 측에서 처리)
+        """
+        return {
             "equipment_id": self.config.id,
-            "data": {
-                "row": self.config.row,
-                "col": self.config.col,
-                "status": self.status,
-                "temperature": round(self.temperature, 1),
-                "runtime_hours": round(self.runtime_hours, 2),
-                "production_count": self.production_count,
-                "current_oee": self.calculate_oee()
-            }
+            "row": self.config.row,
+            "col": self.config.col,
+            "status": self.status,
+            "temperature": self.temperature,
+            "runtime_hours": self.runtime_hours,
+            "production_count": self.production_count,
+            "current_oee": self.calculate_oee()
         }
-        # Redis/WebSocket으로 전송 (비동기 큐에 추가)
-        asyncio.create_task(publish_data(data))
         
     def emit_production_data(self, is_defect: bool, cycle_time: float):
         """생산 데이터 발행"""
@@ -174,21 +258,21 @@ class Equipment:
             "data": {
                 "quantity_produced": 1,
                 "defect_count": 1 if is_defect else 0,
-                "cycle_time": round(cycle_time, 1),
+                "cycle_time": cycle_time,
                 "yield_rate": 0 if is_defect else 100
             }
         }
         
         if is_defect:
-            logger.debug(f"{self.config.id} - 불량 발생 (사이클: {cycle_time:.1f}초)")
+            logger.debug("%s - 불량 발생 (사이클: %.1f초)", self.config.id, cycle_time)
         
-        asyncio.create_task(publish_data(data))
+        enqueue_data(data)
         
-    def emit_alarm(self, code: str, severity: str):
+    def emit_alarm(self, code: str, severity: str, timestamp: Optional[str] = None):
         """알람 발행"""
         data = {
             "type": "alarm",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "equipment_id": self.config.id,
             "data": {
                 "code": code,
@@ -197,7 +281,7 @@ class Equipment:
                 "acknowledged": False
             }
         }
-        asyncio.create_task(publish_data(data))
+        enqueue_data(data)
         
     def calculate_oee(self) -> float:
         """OEE 계산 (간단한 버전)"""
@@ -206,14 +290,28 @@ class Equipment:
         availability = 1.0 if self.status == "running" else 0.0
         performance = 0.9  # 임시값
         quality = 0.98  # 임시값
-        return round(availability * performance * quality * 100, 1)
+        return availability * performance * quality * 100
 
 
 class ProductionSimulator:
     """전체 생산 시스템 시뮬레이터"""
     
-    def __init__(self, equipment_configs: List[EquipmentConfig]):
-        self.env = simpy.Environment()
+    def __init__(
+        self,
+        equipment_configs: List[EquipmentConfig],
+        realtime_factor: Optional[float] = REALTIME_FACTOR
+    ):
+        """
+        Args:
+            equipment_configs: 설비 설정 목록
+            realtime_factor: 시뮬레이션 1시간당 실제 경과 초
+                (None이면 실시간 대기 없이 최대 속도로 실행, 테스트용)
+        """
+        if realtime_factor is None:
+            self.env = simpy.Environment()
+        else:
+            # 이벤트 시각까지 실제 시간 대기 (strict=False: 처리가 늦어져도 예외 없이 따라잡음)
+            self.env = simpy.RealtimeEnvironment(factor=realtime_factor, strict=False)
         self.equipment_list = []
         
         logger.info(f"시뮬레이터 초기화 중: {len(equipment_configs)}대 설비")
@@ -223,51 +321,200 @@ class ProductionSimulator:
             equipment = Equipment(self.env, config)
             self.equipment_list.append(equipment)
         
+        # 중지 요청 (다른 스레드에서 stop() 호출 → 다음 tick에서 _stopped 발생)
+        self._stop_requested = threading.Event()
+        self._stopped = self.env.event()
+        
+        # 전체 설비 상태 모니터링 (설비별 프로세스 대신 공용 프로세스 1개)
+        self.monitoring_process = self.env.process(self._tick())
+        
         logger.info(f"✓ 시뮬레이터 초기화 완료: {len(self.equipment_list)}대 설비")
+    
+    def _tick(self):
+        """
+        상태 모니터링 프로세스 (1초마다 전체 설비 1회씩)
+        
+        냉각/알람 판정은 설비 객체별로 유지 (설비별 SimPy 프로세스가 같은 상태를 갱신)
+        
+        상태 데이터는 설비별 메시지 대신 equipment_snapshot 1건으로 발행
+        (tick당 Redis publish 117회 → 1회)
+        """
+        while True:
+            yield self.env.timeout(1/3600)  # 1초 = 1/3600 시간
+            
+            # SimPy 이벤트는 스레드 안전하지 않으므로 시뮬레이션 스레드에서 발생시킴
+            if self._stop_requested.is_set():
+                self._stopped.succeed()
+                return
+            
+            # 같은 tick의 상태 데이터는 같은 시각 문자열 사용 (설비마다 datetime 생성 방지)
+            timestamp = datetime.now().isoformat()
+            enqueue_data({
+                "type": "equipment_snapshot",
+                "timestamp": timestamp,
+                "equipment": [
+                    equipment.tick_once(timestamp)
+                    for equipment in self.equipment_list
+                ]
+            })
         
     def run(self, duration_hours: float = None):
         """시뮬레이션 실행"""
         try:
             if duration_hours:
                 logger.info(f"시뮬레이션 시작: {duration_hours}시간 동안")
-                self.env.run(until=duration_hours)
+                self.env.run(until=self.env.any_of([
+                    self.env.timeout(duration_hours), self._stopped
+                ]))
                 logger.info(f"시뮬레이션 완료: {duration_hours}시간 경과")
             else:
                 logger.info("시뮬레이션 시작: 무한 실행 모드")
-                self.env.run()
+                self.env.run(until=self._stopped)
         except KeyboardInterrupt:
             logger.info("사용자에 의해 시뮬레이션 중단됨")
             raise
         except Exception as e:
             logger.error(f"시뮬레이션 실행 중 오류 발생: {e}", exc_info=True)
             raise
+    
+    def stop(self):
+        """시뮬레이션 중지 요청 (다른 스레드에서 호출 가능)"""
+        self._stop_requested.set()
 
 
 # ============================================================================
 # 데이터 발행 함수
 # ============================================================================
 
-redis_client = None
+redis_client: Optional[redis_asyncio.Redis] = None
+
+# Redis 연결 설정 (발행은 _publisher_worker 하나가 pipeline으로 처리하므로 작은 풀로 충분)
+REDIS_URL = 'redis://localhost'
+REDIS_MAX_CONNECTIONS = 4
+
+# 발행 대기열 설정
+# emit_*는 대기열에 적재만 하고, _publisher_worker가 pipeline으로 묶어 발행
+# (SimPy 코드는 이벤트 루프 밖에서 실행되므로 asyncio.Queue 대신 deque 사용,
+#  deque의 append/popleft는 CPython에서 원자적)
+# 대기열이 비면 _publisher_worker는 _publish_event를 기다리고,
+# enqueue_data가 call_soon_threadsafe로 깨움 (주기적 재확인 없음)
+PUBLISH_BATCH_SIZE = 100        # pipeline 1회당 최대 메시지 수
+PUBLISH_QUEUE_MAXSIZE = 10000   # 대기열 상한 (초과 시 버림)
+DROP_WARNING_INTERVAL = 10.0    # 버림 경고 최소 간격 (초)
+PUBLISHER_STOP_TIMEOUT = 5.0    # 종료 시 남은 대기열 발행 최대 대기 (초)
+
+publish_queue: deque = deque()
+publisher_task: Optional[asyncio.Task] = None
+dropped_count = 0
+_last_drop_warning = 0.0
+_publisher_stopping = False     # True면 대기열을 비운 뒤 _publisher_worker 종료
+_publish_loop: Optional[asyncio.AbstractEventLoop] = None   # _publisher_worker 실행 루프
+_publish_event: Optional[asyncio.Event] = None              # 대기열 적재 알림
+
+# 데이터 타입별 발행 채널 (매 발행마다 채널 문자열 생성 방지)
+CHANNELS = {
+    data_type: f"simulator:{data_type}".encode()
+    for data_type in ("equipment_snapshot", "production", "alarm")
+}
 
 async def init_redis():
     """Redis 연결"""
     global redis_client
     try:
-        redis_client = await aioredis.create_redis_pool('redis://localhost')
+        redis_client = redis_asyncio.from_url(REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS)
+        # 연결은 첫 명령 시 생성되므로 ping으로 연결 확인
+        await redis_client.ping()
         logger.info("✓ Redis 연결 성공")
         return True
     except Exception as e:
         logger.error(f"Redis 연결 실패: {e}", exc_info=True)
+        redis_client = None
         return False
     
-async def publish_data(data: dict):
-    """데이터를 Redis Pub/Sub로 발행"""
+def enqueue_data(data: dict):
+    """발행 대기열에 데이터 적재 (발행 작업이 없으면 무시, 대기열이 가득 차면 버림)"""
+    global dropped_count, _last_drop_warning
+    # Redis 미연결 시 _publisher_worker가 없으므로 쌓아도 처리되지 않음
+    if publisher_task is None:
+        return
+    
+    if len(publish_queue) < PUBLISH_QUEUE_MAXSIZE:
+        publish_queue.append(data)
+        # 대기 중인 _publisher_worker 깨우기 (이미 깨어 있으면 생략)
+        event = _publish_event
+        if event is not None and not event.is_set():
+            _publish_loop.call_soon_threadsafe(event.set)
+    else:
+        dropped_count += 1
+        now = time.monotonic()
+        if now - _last_drop_warning >= DROP_WARNING_INTERVAL:
+            _last_drop_warning = now
+            logger.warning(f"발행 대기열 가득 참 - 누적 {dropped_count}건 버림")
+
+
+async def publish_batch(batch: List[dict]):
+    """여러 데이터를 Redis pipeline 1회 왕복으로 발행"""
     if redis_client:
         try:
-            channel = f"simulator:{data['type']}"
-            await redis_client.publish(channel, json.dumps(data))
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for data in batch:
+                    data_type = data['type']
+                    channel = CHANNELS.get(data_type) or f"simulator:{data_type}"
+                    pipe.publish(channel, _dumps(data))
+                await pipe.execute()
         except Exception as e:
-            logger.error(f"데이터 발행 실패: {e}")
+            logger.error(f"데이터 발행 실패 ({len(batch)}건): {e}")
+
+
+async def _publisher_worker():
+    """
+    발행 대기열 처리
+    
+    대기열에 쌓인 메시지를 최대 PUBLISH_BATCH_SIZE건씩 묶어 발행하고,
+    비어 있으면 enqueue_data()가 깨울 때까지 대기합니다.
+    stop_publisher() 요청 후 대기열이 비면 종료합니다.
+    """
+    global _publish_loop, _publish_event
+    # enqueue_data()가 event를 보고 loop를 사용하므로 loop를 먼저 설정
+    _publish_loop = asyncio.get_running_loop()
+    _publish_event = asyncio.Event()
+    
+    while True:
+        if not publish_queue:
+            if _publisher_stopping:
+                return
+            # clear 후 다시 확인 (clear 직전에 적재되어 알림이 생략된 경우)
+            _publish_event.clear()
+            if not publish_queue:
+                await _publish_event.wait()
+            continue
+        
+        count = min(PUBLISH_BATCH_SIZE, len(publish_queue))
+        batch = [publish_queue.popleft() for _ in range(count)]
+        await publish_batch(batch)
+
+
+async def stop_publisher():
+    """
+    발행 작업 종료 (Redis 연결 종료 전에 호출)
+    
+    진행 중인 pipeline과 대기열에 남은 메시지를 모두 발행한 뒤 종료합니다.
+    PUBLISHER_STOP_TIMEOUT 안에 끝나지 않으면 취소합니다.
+    """
+    global publisher_task, _publisher_stopping
+    if publisher_task is None:
+        return
+    
+    _publisher_stopping = True
+    if _publish_event is not None:
+        _publish_event.set()
+    try:
+        await asyncio.wait_for(publisher_task, PUBLISHER_STOP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"발행 대기열 정리 시간 초과 - {len(publish_queue)}건 버림")
+    finally:
+        publisher_task = None
+        _publisher_stopping = False
 
 
 # ============================================================================
@@ -334,7 +581,6 @@ def create_equipment_layout() -> List[EquipmentConfig]:
             # 제외 위치 체크
             if (row, col) in excluded_positions:
                 excluded_count += 1
-                logger.debug(f"제외: row={row:02d}, col={col}")
                 continue
             
             # 설비 생성
@@ -352,7 +598,11 @@ def create_equipment_layout() -> List[EquipmentConfig]:
             configs.append(config)
     
     logger.info(f"✓ 설비 생성 완료: {created_count}대")
-    logger.debug(f"제외된 위치: {excluded_count}개")
+    # 위치별 로그 대신 요약 1줄 (DEBUG일 때만 목록 생성)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "제외된 위치: %d개 %s", excluded_count, sorted(excluded_positions)
+        )
     
     # 검증
     try:
@@ -372,17 +622,27 @@ def create_equipment_layout() -> List[EquipmentConfig]:
 
 def main():
     """메인 실행 함수"""
+    global publisher_task
+    
     logger.info("=" * 60)
     logger.info("SHERLOCK_SKY_3DSIM - 생산 시스템 시뮬레이터")
     logger.info("=" * 60)
     
-    # 비동기 이벤트 루프 생성
-    loop = asyncio.get_event_loop()
+    # 비동기 이벤트 루프 생성 (uvloop 설치 시 uvloop 사용)
+    # (import 시점이 아닌 실행 시에만 설치: 테스트 등에서 import해도 정책 변경 없음)
+    if _uvloop_available:
+        uvloop.install()
+        logger.info("✓ uvloop 이벤트 루프 사용")
+    # (uvloop 정책의 get_event_loop()는 루프가 없으면 생성하지 않고 예외 발생)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     
     # Redis 연결
     redis_connected = loop.run_until_complete(init_redis())
     
-    if not redis_connected:
+    if redis_connected:
+        publisher_task = loop.create_task(_publisher_worker())
+    else:
         logger.warning("Redis 연결 없이 시뮬레이션 진행 (데이터 발행 안됨)")
     
     # 시뮬레이터 생성
@@ -398,14 +658,19 @@ def main():
     logger.info("=" * 60)
     
     try:
-        simulator.run()  # 무한 실행
+        # SimPy는 워커 스레드에서 실행 (이벤트 루프는 그동안 발행 대기열 처리)
+        loop.run_until_complete(loop.run_in_executor(None, simulator.run))  # 무한 실행
     except KeyboardInterrupt:
         logger.info("\n시뮬레이션 종료 (사용자 중단)")
     except Exception as e:
         logger.error(f"시뮬레이션 오류: {e}", exc_info=True)
     finally:
+        simulator.stop()
+        loop.run_until_complete(loop.shutdown_default_executor())
+        # 발행 작업 종료 + 남은 대기열 발행 (SimPy 스레드 종료 후이므로 더 이상 적재 없음)
+        loop.run_until_complete(stop_publisher())
         if redis_client:
-            loop.run_until_complete(redis_client.close())
+            loop.run_until_complete(redis_client.aclose())
             logger.info("Redis 연결 종료")
 
 
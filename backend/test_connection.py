@@ -5,26 +5,75 @@
 - API 서버 확인
 """
 
+import importlib.util
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# DB/Redis 드라이버 (미설치 시 해당 테스트는 실패 처리)
+try:
+    import psycopg2
+    import psycopg2.pool
+    from psycopg2 import sql
+except ImportError:
+    psycopg2 = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# PostgreSQL 접속 정보
+PG_CONFIG = {
+    'host': 'localhost',
+    'port': 5432,
+    'database': 'sherlock_sky',
+    'user': 'postgres',
+    'password': 'password'
+}
+
+# PostgreSQL 연결 풀 (test_postgresql, test_tables가 같은 연결 재사용)
+# (테스트가 스레드에서 동시에 실행되므로 ThreadedConnectionPool + 생성 Lock)
+_pg_pool = None
+_pg_pool_lock = threading.Lock()
+
+
+def get_pg_pool():
+    """PostgreSQL 연결 풀 반환 (최초 호출 시 생성)"""
+    global _pg_pool
+    with _pg_pool_lock:
+        if _pg_pool is None:
+            _pg_pool = psycopg2.pool.ThreadedConnectionPool(1, 2, **PG_CONFIG)
+        return _pg_pool
+
+
+def close_pg_pool():
+    """PostgreSQL 연결 풀 종료"""
+    global _pg_pool
+    if _pg_pool is not None:
+        _pg_pool.closeall()
+        _pg_pool = None
+
 
 def test_postgresql():
     """PostgreSQL 연결 테스트"""
+    if psycopg2 is None:
+        print("✗ psycopg2 미설치 - PostgreSQL 연결 테스트 생략")
+        return False
+    
     try:
-        import psycopg2
-        conn = psycopg2.connect(
-            host='localhost',
-            port=5432,
-            database='sherlock_sky',
-            user='postgres',
-            password='password'
-        )
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
-        print(f"✓ PostgreSQL 연결 성공")
-        print(f"  버전: {version[:50]}...")
-        cursor.close()
-        conn.close()
+        pool = get_pg_pool()
+        conn = pool.getconn()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT version();")
+            version = cursor.fetchone()[0]
+            print(f"✓ PostgreSQL 연결 성공")
+            print(f"  버전: {version[:50]}...")
+            cursor.close()
+        finally:
+            pool.putconn(conn)
         return True
     except Exception as e:
         print(f"✗ PostgreSQL 연결 실패: {e}")
@@ -33,11 +82,17 @@ def test_postgresql():
 
 def test_redis():
     """Redis/Memurai 연결 테스트"""
+    if redis is None:
+        print("✗ redis 미설치 - Redis 연결 테스트 생략")
+        return False
+    
     try:
-        import redis
         r = redis.Redis(host='localhost', port=6379)
-        r.ping()
-        info = r.info('server')
+        # PING과 INFO를 pipeline으로 묶어 왕복 1회로 처리
+        pipe = r.pipeline(transaction=False)
+        pipe.ping()
+        pipe.info('server')
+        _, info = pipe.execute()
         print(f"✓ Redis 연결 성공")
         print(f"  버전: {info.get('redis_version', 'unknown')}")
         return True
@@ -48,36 +103,47 @@ def test_redis():
 
 def test_tables():
     """테이블 존재 확인"""
+    if psycopg2 is None:
+        print("✗ psycopg2 미설치 - 테이블 확인 생략")
+        return False
+    
     try:
-        import psycopg2
-        conn = psycopg2.connect(
-            host='localhost',
-            port=5432,
-            database='sherlock_sky',
-            user='postgres',
-            password='password'
-        )
-        cursor = conn.cursor()
-        
-        tables = ['equipment', 'equipment_status_ts', 'production_ts', 'alarms_ts']
-        
-        for table in tables:
-            cursor.execute(f"""
-                SELECT COUNT(*) 
+        pool = get_pg_pool()
+        conn = pool.getconn()
+        try:
+            cursor = conn.cursor()
+            
+            tables = ['equipment', 'equipment_status_ts', 'production_ts', 'alarms_ts']
+            
+            # 존재 여부는 전체 테이블을 쿼리 1회로 확인 (테이블 이름은 파라미터로 전달)
+            cursor.execute("""
+                SELECT DISTINCT table_name 
                 FROM information_schema.tables 
-                WHERE table_name = '{table}'
-            """)
-            exists = cursor.fetchone()[0] > 0
+                WHERE table_name = ANY(%s)
+            """, (tables,))
+            existing = {row[0] for row in cursor.fetchall()}
             
-            if exists:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                print(f"✓ 테이블 '{table}' 존재 (레코드: {count}개)")
-            else:
-                print(f"✗ 테이블 '{table}' 없음")
-        
-        cursor.close()
-        conn.close()
+            # 레코드 수는 존재하는 테이블만 UNION ALL로 묶어 쿼리 1회로 조회
+            # (테이블 이름은 sql.Identifier/Literal로 이스케이프)
+            counts = {}
+            if existing:
+                cursor.execute(sql.SQL(" UNION ALL ").join(
+                    sql.SQL("SELECT {}, COUNT(*) FROM {}").format(
+                        sql.Literal(table), sql.Identifier(table)
+                    )
+                    for table in tables if table in existing
+                ))
+                counts = dict(cursor.fetchall())
+            
+            for table in tables:
+                if table in existing:
+                    print(f"✓ 테이블 '{table}' 존재 (레코드: {counts[table]}개)")
+                else:
+                    print(f"✗ 테이블 '{table}' 없음")
+            
+            cursor.close()
+        finally:
+            pool.putconn(conn)
         return True
     except Exception as e:
         print(f"✗ 테이블 확인 실패: {e}")
@@ -114,18 +180,66 @@ def test_packages():
         'pydantic'
     ]
     
+    # 설치 여부만 확인 (import하지 않으므로 모듈 초기화 코드가 실행되지 않음,
+    #  실제 동작은 PostgreSQL/Redis/API 테스트에서 확인)
     all_installed = True
     for package in packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package} 설치됨")
-        except ImportError:
+        else:
             print(f"✗ {package} 미설치")
             all_installed = False
     
     return all_installed
 
 
+# 현재 스레드의 출력 버퍼 (stdout/stderr 공용, capture 중에만 존재)
+_capture_local = threading.local()
+
+
+class _ThreadLocalStream:
+    """스레드별 출력 버퍼로 보내는 스트림 (버퍼가 지정되지 않은 스레드는 원래 스트림으로 출력)"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return getattr(_capture_local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(_capture_local, 'buffer', self._stream).flush()
+    
+    def isatty(self):
+        # 모아서 출력하므로 색상 등 터미널 전용 출력은 사용하지 않음
+        return False
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _capture(func):
+    """
+    func 실행 중 현재 스레드의 stdout/stderr를 모아 (결과, 출력) 반환
+    
+    stderr도 같은 버퍼에 모으므로 logging 출력(lastResort 등)이 해당 테스트 섹션에 표시됩니다.
+    """
+    _capture_local.buffer = io.StringIO()
+    try:
+        return func(), _capture_local.buffer.getvalue()
+    finally:
+        del _capture_local.buffer
+
+
+# (제목, 요약 이름, 테스트 함수) - 서로 독립적이므로 동시에 실행
+CHECKS = [
+    ("[1] 필수 패키지 확인", "패키지", test_packages),
+    ("[2] PostgreSQL 연결 테스트", "PostgreSQL", test_postgresql),
+    ("[3] Redis 연결 테스트", "Redis", test_redis),
+    ("[4] 데이터베이스 테이블 확인", "테이블", test_tables),
+    ("[5] API 모듈 Import 테스트", "API 모듈", test_api_import),
+]
+
+
 def main():
     print("="*60)
     print("  SHERLOCK_SKY_3DSIM Backend 연결 테스트")
@@ -134,30 +248,25 @@ def main():
     
     results = []
     
-    print("[1] 필수 패키지 확인")
-    print("-"*60)
-    results.append(("패키지", test_packages()))
-    print()
-    
-    print("[2] PostgreSQL 연결 테스트")
-    print("-"*60)
-    results.append(("PostgreSQL", test_postgresql()))
-    print()
-    
-    print("[3] Redis 연결 테스트")
-    print("-"*60)
-    results.append(("Redis", test_redis()))
-    print()
-    
-    print("[4] 데이터베이스 테이블 확인")
-    print("-"*60)
-    results.append(("테이블", test_tables()))
-    print()
+    # 각 테스트 출력은 스레드별로 모았다가 원래 순서대로 출력
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadLocalStream(original_stdout)
+    sys.stderr = _ThreadLocalStream(original_stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+            futures = [executor.submit(_capture, func) for _, _, func in CHECKS]
+            
+            for (title, name, _), future in zip(CHECKS, futures):
+                result, output = future.result()
+                print(title)
+                print("-"*60)
+                print(output, end="")
+                print()
+                results.append((name, result))
+    finally:
+        sys.stdout, sys.stderr = original_stdout, original_stderr
     
-    print("[5] API 모듈 Import 테스트")
-    print("-"*60)
-    results.append(("API 모듈", test_api_import()))
-    print()
+    close_pg_pool()
     
     print("="*60)
     print("  테스트 결과 요약")
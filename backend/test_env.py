@@ -2,10 +2,12 @@
 환경 변수 설정 테스트 스크립트
 """
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
-# .env 로드
-load_dotenv()
+# .env 경로 (프로젝트 루트, find_dotenv의 상위 디렉토리 탐색 생략)
+ENV_FILE = Path(__file__).resolve().parent.parent / '.env'
+load_dotenv(dotenv_path=ENV_FILE, override=False)
 
 print("=" * 60)
 print("환경 변수 테스트")
@@ -3,8 +3,11 @@ pytest 설정 및 공통 픽스처
 """
 
 import pytest
+import asyncio
+import json
 import os
 import sys
+import zlib
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime, timedelta
@@ -27,17 +30,6 @@ os.environ['REDIS_PORT'] = '6379'
 # 데이터베이스 픽스처
 # ============================================================================
 
-@pytest.fixture
-def mock_db_connection():
-    """Mock 데이터베이스 연결"""
-    conn = MagicMock()
-    cursor = MagicMock()
-    conn.cursor.return_value = cursor
-    cursor.fetchone.return_value = None
-    cursor.fetchall.return_value = []
-    return conn
-
-
 @pytest.fixture
 def mock_cursor():
     """Mock 커서"""
@@ -47,6 +39,14 @@ def mock_cursor():
     return cursor
 
 
+@pytest.fixture
+def mock_db_connection(mock_cursor):
+    """Mock 데이터베이스 연결 (cursor()는 mock_cursor 반환)"""
+    conn = MagicMock()
+    conn.cursor.return_value = mock_cursor
+    return conn
+
+
 @pytest.fixture
 def sample_equipment_data():
     """샘플 설비 데이터"""
@@ -140,6 +140,82 @@ def simpy_env():
     return simpy.Environment()
 
 
+# ============================================================================
+# WebSocket 픽스처
+# ============================================================================
+
+class FakeWebSocket:
+    """
+    전송 프레임을 기록하는 WebSocket 대역
+    
+    Args:
+        send_delay: send_text/send_bytes 1회당 지연 (초) - 느린 클라이언트 재현
+    """
+    
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.frames = []              # 전송 완료 프레임 (str 또는 bytes)
+        self.active_sends = 0         # 진행 중인 전송 수
+        self.max_active_sends = 0     # 동시에 진행된 전송 수 최댓값
+        self.accepted = False
+        self.close_code = None
+    
+    async def accept(self):
+        self.accepted = True
+    
+    async def _send(self, frame):
+        self.active_sends += 1
+        self.max_active_sends = max(self.max_active_sends, self.active_sends)
+        try:
+            if self.send_delay:
+                await asyncio.sleep(self.send_delay)
+        finally:
+            self.active_sends -= 1
+        self.frames.append(frame)
+    
+    async def send_text(self, text: str):
+        await self._send(text)
+    
+    async def send_bytes(self, data: bytes):
+        await self._send(data)
+    
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.close_code = code
+    
+    def messages(self):
+        """수신 프레임을 개별 메시지 목록으로 변환 (zlib 해제, batch 펼침)"""
+        result = []
+        for frame in self.frames:
+            if isinstance(frame, bytes):
+                frame = zlib.decompress(frame).decode("utf-8")
+            message = json.loads(frame)
+            if message.get("type") == "batch":
+                result.extend(message["items"])
+            else:
+                result.append(message)
+        return result
+    
+    async def wait_for_frames(self, count: int, timeout: float = 2.0):
+        """프레임이 count개 이상 쌓일 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(self.frames) < count and loop.time() < deadline:
+            await asyncio.sleep(0.005)
+    
+    async def wait_for_messages(self, count: int, timeout: float = 2.0):
+        """batch를 펼친 메시지가 count개 이상 쌓일 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(self.messages()) < count and loop.time() < deadline:
+            await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+def make_websocket():
+    """FakeWebSocket 생성 함수"""
+    return FakeWebSocket
+
+
 # ============================================================================
 # 날짜/시간 픽스처
 # ============================================================================
@@ -11,10 +11,10 @@ from datetime import datetime, timedelta
 class TestAnalyticsAPI:
     """분석 API 단위 테스트"""
     
-    def test_calculate_oee_all_equipment(self, test_client, mock_db_connection):
+    def test_calculate_oee_all_equipment(self, test_client, mock_db_connection, mock_cursor):
         """전체 설비 OEE 계산"""
         # Mock 생산 데이터
-        mock_db_connection.cursor().fetchone.return_value = (
+        mock_cursor.fetchone.return_value = (
             1000,  # total_produced
             50,    # total_defects
             0.85   # avg_availability
@@ -28,9 +28,9 @@ class TestAnalyticsAPI:
         assert "oee" in data
         assert 0 <= data["oee"] <= 100
     
-    def test_calculate_oee_specific_equipment(self, test_client, mock_db_connection):
+    def test_calculate_oee_specific_equipment(self, test_client, mock_db_connection, mock_cursor):
         """특정 설비 OEE 계산"""
-        mock_db_connection.cursor().fetchone.return_value = (
+        mock_cursor.fetchone.return_value = (
             500,   # total_produced
             10,    # total_defects
             0.90   # avg_availability
@@ -47,9 +47,9 @@ class TestAnalyticsAPI:
         assert data["equipment_id"] == "EQ-01-01"
         assert "oee" in data
     
-    def test_calculate_mtbf_mttr(self, test_client, mock_db_connection):
+    def test_calculate_mtbf_mttr(self, test_client, mock_db_connection, mock_cursor):
         """MTBF/MTTR 계산"""
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             ("EQ-01-01", 150.5, 2.5, 0.984),  # equipment_id, mtbf, mttr, availability
             ("EQ-01-02", 145.0, 3.0, 0.980)
         ]
@@ -63,9 +63,9 @@ class TestAnalyticsAPI:
         assert len(data["equipment_reliability"]) == 2
         assert data["equipment_reliability"][0]["mtbf_hours"] == 150.5
     
-    def test_pareto_analysis_alarm(self, test_client, mock_db_connection):
+    def test_pareto_analysis_alarm(self, test_client, mock_db_connection, mock_cursor):
         """Pareto 분석 - 알람"""
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             ("TEMP_HIGH", 50),
             ("EQUIPMENT_DOWN", 30),
             ("PRESSURE_LOW", 15),
@@ -84,9 +84,9 @@ class TestAnalyticsAPI:
         assert len(data["items"]) == 4
         assert data["items"][0]["cumulative_percent"] <= 100
     
-    def test_trends_analysis(self, test_client, mock_db_connection):
+    def test_trends_analysis(self, test_client, mock_db_connection, mock_cursor):
         """트렌드 분석"""
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             (datetime.now() - timedelta(hours=i), 100 + i, 5)
             for i in range(24)
         ]
@@ -102,10 +102,9 @@ class TestAnalyticsAPI:
         assert "data_points" in data
         assert len(data["data_points"]) == 24
     
-    def test_dashboard_summary(self, test_client, mock_db_connection):
+    def test_dashboard_summary(self, test_client, mock_db_connection, mock_cursor):
         """대시보드 요약"""
         # Mock 여러 쿼리 결과
-        mock_cursor = mock_db_connection.cursor()
         mock_cursor.fetchone.side_effect = [
             (1000, 950, 50, 95.0),  # 생산 요약
             (100, 10, 5),           # 알람 요약
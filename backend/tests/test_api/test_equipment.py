@@ -7,14 +7,24 @@ from unittest.mock import patch, MagicMock
 from datetime import datetime
 
 
+# 26행 × 6열 그리드 Mock 데이터 (모듈 로드 시 1회 생성)
+_GRID_EXCLUDED = frozenset({(4, 4), (5, 5)})  # 샘플 제외
+_GRID_MOCK = tuple(
+    (f"EQ-{row:02d}-{col:02d}", row, col, "RUNNING")
+    for row in range(1, 27)
+    for col in range(1, 7)
+    if (row, col) not in _GRID_EXCLUDED
+)
+
+
 @pytest.mark.unit
 class TestEquipmentAPI:
     """설비 API 단위 테스트"""
     
-    def test_get_all_equipment_success(self, test_client, mock_db_connection):
+    def test_get_all_equipment_success(self, test_client, mock_db_connection, mock_cursor):
         """전체 설비 조회 성공"""
         # Mock 데이터 설정
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             ("EQ-01-01", 1, 1, "Type_A", "RUNNING"),
             ("EQ-01-02", 1, 2, "Type_B", "IDLE"),
         ]
@@ -28,9 +38,9 @@ class TestEquipmentAPI:
         assert len(data["equipment"]) == 2
         assert data["equipment"][0]["id"] == "EQ-01-01"
     
-    def test_get_equipment_by_id_success(self, test_client, mock_db_connection):
+    def test_get_equipment_by_id_success(self, test_client, mock_db_connection, mock_cursor):
         """특정 설비 조회 성공"""
-        mock_db_connection.cursor().fetchone.return_value = (
+        mock_cursor.fetchone.return_value = (
             "EQ-01-01", 1, 1, "Type_A", "RUNNING", datetime.now()
         )
         
@@ -43,9 +53,9 @@ class TestEquipmentAPI:
         assert data["row"] == 1
         assert data["col"] == 1
     
-    def test_get_equipment_by_id_not_found(self, test_client, mock_db_connection):
+    def test_get_equipment_by_id_not_found(self, test_client, mock_db_connection, mock_cursor):
         """존재하지 않는 설비 조회"""
-        mock_db_connection.cursor().fetchone.return_value = None
+        mock_cursor.fetchone.return_value = None
         
         with patch('api.database.connection.get_db_connection', return_value=mock_db_connection):
             response = test_client.get("/api/equipment/EQ-99-99")
@@ -62,17 +72,10 @@ class TestEquipmentAPI:
         data = response.json()
         assert "error" in data
     
-    def test_get_grid_layout_success(self, test_client, mock_db_connection):
+    def test_get_grid_layout_success(self, test_client, mock_db_connection, mock_cursor):
         """그리드 레이아웃 조회 성공"""
         # 26행 × 6열 그리드 테스트
-        mock_equipment = []
-        for row in range(1, 27):
-            for col in range(1, 7):
-                # 제외 위치가 아닌 경우만 추가
-                if not ((row, col) in [(4, 4), (5, 5)]):  # 샘플 제외
-                    mock_equipment.append((f"EQ-{row:02d}-{col:02d}", row, col, "RUNNING"))
-        
-        mock_db_connection.cursor().fetchall.return_value = mock_equipment
+        mock_cursor.fetchall.return_value = _GRID_MOCK
         
         with patch('api.database.connection.get_db_connection', return_value=mock_db_connection):
             response = test_client.get("/api/equipment/grid/layout")
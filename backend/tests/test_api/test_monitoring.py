@@ -64,9 +64,9 @@ class TestMonitoringAPI:
         assert len(data["equipment_status"]) == 1
         assert data["equipment_status"][0]["equipment_id"] == "EQ-01-01"
     
-    def test_get_alarms_success(self, test_client, mock_db_connection):
+    def test_get_alarms_success(self, test_client, mock_db_connection, mock_cursor):
         """알람 조회 성공"""
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             ("EQ-01-01", "TEMP_HIGH", "WARNING", "High temperature", "2024-01-01 10:00:00"),
             ("EQ-01-02", "EQUIPMENT_DOWN", "CRITICAL", "Equipment failure", "2024-01-01 11:00:00")
         ]
@@ -79,10 +79,10 @@ class TestMonitoringAPI:
         assert "alarms" in data
         assert len(data["alarms"]) == 2
     
-    def test_get_statistics_success(self, test_client, mock_db_connection, mock_redis):
+    def test_get_statistics_success(self, test_client, mock_db_connection, mock_cursor, mock_redis):
         """실시간 통계 조회 성공"""
         # Mock DB 데이터
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             (2, 0, 1),  # CRITICAL=2, WARNING=0, INFO=1
         ]
         
@@ -109,10 +109,10 @@ class TestMonitoringAPI:
         assert "equipment" in data
         assert "alarms" in data
     
-    def test_health_check_success(self, test_client, mock_db_connection, mock_redis):
+    def test_health_check_success(self, test_client, mock_db_connection, mock_cursor, mock_redis):
         """헬스체크 성공"""
         # Mock 성공 응답
-        mock_db_connection.cursor().fetchone.return_value = (1,)
+        mock_cursor.fetchone.return_value = (1,)
         mock_redis.ping = AsyncMock(return_value=True)
         
         with patch('api.database.connection.get_db_connection', return_value=mock_db_connection):
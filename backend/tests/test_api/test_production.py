@@ -10,9 +10,9 @@ from unittest.mock import patch
 class TestProductionAPI:
     """생산 API 단위 테스트"""
     
-    def test_get_production_summary(self, test_client, mock_db_connection):
+    def test_get_production_summary(self, test_client, mock_db_connection, mock_cursor):
         """생산 요약 조회"""
-        mock_db_connection.cursor().fetchone.return_value = (
+        mock_cursor.fetchone.return_value = (
             10,    # active_equipment
             1000,  # total_produced
             50     # total_defects
@@ -27,9 +27,9 @@ class TestProductionAPI:
         assert data["total_defects"] == 50
         assert "yield_rate_percent" in data
     
-    def test_get_production_by_equipment(self, test_client, mock_db_connection):
+    def test_get_production_by_equipment(self, test_client, mock_db_connection, mock_cursor):
         """설비별 생산량 조회"""
-        mock_db_connection.cursor().fetchall.return_value = [
+        mock_cursor.fetchall.return_value = [
             ("EQ-01-01", 100, 5),
             ("EQ-01-02", 95, 3)
         ]
@@ -41,7 +41,7 @@ class TestProductionAPI:
         data = response.json()
         assert len(data["equipment_production"]) == 2
     
-    def test_record_production_data(self, test_client, mock_db_connection):
+    def test_record_production_data(self, test_client, mock_db_connection, mock_cursor):
         """생산 데이터 기록"""
         production_data = {
             "equipment_id": "EQ-01-01",
@@ -51,7 +51,7 @@ class TestProductionAPI:
         }
         
         # Mock 설비 존재 확인
-        mock_db_connection.cursor().fetchone.return_value = (1,)
+        mock_cursor.fetchone.return_value = (1,)
         
         with patch('api.database.connection.get_db_connection', return_value=mock_db_connection):
             response = test_client.post(
@@ -0,0 +1,124 @@
+"""
+시뮬레이터 발행 대기열 테스트
+
+가짜 Redis pipeline으로 enqueue_data → _publisher_worker → publish 경로를 검증합니다.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from simulator import main as simulator_main
+
+
+class FakePipeline:
+    """publish/execute만 지원하는 Redis pipeline"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def publish(self, channel, message):
+        self.commands.append((channel, message))
+    
+    async def execute(self):
+        # 실제 왕복처럼 양보 (그 사이 적재된 메시지는 다음 batch로)
+        await asyncio.sleep(0.001)
+        self.redis.published.extend(self.commands)
+        self.redis.executes += 1
+
+
+class FakeRedis:
+    """발행 내역을 기록하는 Redis 클라이언트"""
+    
+    def __init__(self):
+        self.published = []
+        self.executes = 0
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def messages(self):
+        return [(channel, json.loads(message)) for channel, message in self.published]
+
+
+@pytest.fixture
+async def redis(monkeypatch):
+    """가짜 Redis로 발행 작업 시작 (테스트 종료 시 정리)"""
+    fake = FakeRedis()
+    monkeypatch.setattr(simulator_main, "redis_client", fake)
+    simulator_main.publish_queue.clear()
+    simulator_main.publisher_task = asyncio.create_task(simulator_main._publisher_worker())
+    yield fake
+    await simulator_main.stop_publisher()
+    simulator_main.publish_queue.clear()
+
+
+async def _wait_for_published(redis, count, timeout=1.0):
+    """count건 발행될 때까지 대기"""
+    async def _poll():
+        while len(redis.published) < count:
+            await asyncio.sleep(0.001)
+    await asyncio.wait_for(_poll(), timeout)
+
+
+@pytest.mark.unit
+class TestPublisher:
+    """발행 대기열 테스트"""
+    
+    async def test_enqueue_wakes_idle_worker(self, redis):
+        """대기 중인 worker는 적재 즉시 깨어나 발행"""
+        await asyncio.sleep(0.05)
+        assert redis.executes == 0
+        
+        simulator_main.enqueue_data({"type": "alarm", "equipment_id": "EQ-01-01"})
+        await _wait_for_published(redis, 1)
+        
+        assert redis.messages() == [
+            (b"simulator:alarm", {"type": "alarm", "equipment_id": "EQ-01-01"})
+        ]
+    
+    async def test_enqueue_from_worker_thread(self, redis):
+        """SimPy 스레드에서 적재해도 이벤트 루프의 worker가 깨어나 발행"""
+        await asyncio.sleep(0.05)
+        
+        await asyncio.to_thread(
+            simulator_main.enqueue_data, {"type": "production", "seq": 0}
+        )
+        await _wait_for_published(redis, 1)
+        
+        assert redis.messages()[0][0] == b"simulator:production"
+    
+    async def test_messages_published_in_batches(self, redis):
+        """PUBLISH_BATCH_SIZE 단위 pipeline으로 순서대로 발행"""
+        for seq in range(250):
+            simulator_main.enqueue_data({"type": "production", "seq": seq})
+        await _wait_for_published(redis, 250)
+        
+        assert [message["seq"] for _, message in redis.messages()] == list(range(250))
+        assert redis.executes == 3
+    
+    async def test_stop_publisher_drains_queue(self, redis):
+        """stop_publisher는 남은 대기열을 모두 발행한 뒤 종료"""
+        for seq in range(250):
+            simulator_main.enqueue_data({"type": "equipment_snapshot", "seq": seq})
+        await simulator_main.stop_publisher()
+        
+        assert simulator_main.publisher_task is None
+        assert len(redis.published) == 250
+        assert not simulator_main.publish_queue
+    
+    async def test_enqueue_without_publisher_is_ignored(self, redis):
+        """발행 작업이 없으면 적재하지 않음"""
+        await simulator_main.stop_publisher()
+        
+        simulator_main.enqueue_data({"type": "alarm"})
+        
+        assert not simulator_main.publish_queue
@@ -122,7 +122,8 @@ class TestProductionSimulator:
             cycle_time=10.0
         )
         
-        simulator = ProductionSimulator([config])
+        # 실시간 대기 없이 실행
+        simulator = ProductionSimulator([config], realtime_factor=None)
         
         # 1시간 시뮬레이션
         simulator.run(duration_hours=1.0)
@@ -0,0 +1,212 @@
+"""
+Health Stream WebSocket 테스트
+
+FakeWebSocket과 가짜 SiteHealthService로 송신 큐와 브로드캐스트 메시지 타입을 검증합니다.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.websocket import health_stream
+from api.websocket.health_stream import HealthMessageType, HealthStreamManager
+
+
+def _health(*statuses):
+    """Site 상태 목록으로 Health 응답 생성"""
+    return {
+        "sites": [
+            {"site_id": f"SITE_{index}", "status": status, "display_name": f"Site {index}"}
+            for index, status in enumerate(statuses)
+        ]
+    }
+
+
+@pytest.fixture
+async def manager():
+    """가짜 Health 서비스를 사용하는 관리자 (테스트 종료 시 연결 정리)"""
+    stream_manager = HealthStreamManager()
+    service = MagicMock()
+    service.check_all_sites_health = AsyncMock(return_value=_health("healthy", "healthy"))
+    stream_manager._health_service = service
+    yield stream_manager
+    for websocket in list(stream_manager.active_connections):
+        stream_manager.disconnect(websocket)
+
+
+def _set_health(stream_manager, health):
+    """다음 조회 결과 변경 (HEALTH_CACHE_TTL 캐시 무효화)"""
+    stream_manager._health_service.check_all_sites_health.return_value = health
+    stream_manager._cached_health = None
+
+
+async def _connect(stream_manager, websocket):
+    """연결 후 initial 메시지 수신까지 대기"""
+    await stream_manager.connect(websocket)
+    await websocket.wait_for_frames(1)
+    assert json.loads(websocket.frames[0])["type"] == HealthMessageType.INITIAL
+
+
+@pytest.mark.unit
+class TestHealthWriter:
+    """클라이언트별 송신 큐 테스트"""
+    
+    async def test_queued_messages_sent_as_batch(self, manager, make_websocket):
+        """대기 중인 여러 메시지는 batch 한 프레임으로 순서대로 전송"""
+        ws = make_websocket()
+        await _connect(manager, ws)
+        
+        for seq in range(3):
+            await manager.broadcast({"type": "test", "seq": seq})
+        await ws.wait_for_frames(2)
+        
+        assert len(ws.frames) == 2
+        frame = json.loads(ws.frames[1])
+        assert frame["type"] == HealthMessageType.BATCH
+        assert [item["seq"] for item in frame["items"]] == [0, 1, 2]
+    
+    async def test_queue_overflow_disconnects(self, manager, make_websocket, monkeypatch):
+        """송신 큐가 가득 찬 느린 클라이언트는 연결 해제"""
+        monkeypatch.setattr(health_stream, "OUTBOUND_QUEUE_SIZE", 2)
+        ws = make_websocket(send_delay=1.0)
+        await manager.connect(ws)
+        
+        for seq in range(5):
+            await manager.broadcast({"type": "test", "seq": seq})
+        
+        assert ws not in manager.active_connections
+        assert ws not in manager._queues
+    
+    async def test_send_timeout_disconnects(self, manager, make_websocket, monkeypatch):
+        """SEND_TIMEOUT 초과 시 연결 해제"""
+        monkeypatch.setattr(health_stream, "SEND_TIMEOUT", 0.05)
+        ws = make_websocket(send_delay=1.0)
+        await manager.connect(ws)
+        await asyncio.sleep(0.2)
+        
+        assert ws not in manager.active_connections
+
+
+@pytest.mark.unit
+class TestHealthBroadcast:
+    """Health 브로드캐스트 메시지 타입 테스트"""
+    
+    async def test_unchanged_health_sends_heartbeat(self, manager, make_websocket):
+        """변경이 없으면 전체 상태 대신 heartbeat 전송"""
+        ws = make_websocket()
+        await _connect(manager, ws)
+        
+        await manager.broadcast_health_update()
+        _set_health(manager, _health("healthy", "healthy"))
+        await manager.broadcast_health_update()
+        await ws.wait_for_messages(3)
+        
+        messages = ws.messages()[1:]
+        assert [message["type"] for message in messages] == [
+            HealthMessageType.UPDATE, HealthMessageType.HEARTBEAT
+        ]
+        assert "data" not in messages[1]
+    
+    async def test_full_update_after_interval(self, manager, make_websocket, monkeypatch):
+        """FULL_UPDATE_INTERVAL이 지나면 변경이 없어도 update 전송"""
+        monkeypatch.setattr(health_stream, "FULL_UPDATE_INTERVAL", 0)
+        ws = make_websocket()
+        await _connect(manager, ws)
+        
+        await manager.broadcast_health_update()
+        _set_health(manager, _health("healthy", "healthy"))
+        await manager.broadcast_health_update()
+        await ws.wait_for_messages(3)
+        
+        assert [message["type"] for message in ws.messages()[1:]] == [
+            HealthMessageType.UPDATE, HealthMessageType.UPDATE
+        ]
+    
+    async def test_single_change_sends_site_change(self, manager, make_websocket):
+        """Site 1개 변경은 site_change (data: 객체)"""
+        ws = make_websocket()
+        await _connect(manager, ws)
+        
+        await manager.broadcast_health_update()
+        _set_health(manager, _health("unhealthy", "healthy"))
+        await manager.broadcast_health_update()
+        await ws.wait_for_messages(4)
+        
+        messages = ws.messages()[1:]
+        assert [message["type"] for message in messages] == [
+            HealthMessageType.UPDATE, HealthMessageType.SITE_CHANGE, HealthMessageType.UPDATE
+        ]
+        assert messages[1]["data"]["site_id"] == "SITE_0"
+        assert messages[1]["data"]["previous_status"] == "healthy"
+        assert messages[1]["data"]["current_status"] == "unhealthy"
+    
+    async def test_multiple_changes_send_site_changes(self, manager, make_websocket):
+        """여러 Site 동시 변경은 site_changes 1회 (data: 배열)"""
+        ws = make_websocket()
+        await _connect(manager, ws)
+        
+        await manager.broadcast_health_update()
+        _set_health(manager, _health("unhealthy", "unhealthy"))
+        await manager.broadcast_health_update()
+        await ws.wait_for_messages(4)
+        
+        messages = ws.messages()[1:]
+        assert [message["type"] for message in messages] == [
+            HealthMessageType.UPDATE, HealthMessageType.SITE_CHANGES, HealthMessageType.UPDATE
+        ]
+        assert [change["site_id"] for change in messages[1]["data"]] == ["SITE_0", "SITE_1"]
+        assert messages[1]["timestamp"] == messages[2]["timestamp"]
+
+
+@pytest.mark.unit
+class TestHealthConnect:
+    """연결 시 전체 상태 전송 테스트"""
+    
+    async def test_initial_not_preceded_by_concurrent_broadcast(self, manager, make_websocket):
+        """Health 조회 중 연결한 클라이언트는 최신 상태의 initial을 가장 먼저 수신"""
+        ws = make_websocket()
+        await _connect(manager, ws)
+        await manager.broadcast_health_update()
+        
+        # 브로드캐스트의 Health 조회가 끝나기 전에 새 클라이언트 연결
+        gate = asyncio.Event()
+        
+        async def slow_health():
+            await gate.wait()
+            return _health("unhealthy", "healthy")
+        
+        manager._health_service.check_all_sites_health.side_effect = slow_health
+        manager._cached_health = None
+        broadcast_task = asyncio.create_task(manager.broadcast_health_update())
+        await asyncio.sleep(0)
+        joined = make_websocket()
+        connect_task = asyncio.create_task(manager.connect(joined))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(broadcast_task, connect_task)
+        await joined.wait_for_frames(1)
+        
+        messages = joined.messages()
+        assert messages[0]["type"] == HealthMessageType.INITIAL
+        assert messages[0]["data"]["sites"][0]["status"] == "unhealthy"
+    
+    async def test_failed_initial_forces_full_update(self, manager, make_websocket):
+        """initial 전송에 실패한 클라이언트가 있으면 변경이 없어도 다음 주기에 update 전송"""
+        await manager.broadcast_health_update()
+        
+        service = manager._health_service.check_all_sites_health
+        service.side_effect = RuntimeError("DB 연결 실패")
+        manager._cached_health = None
+        ws = make_websocket()
+        await manager.connect(ws)
+        await ws.wait_for_frames(1)
+        assert json.loads(ws.frames[0])["type"] == HealthMessageType.ERROR
+        
+        service.side_effect = None
+        _set_health(manager, _health("healthy", "healthy"))
+        await manager.broadcast_health_update()
+        await ws.wait_for_messages(2)
+        
+        assert ws.messages()[1]["type"] == HealthMessageType.UPDATE
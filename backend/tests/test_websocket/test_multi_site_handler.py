@@ -0,0 +1,321 @@
+"""
+Multi-Site WebSocket 핸들러 테스트
+
+FakeWebSocket으로 송신 큐/프레임 병합/압축/설비 필터 동작을 검증합니다.
+"""
+
+import asyncio
+import json
+import zlib
+
+import pytest
+
+from api.websocket import multi_site_handler
+from api.websocket.multi_site_handler import (
+    FLUSH_DELAY,
+    MultiSiteWebSocketHandler,
+    SubscriptionType,
+)
+
+
+SITE_ID = "TEST_SITE"
+
+
+@pytest.fixture
+async def handler():
+    """테스트 종료 시 남은 클라이언트(송신 태스크)를 정리하는 핸들러"""
+    ws_handler = MultiSiteWebSocketHandler()
+    yield ws_handler
+    for client in list(ws_handler._clients.values()):
+        await ws_handler.disconnect(client)
+
+
+async def _settle():
+    """대기 중인 flush가 끝날 때까지 양보"""
+    await asyncio.sleep(FLUSH_DELAY * 5)
+
+
+def _render_items(items):
+    """테스트용 항목 프레임 직렬화"""
+    return json.dumps({"type": "delta", "data": {"updates": items}})
+
+
+@pytest.mark.unit
+class TestOutboundQueue:
+    """클라이언트별 송신 큐 테스트"""
+    
+    async def test_messages_coalesced_into_one_batch_frame(self, handler, make_websocket):
+        """FLUSH_DELAY 안에 쌓인 메시지는 batch 한 프레임으로 전송"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        for seq in range(3):
+            assert await handler.send_to_client(client, {"type": "test", "seq": seq})
+        
+        await ws.wait_for_frames(1)
+        await _settle()
+        
+        assert ws.accepted
+        assert len(ws.frames) == 1
+        frame = json.loads(ws.frames[0])
+        assert frame["type"] == "batch"
+        assert [item["seq"] for item in frame["items"]] == [0, 1, 2]
+        assert client.message_count == 3
+    
+    async def test_single_message_sent_unwrapped(self, handler, make_websocket):
+        """메시지가 1개면 batch로 감싸지 않음"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        await handler.send_to_client(client, {"type": "test", "seq": 0})
+        await ws.wait_for_frames(1)
+        
+        assert json.loads(ws.frames[0]) == {"type": "test", "seq": 0}
+    
+    async def test_slow_client_receives_in_order_without_concurrent_sends(
+        self, handler, make_websocket
+    ):
+        """느린 클라이언트도 순서대로 수신하며 소켓당 동시 전송은 1개"""
+        ws = make_websocket(send_delay=FLUSH_DELAY * 2)
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        for seq in range(20):
+            await handler.send_to_client(client, {"type": "test", "seq": seq})
+            await asyncio.sleep(FLUSH_DELAY / 2)
+        
+        await ws.wait_for_messages(20)
+        
+        assert [message["seq"] for message in ws.messages()] == list(range(20))
+        assert len(ws.frames) > 1
+        assert ws.max_active_sends == 1
+    
+    async def test_queue_overflow_drops_client(self, handler, make_websocket, monkeypatch):
+        """송신 큐가 가득 차면 연결 제거 후 1011로 종료"""
+        monkeypatch.setattr(multi_site_handler, "OUTBOUND_QUEUE_SIZE", 3)
+        ws = make_websocket(send_delay=1.0)
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        results = [
+            await handler.send_to_client(client, {"type": "test", "seq": seq})
+            for seq in range(5)
+        ]
+        await _settle()
+        
+        assert results[:3] == [True, True, True]
+        assert results[3] is False
+        assert client.client_id not in handler._clients
+        assert ws.close_code == 1011
+        assert not await handler.send_to_client(client, {"type": "test"})
+    
+    async def test_send_timeout_drops_client(self, handler, make_websocket, monkeypatch):
+        """SEND_TIMEOUT 초과 시 연결 제거"""
+        monkeypatch.setattr(multi_site_handler, "SEND_TIMEOUT", 0.05)
+        ws = make_websocket(send_delay=1.0)
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        await handler.send_to_client(client, {"type": "test"})
+        await asyncio.sleep(FLUSH_DELAY + 0.2)
+        
+        assert client.client_id not in handler._clients
+        assert ws.close_code == 1011
+        assert ws.frames == []
+
+
+@pytest.mark.unit
+class TestCompression:
+    """압축 프레임 테스트"""
+    
+    async def test_large_frame_round_trips_through_zlib(self, handler, make_websocket):
+        """COMPRESS_MIN_SIZE 이상 프레임은 zlib 바이너리로 전송"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL, compress=True)
+        
+        payload = {"type": "test", "data": "x" * (multi_site_handler.COMPRESS_MIN_SIZE * 2)}
+        await handler.send_to_client(client, payload)
+        await ws.wait_for_frames(1)
+        
+        assert isinstance(ws.frames[0], bytes)
+        assert json.loads(zlib.decompress(ws.frames[0]).decode("utf-8")) == payload
+    
+    async def test_small_frame_stays_text(self, handler, make_websocket):
+        """작은 프레임은 압축 opt-in이어도 텍스트로 전송"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL, compress=True)
+        
+        await handler.send_to_client(client, {"type": "test"})
+        await ws.wait_for_frames(1)
+        
+        assert isinstance(ws.frames[0], str)
+    
+    async def test_uncompressed_client_gets_text(self, handler, make_websocket):
+        """압축 미사용 클라이언트는 큰 프레임도 텍스트로 수신"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        await handler.send_to_client(
+            client, {"type": "test", "data": "x" * (multi_site_handler.COMPRESS_MIN_SIZE * 2)}
+        )
+        await ws.wait_for_frames(1)
+        
+        assert isinstance(ws.frames[0], str)
+
+
+@pytest.mark.unit
+class TestBroadcastItems:
+    """설비 필터 기반 브로드캐스트 테스트"""
+    
+    async def test_filter_slicing(self, handler, make_websocket):
+        """필터별로 자신의 설비 항목만 수신, 해당 항목이 없으면 미전송"""
+        sockets = {name: make_websocket() for name in ("all", "one", "both", "none")}
+        clients = {
+            name: await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+            for name, ws in sockets.items()
+        }
+        clients["one"].equipment_filter = frozenset({1})
+        clients["both"].equipment_filter = frozenset({1, 2})
+        clients["none"].equipment_filter = frozenset({99})
+        
+        items = [(1, {"equipment_id": 1}), (2, {"equipment_id": 2})]
+        text = _render_items([item for _, item in items])
+        
+        sent = await handler.broadcast_items_to_room(
+            SITE_ID, text, items, _render_items, SubscriptionType.FULL
+        )
+        await sockets["all"].wait_for_frames(1)
+        await _settle()
+        
+        assert sent == 3
+        assert sockets["all"].frames == [text]
+        assert sockets["both"].frames == [text]
+        assert json.loads(sockets["one"].frames[0])["data"]["updates"] == [{"equipment_id": 1}]
+        assert sockets["none"].frames == []
+    
+    async def test_subscription_type_filter(self, handler, make_websocket):
+        """지정한 구독 타입 클라이언트에만 전송"""
+        full_ws = make_websocket()
+        summary_ws = make_websocket()
+        await handler.connect(full_ws, SITE_ID, SubscriptionType.FULL)
+        await handler.connect(summary_ws, SITE_ID, SubscriptionType.SUMMARY)
+        
+        items = [(1, {"equipment_id": 1})]
+        text = _render_items([{"equipment_id": 1}])
+        
+        sent = await handler.broadcast_items_to_room(
+            SITE_ID, text, items, _render_items, SubscriptionType.FULL
+        )
+        await full_ws.wait_for_frames(1)
+        await _settle()
+        
+        assert sent == 1
+        assert full_ws.frames == [text]
+        assert summary_ws.frames == []
+    
+    async def test_unknown_room_sends_nothing(self, handler):
+        """Room이 없으면 0 반환"""
+        sent = await handler.broadcast_items_to_room(
+            "UNKNOWN", "{}", [], _render_items
+        )
+        assert sent == 0
+
+
+@pytest.mark.unit
+class TestEquipmentFilter:
+    """set_equipment_filter 메시지 테스트"""
+    
+    async def _set_filter(self, handler, client, equipment_ids):
+        await handler.handle_message(
+            client, json.dumps({"type": "set_equipment_filter", "equipment_ids": equipment_ids})
+        )
+    
+    async def test_valid_ids_set_filter(self, handler, make_websocket):
+        """정수 목록이면 필터 설정 후 equipment_filter_set 응답"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        
+        await self._set_filter(handler, client, [1, 2, 2])
+        await ws.wait_for_frames(1)
+        
+        assert client.equipment_filter == frozenset({1, 2})
+        reply = json.loads(ws.frames[0])
+        assert reply["type"] == "equipment_filter_set"
+        assert reply["equipment_count"] == 2
+    
+    async def test_null_clears_filter(self, handler, make_websocket):
+        """null이면 필터 해제 (equipment_count: null)"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        client.equipment_filter = frozenset({1})
+        
+        await self._set_filter(handler, client, None)
+        await ws.wait_for_frames(1)
+        
+        assert client.equipment_filter is None
+        assert json.loads(ws.frames[0])["equipment_count"] is None
+    
+    @pytest.mark.parametrize("equipment_ids", [
+        "1,2",
+        [1, "2"],
+        [1, True],
+        [1.5],
+        {"id": 1},
+    ])
+    async def test_invalid_ids_ignored(self, handler, make_websocket, equipment_ids):
+        """잘못된 equipment_ids는 무시 (필터 유지, 응답 없음)"""
+        ws = make_websocket()
+        client = await handler.connect(ws, SITE_ID, SubscriptionType.FULL)
+        client.equipment_filter = frozenset({1})
+        
+        await self._set_filter(handler, client, equipment_ids)
+        await _settle()
+        
+        assert client.equipment_filter == frozenset({1})
+        assert ws.frames == []
+    
+    async def test_delta_filtered_by_equipment(self, handler, make_websocket):
+        """Delta는 필터에 해당하는 설비만 전송, 일치하는 설비가 없으면 미전송"""
+        from api.websocket.summary_stream import EquipmentDelta, SummaryStreamService
+        
+        service = SummaryStreamService(ws_handler=handler)
+        matching_ws = make_websocket()
+        other_ws = make_websocket()
+        matching = await handler.connect(matching_ws, SITE_ID, SubscriptionType.FULL)
+        other = await handler.connect(other_ws, SITE_ID, SubscriptionType.FULL)
+        await self._set_filter(handler, matching, [2])
+        await self._set_filter(handler, other, [99])
+        await matching_ws.wait_for_frames(1)
+        await other_ws.wait_for_frames(1)
+        
+        await service._send_deltas(SITE_ID, [
+            EquipmentDelta(frontend_id="EQ-01-01", equipment_id=1, changes={"status": "RUN"}),
+            EquipmentDelta(frontend_id="EQ-01-02", equipment_id=2, changes={"status": "DOWN"}),
+        ])
+        await matching_ws.wait_for_frames(2)
+        await _settle()
+        
+        delta = json.loads(matching_ws.frames[1])
+        assert delta["type"] == "delta"
+        assert [update["equipment_id"] for update in delta["data"]["updates"]] == [2]
+        assert len(other_ws.frames) == 1
+        assert json.loads(other_ws.frames[0])["type"] == "equipment_filter_set"
+
+
+@pytest.mark.unit
+class TestRoomStats:
+    """Room 통계 테스트"""
+    
+    async def test_room_dict_cached_until_membership_changes(self, handler, make_websocket):
+        """클라이언트 구성이 같으면 같은 dict, 추가/제거 시 다시 생성"""
+        first = await handler.connect(make_websocket(), SITE_ID, SubscriptionType.SUMMARY)
+        
+        stats = handler.get_room_stats(SITE_ID)
+        assert handler.get_stats()["rooms"][SITE_ID] is stats
+        assert stats["summary_clients"] == 1
+        
+        await handler.connect(make_websocket(), SITE_ID, SubscriptionType.FULL)
+        updated = handler.get_room_stats(SITE_ID)
+        assert updated is not stats
+        assert (updated["summary_clients"], updated["full_clients"]) == (1, 1)
+        
+        await handler.disconnect(first)
+        assert handler.get_room_stats(SITE_ID)["total_clients"] == 1
+        assert handler.get_stats()["total_clients"] == 1
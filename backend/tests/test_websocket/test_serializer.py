@@ -0,0 +1,72 @@
+"""
+WebSocket 직렬화 테스트
+
+orjson 경로와 json 폴백 경로가 같은 입력에 같은 JSON을 만드는지 검증합니다.
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from api.websocket import serializer
+from api.websocket.serializer import dumps_text, loads_text
+
+
+PAYLOAD = {
+    "type": "delta",
+    "float32": np.float32(1.5),
+    "float64": np.float64(2.25),
+    "int64": np.int64(7),
+    "bool": np.bool_(True),
+    "array": np.array([1, 2, 3]),
+    1: "int key",
+    "timestamp": datetime(2026, 10, 17, 1, 2, 3, 456, tzinfo=timezone.utc),
+    "date": date(2026, 10, 17),
+    "decimal": Decimal("1.10"),
+    "name": "설비",
+}
+
+
+@pytest.mark.unit
+class TestDumpsText:
+    """dumps_text 출력 테스트"""
+    
+    def _fallback(self, monkeypatch, message):
+        monkeypatch.setattr(serializer, "_orjson_available", False)
+        return dumps_text(message)
+    
+    def test_fallback_output(self, monkeypatch):
+        """json 폴백: numpy는 숫자/배열, int 키는 문자열 키, datetime은 ISO 8601"""
+        text = self._fallback(monkeypatch, PAYLOAD)
+        
+        assert json.loads(text) == {
+            "type": "delta",
+            "float32": 1.5,
+            "float64": 2.25,
+            "int64": 7,
+            "bool": True,
+            "array": [1, 2, 3],
+            "1": "int key",
+            "timestamp": "2026-10-17T01:02:03.000456+00:00",
+            "date": "2026-10-17",
+            "decimal": "1.10",
+            "name": "설비",
+        }
+        assert "설비" in text
+        assert ", " not in text
+    
+    def test_orjson_matches_fallback(self, monkeypatch):
+        """orjson 설치 여부와 무관하게 같은 문자열"""
+        if not serializer._orjson_available:
+            pytest.skip("orjson 미설치")
+        
+        fast = dumps_text(PAYLOAD)
+        
+        assert fast == self._fallback(monkeypatch, PAYLOAD)
+    
+    def test_round_trip(self):
+        """loads_text로 다시 파싱"""
+        assert loads_text(dumps_text({"type": "ping", "value": 1})) == {"type": "ping", "value": 1}
@@ -3,7 +3,7 @@
  * =======================
  * Multi-Site WebSocket 연결 풀 관리자
  * 
- * @version 1.1.0
+ * @version 1.3.0
  * @description
  * - Site별 독립적 WebSocket 인스턴스 관리
  * - Mode별 연결 상태 전환 (Dashboard/Monitoring/Analysis)
@@ -12,6 +12,11 @@
  * - 🆕 Analysis Mode WebSocket 완전 중단 (대역폭 100% 절감)
  * 
  * @changelog
+ * - v1.3.0 (2026-10-17): 압축 프레임 지원
+ *           - DecompressionStream 지원 브라우저는 ?compress=1로 연결
+ *           - 바이너리(zlib) 프레임은 압축 해제 후 처리, Site별 수신 순서 유지
+ * - v1.2.0 (2026-10-17): batch 메시지 지원
+ *           - _handleMessage(): {type: 'batch', items: [...]} 프레임을 개별 메시지로 분리
  * - v1.1.0 (2026-02-04): Analysis Mode WebSocket PAUSE 완성
  *           - _pauseConnection(): 실제 WebSocket 연결 종료
  *           - _handleMessage(): PAUSED 상태 체크 추가
@@ -35,7 +40,7 @@
  * 
  * 📁 위치: frontend/threejs_viewer/src/connection/WebSocketPoolManager.js
  * 작성일: 2026-02-04
- * 수정일: 2026-02-04
+ * 수정일: 2026-10-17
  */
 
 import { ConnectionState, ConnectionStateMachine } from './ConnectionState.js';
@@ -191,9 +196,15 @@ export class WebSocketPoolManager {
      * @param {string} options.baseUrl - WebSocket 서버 기본 URL
      * @param {string[]} [options.sites=[]] - 관리할 Site ID 목록
      * @param {boolean} [options.autoConnect=false] - 자동 연결 여부
+     * @param {boolean} [options.compress] - 압축 프레임 수신 (기본값: DecompressionStream 지원 여부)
      */
     constructor(options = {}) {
-        const { baseUrl, sites = [], autoConnect = false } = options;
+        const {
+            baseUrl,
+            sites = [],
+            autoConnect = false,
+            compress = typeof DecompressionStream !== 'undefined'
+        } = options;
         
         if (!baseUrl) {
             throw new Error('baseUrl is required');
@@ -235,6 +246,18 @@ export class WebSocketPoolManager {
          */
         this._messageProcessingEnabled = true;
         
+        /**
+         * 🆕 v1.3.0: 압축 프레임 수신 여부 (서버에 ?compress=1 전달)
+         * @type {boolean}
+         */
+        this._compress = compress;
+        
+        /**
+         * 🆕 v1.3.0: Site별 압축 해제 대기 체인 (수신 순서 유지)
+         * @type {Map<string, Promise>}
+         */
+        this._decodeChains = new Map();
+        
         // Site 등록
         for (const siteId of sites) {
             this._tracker.register(siteId);
@@ -588,7 +611,7 @@ export class WebSocketPoolManager {
         info.transitionTo(ConnectionState.CONNECTING);
         
         const endpoint = CONFIG.ENDPOINTS.SITE_SUMMARY(siteId);
-        const url = `${this._baseUrl}${endpoint}?interval=${interval}`;
+        const url = this._buildUrl(endpoint, interval);
         
         try {
             const ws = await this._createWebSocket(url, siteId, 'summary');
@@ -631,7 +654,7 @@ export class WebSocketPoolManager {
         info.transitionTo(ConnectionState.CONNECTING);
         
         const endpoint = CONFIG.ENDPOINTS.SITE_FULL(siteId);
-        const url = `${this._baseUrl}${endpoint}?interval=${interval}`;
+        const url = this._buildUrl(endpoint, interval);
         
         try {
             const ws = await this._createWebSocket(url, siteId, 'full');
@@ -654,6 +677,18 @@ export class WebSocketPoolManager {
         }
     }
     
+    /**
+     * 🆕 v1.3.0: WebSocket URL 생성
+     * @private
+     * @param {string} endpoint
+     * @param {number} interval
+     * @returns {string}
+     */
+    _buildUrl(endpoint, interval) {
+        const compress = this._compress ? '&compress=1' : '';
+        return `${this._baseUrl}${endpoint}?interval=${interval}${compress}`;
+    }
+    
     /**
      * WebSocket 생성 및 연결
      * @private
@@ -666,6 +701,7 @@ export class WebSocketPoolManager {
         return new Promise((resolve, reject) => {
             const startTime = Date.now();
             const ws = new WebSocket(url);
+            ws.binaryType = 'arraybuffer';  // 🆕 v1.3.0: 압축 프레임
             
             // 타임아웃 설정
             const timeout = setTimeout(() => {
@@ -811,19 +847,68 @@ export class WebSocketPoolManager {
             conn.recordMessage();
         }
         
+        // 🆕 v1.3.0: 압축 프레임이 있거나 해제 대기 중이면 순서 유지를 위해 체인에 연결
+        const pending = this._decodeChains.get(siteId);
+        if (event.data instanceof ArrayBuffer || pending) {
+            const next = (pending || Promise.resolve())
+                .then(() => (typeof event.data === 'string'
+                    ? event.data
+                    : this._inflate(event.data)))
+                .then((text) => this._dispatchText(siteId, text))
+                .catch((error) => {
+                    console.error(`❌ [${siteId}] 압축 해제 에러:`, error);
+                })
+                .finally(() => {
+                    if (this._decodeChains.get(siteId) === next) {
+                        this._decodeChains.delete(siteId);
+                    }
+                });
+            this._decodeChains.set(siteId, next);
+            return;
+        }
+        
+        this._dispatchText(siteId, event.data);
+    }
+    
+    /**
+     * 🆕 v1.3.0: zlib 압축 프레임 해제
+     * @private
+     * @param {ArrayBuffer} buffer
+     * @returns {Promise<string>}
+     */
+    _inflate(buffer) {
+        const stream = new Blob([buffer]).stream()
+            .pipeThrough(new DecompressionStream('deflate'));
+        return new Response(stream).text();
+    }
+    
+    /**
+     * 🆕 v1.3.0: JSON 텍스트 프레임 처리 (batch 분리 + 이벤트 발행)
+     * @private
+     * @param {string} siteId
+     * @param {string} text
+     */
+    _dispatchText(siteId, text) {
         try {
-            const data = JSON.parse(event.data);
+            const parsed = JSON.parse(text);
             
-            // 이벤트 발행
-            this._emitEvent('message', {
-                siteId,
-                type: data.type,
-                data
-            });
+            // 🆕 v1.2.0: 서버가 한 프레임으로 묶어 보낸 batch 메시지는 개별 메시지로 분리
+            const messages = (parsed.type === 'batch' && Array.isArray(parsed.items))
+                ? parsed.items
+                : [parsed];
             
-            // EventBus를 통한 글로벌 이벤트
-            eventBus.emit(`websocket:message:${siteId}`, data);
-            eventBus.emit('websocket:message', { siteId, data });
+            for (const data of messages) {
+                // 이벤트 발행
+                this._emitEvent('message', {
+                    siteId,
+                    type: data.type,
+                    data
+                });
+                
+                // EventBus를 통한 글로벌 이벤트
+                eventBus.emit(`websocket:message:${siteId}`, data);
+                eventBus.emit('websocket:message', { siteId, data });
+            }
             
         } catch (error) {
             console.error(`❌ [${siteId}] 메시지 파싱 에러:`, error);